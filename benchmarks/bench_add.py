@@ -0,0 +1,51 @@
+"""
+CsvTransactionRepository.add のレイテンシ計測
+
+既存の件数に関わらず1件あたりの追記時間が一定であることを確認する
+
+    uv run benchmarks/bench_add.py
+"""
+
+import sys
+import tempfile
+import time
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic import write_journal_csv
+
+from bookkeeper.domain.entity.transaction import Transaction
+from bookkeeper.infrastructure.repository.csv_transaction_repository import (
+    CsvTransactionRepository,
+)
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+REPEAT = 50
+
+
+def main() -> None:
+    transaction = Transaction(
+        date=date(2025, 1, 1),
+        debit_account="消耗品費",
+        debit_amount=Decimal("1500"),
+        credit_account="現金",
+        credit_amount=Decimal("1500"),
+        description="ベンチマーク",
+    )
+    print(f"{'件数':>10} {'add平均(ms)':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in SIZES:
+            path = write_journal_csv(Path(tmp) / f"journal_{rows}.csv", rows)
+            repository = CsvTransactionRepository(path)
+            started = time.perf_counter()
+            for _ in range(REPEAT):
+                repository.add(transaction)
+            elapsed = (time.perf_counter() - started) / REPEAT
+            print(f"{rows:>10,} {elapsed * 1000:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
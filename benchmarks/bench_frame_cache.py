@@ -0,0 +1,64 @@
+"""
+解析済み仕訳キャッシュの効果の計測
+
+1つのプロセスで全ての勘定科目の月次元帳を続けて作る場合に、
+毎回 CSV を読み込む方式とプロセス内キャッシュを使う方式を比較する
+
+    uv run benchmarks/bench_frame_cache.py
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic import write_journal_csv
+
+from bookkeeper.infrastructure.repository.csv_transaction_repository import (
+    CsvTransactionRepository,
+)
+from bookkeeper.infrastructure.repository.frame_cache import FrameCache
+
+SIZES = [100_000, 1_000_000]
+CACHE_BYTES = 1024 * 1024 * 1024
+
+
+def render_all_ledgers(repository: CsvTransactionRepository) -> float:
+    """全ての勘定科目の、最後の月の元帳を作る時間（秒）"""
+    transactions = repository.find_all()
+    last = max(transaction.date for transaction in transactions)
+    month_start = last.replace(day=1)
+    accounts = sorted(
+        {t.debit_account for t in transactions}
+        | {t.credit_account for t in transactions}
+    )
+    del transactions
+    repository.rebuild_indexes()
+
+    started = time.perf_counter()
+    for account in accounts:
+        repository.find_ledger(account, month_start, last)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    print(f"{'件数':>10} {'毎回読込(s)':>12} {'キャッシュ(s)':>14}  ヒット/ミス")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in SIZES:
+            path = write_journal_csv(Path(tmp) / f"journal_{rows}.csv", rows)
+            uncached = render_all_ledgers(CsvTransactionRepository(path))
+            cache = FrameCache(CACHE_BYTES)
+            cached = render_all_ledgers(
+                CsvTransactionRepository(path, frame_cache=cache)
+            )
+            stats = cache.stats
+            print(
+                f"{rows:>10,} {uncached:>12.3f} {cached:>14.3f}"
+                f"  {stats.hits}/{stats.misses}"
+            )
+
+
+if __name__ == "__main__":
+    main()
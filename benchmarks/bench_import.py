@@ -0,0 +1,69 @@
+"""
+仕訳の一括取込（import）の時間の計測
+
+合成仕訳CSVを空の CsvTransactionRepository に ImportTransactionsUseCase で取り込み
+（行の読み込み・Transaction の検証・勘定科目の確認・重複の照合・書き込み）、
+予算を超えた場合は終了コード 1 で終わる
+
+    uv run benchmarks/bench_import.py
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic import write_journal_csv
+
+from bookkeeper.application.usecase.import_transactions import (
+    ImportTransactionsUseCase,
+)
+from bookkeeper.domain.vo.chart_of_accounts import ChartOfAccounts
+from bookkeeper.infrastructure.repository.csv_transaction_repository import (
+    CsvTransactionRepository,
+)
+from bookkeeper.presentation.cli.readers import iter_import_rows
+
+# 件数ごとの取込時間の予算（秒）。1行ずつの Transaction の検証が大半を占める
+BUDGETS_S = {
+    100_000: 4.0,
+    1_000_000: 40.0,
+}
+
+
+def import_seconds(source: Path, data_dir: Path) -> tuple[float, int, int]:
+    """空のリポジトリに取り込み、(秒, 取り込んだ件数, エラー件数) を返す"""
+    repository = CsvTransactionRepository(data_dir / "transactions.csv")
+    usecase = ImportTransactionsUseCase(repository, ChartOfAccounts.default())
+    started = time.perf_counter()
+    result = usecase.execute(iter_import_rows(source))
+    return time.perf_counter() - started, result.imported, len(result.errors)
+
+
+def main() -> None:
+    failed = False
+    print(
+        f"{'件数':>10} {'取込(秒)':>9} {'予算(秒)':>9} {'件/秒':>10} "
+        f"{'取込件数':>10} {'エラー':>7}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows, budget in BUDGETS_S.items():
+            data_dir = Path(tmp) / f"data_{rows}"
+            data_dir.mkdir()
+            source = write_journal_csv(Path(tmp) / f"journal_{rows}.csv", rows)
+            # 合成データには同じ内容の行が含まれるので、重複のエラーも数える
+            seconds, imported, errors = import_seconds(source, data_dir)
+            over = seconds > budget
+            failed |= over
+            print(
+                f"{rows:>10,} {seconds:>9.2f} {budget:>9.1f} {rows / seconds:>10,.0f} "
+                f"{imported:>10,} {errors:>7,}{'  ← 超過' if over else ''}"
+            )
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
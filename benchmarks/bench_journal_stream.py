@@ -0,0 +1,105 @@
+"""
+仕訳帳出力のピークメモリ計測
+
+全件をリストにして1つの文字列に組み立てる方式と、分割して読みながら
+1行ずつ書き出す方式で、件数に対するメモリ使用量の増え方を比較する
+
+    uv run benchmarks/bench_journal_stream.py
+"""
+
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic import write_journal_csv
+
+SIZES = [100_000, 1_000_000, 3_000_000, 6_000_000]
+
+# 一括方式はこの件数までにする（それ以上はメモリ不足になりやすい）
+MAX_LIST_ROWS = 1_000_000
+
+
+def run_child(mode: str, path: Path) -> None:
+    """
+    子プロセスで仕訳帳を /dev/null に出力し、最大常駐メモリ (MB) を表示
+
+    最大常駐メモリには Polars がメモリマップした CSV のページ（ページキャッシュ）も
+    含まれるので、別スレッドで標本を取った匿名メモリの最大値も併せて表示する
+    """
+    from bookkeeper.infrastructure.repository.csv_transaction_repository import (
+        CsvTransactionRepository,
+    )
+    from bookkeeper.presentation.cli.formatters import (
+        format_journal,
+        iter_journal_lines,
+    )
+
+    peak_anon = 0
+    done = threading.Event()
+
+    def sample() -> None:
+        nonlocal peak_anon
+        while not done.wait(0.01):
+            peak_anon = max(peak_anon, rss_anon_mb())
+
+    sampler = threading.Thread(target=sample)
+    sampler.start()
+    repository = CsvTransactionRepository(path)
+    with open(os.devnull, "w") as out:
+        if mode == "list":
+            print(format_journal(repository.find_all()), file=out)
+        else:
+            for line in iter_journal_lines(repository.iter_all()):
+                out.write(line)
+                out.write("\n")
+    done.set()
+    sampler.join()
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024
+    print(f"{peak_rss}/{peak_anon}")
+
+
+def rss_anon_mb() -> int:
+    """現在の匿名メモリ (MB)。Linux 以外では 0"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("RssAnon:"):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    return 0
+
+
+def measure(mode: str, path: Path) -> str:
+    """別プロセスで計測（プロセスごとの最大常駐メモリを比較するため）"""
+    result = subprocess.run(
+        [sys.executable, __file__, "--child", mode, str(path)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def main() -> None:
+    print("最大常駐メモリ / 匿名メモリの最大値 (MB)")
+    print(f"{'件数':>10} {'一括':>12} {'逐次':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in SIZES:
+            path = write_journal_csv(Path(tmp) / f"journal_{rows}.csv", rows)
+            listed = measure("list", path) if rows <= MAX_LIST_ROWS else "-"
+            print(f"{rows:>10,} {listed:>12} {measure('stream', path):>12}")
+            path.unlink()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--child":
+        run_child(sys.argv[2], Path(sys.argv[3]))
+    else:
+        main()
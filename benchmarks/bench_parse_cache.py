@@ -0,0 +1,87 @@
+"""
+CSV の解析結果キャッシュの効果の計測
+
+毎回新しいプロセスで試算表の集計を行い、CSV を解析する場合と
+解析結果キャッシュを使う場合（作成時・再利用時・追記後）の時間を比較する
+
+    uv run benchmarks/bench_parse_cache.py
+"""
+
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic import write_journal_csv
+
+SIZES = [100_000, 1_000_000]
+
+
+def run_child(path: Path, use_parse_cache: bool) -> None:
+    """子プロセスで勘定科目別の集計を行う"""
+    from bookkeeper.infrastructure.repository.csv_transaction_repository import (
+        CsvTransactionRepository,
+    )
+
+    CsvTransactionRepository(
+        path, use_parse_cache=use_parse_cache
+    ).summarize_by_account()
+
+
+def measure(path: Path, use_parse_cache: bool) -> float:
+    """新しいプロセスでの実行時間（秒、プロセスの起動を含む）"""
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, __file__, "--child", str(path), str(int(use_parse_cache))],
+        check=True,
+    )
+    return time.perf_counter() - started
+
+
+def append_one(path: Path) -> None:
+    """CSV の末尾に1件追記する"""
+    from bookkeeper.domain.entity.transaction import Transaction
+    from bookkeeper.infrastructure.repository.csv_transaction_repository import (
+        CsvTransactionRepository,
+    )
+
+    CsvTransactionRepository(path).add(
+        Transaction(
+            date=date(2025, 1, 1),
+            debit_account="消耗品費",
+            debit_amount=Decimal("1500"),
+            credit_account="現金",
+            credit_amount=Decimal("1500"),
+            description="ベンチマーク",
+        )
+    )
+
+
+def main() -> None:
+    print(
+        f"{'件数':>10} {'解析(s)':>9} {'作成(s)':>9} {'再利用(s)':>10} {'追記後(s)':>10}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in SIZES:
+            path = write_journal_csv(Path(tmp) / f"journal_{rows}.csv", rows)
+            parsed = measure(path, False)
+            built = measure(path, True)
+            reused = measure(path, True)
+            append_one(path)
+            refreshed = measure(path, True)
+            print(
+                f"{rows:>10,} {parsed:>9.3f} {built:>9.3f} "
+                f"{reused:>10.3f} {refreshed:>10.3f}"
+            )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--child":
+        run_child(Path(sys.argv[2]), sys.argv[3] == "1")
+    else:
+        main()
@@ -0,0 +1,103 @@
+"""
+読み出し結果の1件あたりのメモリ
+
+- 仕訳: Transaction（pydantic）のリストと TransactionRecord（タプル）のリスト
+- 元帳: 従来の LedgerEntry（__slots__ なし、日付は行ごとの ISO 文字列）と
+  現在の LedgerEntry（__slots__、日付・摘要・金額は行の間で共有）
+
+Python のオブジェクトの確保量を tracemalloc で測る（Polars のバッファは含まない）
+
+    uv run benchmarks/bench_read_model.py
+"""
+
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic import write_journal_csv
+
+from bookkeeper.infrastructure.repository.csv_transaction_repository import (
+    CsvTransactionRepository,
+)
+
+ROWS = 1_000_000
+
+# 元帳を作る勘定科目
+ACCOUNT = "現金"
+
+
+@dataclass
+class LegacyLedgerEntry:
+    """変更前の LedgerEntry（比較用）"""
+
+    date: str
+    description: str
+    debit_amount: Decimal | None
+    credit_amount: Decimal | None
+    balance: Decimal
+
+
+def legacy_ledger(repository: CsvTransactionRepository) -> list:
+    """変更前と同じく、行ごとに別の文字列・Decimal を持つ LedgerEntry を作る"""
+    return [
+        LegacyLedgerEntry(
+            entry.date.isoformat(),
+            "".join(entry.description),
+            _copy(entry.debit_amount),
+            _copy(entry.credit_amount),
+            entry.balance,
+        )
+        for entry in repository.find_ledger(ACCOUNT)
+    ]
+
+
+def _copy(amount: Decimal | None) -> Decimal | None:
+    """別のオブジェクトにした金額"""
+    return None if amount is None else Decimal(str(amount))
+
+
+def measure(function: Callable[[], list]) -> tuple[int, float, float]:
+    """結果の件数・1件あたりのバイト数・時間（秒、tracemalloc なしで測る）"""
+    gc.collect()
+    started = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - started
+
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(result), size / max(len(result), 1), elapsed
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_journal_csv(Path(tmp) / "journal.csv", ROWS)
+        repository = CsvTransactionRepository(path)
+        # id を付け、解析結果キャッシュを作っておく
+        repository.migrate()
+        repository.find_all()
+
+        cases = {
+            "仕訳 Transaction": repository.find_all,
+            "仕訳 TransactionRecord": lambda: list(repository.iter_all()),
+            "元帳 従来の LedgerEntry": lambda: legacy_ledger(repository),
+            "元帳 LedgerEntry": lambda: repository.find_ledger(ACCOUNT),
+        }
+        print(f"{'ケース':<28} {'件数':>10} {'バイト/件':>10} {'時間(s)':>8}")
+        for name, function in cases.items():
+            rows, per_row, elapsed = measure(function)
+            print(f"{name:<28} {rows:>10,} {per_row:>10.0f} {elapsed:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+試算表の集計方式の比較
+
+- 一括: summarize_by_account で1回の走査・group_by
+- 科目ごと: 勘定科目ごとに find_ledger を呼ぶ（科目数だけ走査する従来の方法）
+
+勘定科目の数を増やしても一括集計の時間がほぼ変わらないことを確認する
+
+    uv run benchmarks/bench_reports.py
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import polars as pl
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic import generate_journal
+
+from bookkeeper.infrastructure.repository.csv_transaction_repository import (
+    CsvTransactionRepository,
+)
+
+ROWS = 1_000_000
+ACCOUNT_COUNTS = [10, 100, 1_000]
+# 科目ごとの方式は時間がかかるので、この科目数までに限る
+PER_ACCOUNT_LIMIT = 100
+
+
+def main() -> None:
+    print(f"{ROWS:,} 件")
+    print(f"{'科目数':>8} {'一括(s)':>10} {'科目ごと(s)':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for accounts in ACCOUNT_COUNTS:
+            # 勘定科目名に連番を付けて科目数を増やす
+            suffix = (pl.int_range(0, pl.len()) % (accounts // 2)).cast(pl.String)
+            df = generate_journal(ROWS).with_columns(
+                pl.col("debit_account") + suffix,
+                pl.col("credit_account") + "_" + suffix,
+            )
+            path = Path(tmp) / f"journal_{accounts}.csv"
+            df.write_csv(path)
+            repository = CsvTransactionRepository(path)
+
+            started = time.perf_counter()
+            totals = repository.summarize_by_account()
+            bulk = time.perf_counter() - started
+
+            per_account = "-"
+            if accounts <= PER_ACCOUNT_LIMIT:
+                started = time.perf_counter()
+                for total in totals:
+                    repository.find_ledger(total.account_name)
+                per_account = f"{time.perf_counter() - started:.3f}"
+
+            print(f"{len(totals):>8} {bulk:>10.3f} {per_account:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+API サーバー経由での繰り返し実行の計測
+
+スクリプトから CLI を繰り返し呼ぶ場合を想定し、毎回ローカルで処理する場合と
+常駐している API サーバーに依頼する場合の、1回あたりの時間を比較する
+
+    uv run benchmarks/bench_server.py
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic import write_journal_csv
+
+ROWS = 1_000_000
+REPEAT = 5
+
+# 一時ディレクトリのデータファイルで CLI を実行する子プロセスのコード
+_CHILD_CODE = """
+import sys
+from pathlib import Path
+from bookkeeper.infrastructure.config.settings import Settings
+data_dir = Path(sys.argv[1])
+Settings.DATA_DIR = data_dir
+Settings.TRANSACTIONS_CSV = data_dir / "transactions.csv"
+Settings.SERVER_SOCKET = data_dir / "bookkeeper.sock"
+from bookkeeper.presentation.cli.commands import app
+app(sys.argv[2:], prog_name="bookkeeper")
+"""
+
+COMMANDS = {
+    "ledger": ["ledger", "現金", "--fiscal-year", "2046"],
+    "journal": ["journal", "--offset", "500000", "--limit", "100"],
+    "trial-balance": ["trial-balance"],
+}
+
+
+def run_cli(data_dir: Path, args: list[str], use_server: bool) -> float:
+    """CLI を新しいプロセスで実行した時間（秒）"""
+    env = {**os.environ, "BOOKKEEPER_USE_SERVER": "1" if use_server else "0"}
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", _CHILD_CODE, str(data_dir), *args],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        env=env,
+    )
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    print(
+        f"{'コマンド':<14} {'ローカル(s)':>11} {'サーバー(s)':>11}  （{ROWS:,} 件、{REPEAT} 回の平均）"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        write_journal_csv(data_dir / "transactions.csv", ROWS)
+        # 解析結果キャッシュを作っておき、ローカルでの実行も最も速い状態で比べる
+        run_cli(data_dir, ["trial-balance"], False)
+
+        server = subprocess.Popen(
+            [sys.executable, "-c", _CHILD_CODE, str(data_dir), "serve"],
+            stdout=subprocess.DEVNULL,
+        )
+        try:
+            socket_path = data_dir / "bookkeeper.sock"
+            while not socket_path.exists():
+                time.sleep(0.05)
+            for name, args in COMMANDS.items():
+                local = sum(run_cli(data_dir, args, False) for _ in range(REPEAT))
+                served = sum(run_cli(data_dir, args, True) for _ in range(REPEAT))
+                print(f"{name:<14} {local / REPEAT:>11.3f} {served / REPEAT:>11.3f}")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
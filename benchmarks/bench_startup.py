@@ -0,0 +1,95 @@
+"""
+CLI の起動時間（import 時間）の計測
+
+`python -X importtime` でコマンドごとの import 時間の合計を求め、
+予算を超えた場合や `--help` で重い依存を読み込んだ場合は終了コード 1 で終わる
+
+    uv run benchmarks/bench_startup.py
+"""
+
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# コマンドごとの import 時間の予算（ミリ秒）
+BUDGETS_MS = {
+    "--help": 250,
+    "journal": 600,
+    "ledger": 600,
+}
+
+# `--help` では読み込まないはずのモジュール
+HEAVY_MODULES = ("polars", "pydantic")
+
+# 一時ディレクトリのデータファイル・設定ファイルで CLI を実行する子プロセスのコード
+_CHILD_CODE = """
+import sys
+from pathlib import Path
+from bookkeeper.infrastructure.config.settings import Settings
+data_dir = Path(sys.argv[1])
+Settings.DATA_DIR = data_dir
+Settings.TRANSACTIONS_CSV = data_dir / "transactions.csv"
+Settings.TRANSACTIONS_IPC = data_dir / "transactions.arrow"
+Settings.TRANSACTIONS_DB = data_dir / "transactions.sqlite3"
+Settings.TRANSACTIONS_PARTITIONS = data_dir / "transactions"
+Settings.ACCOUNTS_FILE = data_dir / "accounts.toml"
+Settings.SERVER_SOCKET = data_dir / "bookkeeper.sock"
+# 環境変数の設定（動いているサーバー・計測・保存形式）に左右されないようにする
+Settings.USE_SERVER = False
+Settings.STORAGE_BACKEND = "csv"
+Settings.TIMINGS = False
+Settings.TIMINGS_JSON = None
+Settings.PROFILE_OUTPUT = None
+from bookkeeper.presentation.cli.commands import app
+app(sys.argv[2:], prog_name="bookkeeper")
+"""
+
+
+def import_times(args: list[str], data_dir: Path) -> dict[str, int]:
+    """CLI を実行し、モジュールごとの import 時間（自身の分、マイクロ秒）を返す"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD_CODE, str(data_dir), *args],
+        # 失敗したときは標準エラー出力の末尾を添えて報告する
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        command = " ".join(args)
+        raise RuntimeError(f"{command} が失敗しました\n{result.stderr[-2000:]}")
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, module = line[len("import time:") :].split("|")
+        times[module.strip()] = int(self_us)
+    return times
+
+
+def main() -> None:
+    commands = {
+        "--help": ["--help"],
+        "journal": ["journal", "--limit", "1"],
+        "ledger": ["ledger", "現金"],
+    }
+    failed = False
+    print(f"{'コマンド':<10} {'import(ms)':>10} {'予算(ms)':>9}  重い依存")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, args in commands.items():
+            times = import_times(args, Path(tmp))
+            total_ms = sum(times.values()) / 1000
+            heavy = [module for module in HEAVY_MODULES if module in times]
+            budget = BUDGETS_MS[name]
+            over = total_ms > budget or (name == "--help" and heavy)
+            failed |= bool(over)
+            print(
+                f"{name:<10} {total_ms:>10.1f} {budget:>9}  "
+                f"{', '.join(heavy) or '-'}{'  ← 超過' if over else ''}"
+            )
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+仕訳読み込み時のバリデーション方式の比較
+
+- 行ごと: 1行ずつ pydantic の Transaction を生成（従来方式）
+- 列単位: Polars 式で一括検証してから行ごとのバリデーションなしで生成
+
+    uv run benchmarks/bench_validation.py
+"""
+
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+from uuid import UUID
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic import generate_journal
+
+from bookkeeper.domain.entity.transaction import Transaction
+from bookkeeper.infrastructure.repository.transaction_frame import (
+    frame_to_transactions,
+)
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def per_row(df) -> list[Transaction]:
+    """従来方式: 1行ずつ完全なバリデーションを実行"""
+    return [
+        Transaction(
+            id=UUID(row["id"]) if row.get("id") else None,
+            date=row["date"],
+            debit_account=row["debit_account"],
+            debit_amount=Decimal(row["debit_amount"]),
+            credit_account=row["credit_account"],
+            credit_amount=Decimal(row["credit_amount"]),
+            description=row["description"],
+            note=row.get("note", "") or "",
+            evidence_path=row.get("evidence_path", "") or "",
+        )
+        for row in df.iter_rows(named=True)
+    ]
+
+
+def main() -> None:
+    print(f"{'件数':>10} {'行ごと(s)':>10} {'列単位(s)':>10} {'倍率':>6}")
+    for rows in SIZES:
+        df = generate_journal(rows)
+
+        started = time.perf_counter()
+        per_row(df)
+        row_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        frame_to_transactions(df)
+        column_elapsed = time.perf_counter() - started
+
+        print(
+            f"{rows:>10,} {row_elapsed:>10.3f} {column_elapsed:>10.3f} "
+            f"{row_elapsed / column_elapsed:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+複数プロセスからの同時書き込みの検証
+
+多数のプロセスから同じデータファイルに同時に仕訳を追加し、
+行の欠落・重複がないこと、世代番号が書き込み回数だけ進んだことを確認する。
+問題があれば終了コード 1 で終わる
+
+    uv run benchmarks/stress_concurrent_add.py
+"""
+
+import multiprocessing
+import sys
+import tempfile
+import time
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+from bookkeeper.domain.entity.transaction import Transaction
+from bookkeeper.infrastructure.repository.csv_transaction_repository import (
+    CsvTransactionRepository,
+)
+from bookkeeper.infrastructure.repository.frame_cache import FrameCache
+from bookkeeper.infrastructure.repository.ipc_transaction_repository import (
+    IpcTransactionRepository,
+)
+
+WRITERS = 16
+WRITES_PER_WRITER = 25
+ROWS_PER_WRITE = 4
+
+BACKENDS = {
+    "csv": lambda path: CsvTransactionRepository(
+        path / "transactions.csv",
+        frame_cache=FrameCache(64 * 1024 * 1024),
+        use_parse_cache=True,
+    ),
+    "ipc": lambda path: IpcTransactionRepository(
+        path / "transactions.arrow", frame_cache=FrameCache(64 * 1024 * 1024)
+    ),
+}
+
+
+def writer(backend: str, data_dir: Path, writer_id: int) -> None:
+    """仕訳を ROWS_PER_WRITE 件ずつ WRITES_PER_WRITER 回追加する"""
+    repository = BACKENDS[backend](data_dir)
+    for write in range(WRITES_PER_WRITER):
+        repository.add_many(
+            Transaction(
+                date=date(2025, 1, 1 + row),
+                debit_account="消耗品費",
+                debit_amount=Decimal("100"),
+                credit_account="現金",
+                credit_amount=Decimal("100"),
+                description=f"書き込み {writer_id}-{write}-{row}",
+            )
+            for row in range(ROWS_PER_WRITE)
+        )
+        # キャッシュを使った読み込みも書き込みと並行させる
+        repository.summarize_by_account()
+
+
+def run(backend: str) -> list[str]:
+    """同時書き込みを行い、見つかった問題を返す"""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        repository = BACKENDS[backend](data_dir)
+        generation = repository.generation()
+
+        processes = [
+            multiprocessing.Process(target=writer, args=(backend, data_dir, i))
+            for i in range(WRITERS)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        problems = [
+            f"書き込みプロセス {i} が終了コード {process.exitcode} で終了しました"
+            for i, process in enumerate(processes)
+            if process.exitcode != 0
+        ]
+        transactions = repository.find_all()
+        descriptions = [transaction.description for transaction in transactions]
+        ids = {transaction.id for transaction in transactions}
+        expected = WRITERS * WRITES_PER_WRITER * ROWS_PER_WRITE
+        if len(set(descriptions)) != expected:
+            problems.append(f"行数 {len(set(descriptions))} / 期待 {expected}（欠落）")
+        if len(descriptions) != len(set(descriptions)) or len(ids) != len(transactions):
+            problems.append(f"重複した行があります（{len(transactions)} 行）")
+        writes = repository.generation() - generation
+        if writes != WRITERS * WRITES_PER_WRITER:
+            problems.append(
+                f"世代番号の増加 {writes} / 期待 {WRITERS * WRITES_PER_WRITER}"
+            )
+        # 別のプロセスの書き込み後もキャッシュが古い内容を返さないこと
+        if len(BACKENDS[backend](data_dir).find_all()) != len(transactions):
+            problems.append("解析結果キャッシュの内容がデータファイルと一致しません")
+        return problems
+
+
+def main() -> None:
+    failed = False
+    print(f"{'形式':<6} {'プロセス':>8} {'行数':>8} {'時間(s)':>9}  結果")
+    for backend in BACKENDS:
+        started = time.perf_counter()
+        problems = run(backend)
+        elapsed = time.perf_counter() - started
+        rows = WRITERS * WRITES_PER_WRITER * ROWS_PER_WRITE
+        print(
+            f"{backend:<6} {WRITERS:>8} {rows:>8,} {elapsed:>9.3f}  "
+            f"{'OK' if not problems else 'NG'}"
+        )
+        for problem in problems:
+            print(f"  {problem}")
+        failed |= bool(problems)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    # Polars のスレッドプールは fork と相性が悪いため spawn で起動する
+    multiprocessing.set_start_method("spawn")
+    main()
@@ -0,0 +1,230 @@
+"""
+主要な処理のベンチマーク一式
+
+合成仕訳データの件数ごとに、追加のレイテンシ・find_all・find_by_account・
+元帳（LedgerService とリポジトリの一括計算）・仕訳帳の整形を計測する。
+各ケースは新しいプロセスで実行し、時間と最大常駐メモリを記録する。
+結果は JSON に保存し、--compare で以前の結果と比べられる
+
+    uv run benchmarks/suite.py
+    uv run benchmarks/suite.py --sizes 1k,100k,1M,10M
+    uv run benchmarks/suite.py --compare benchmarks/results/20250101-120000.json
+"""
+
+import argparse
+import json
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic import parse_rows, write_journal_csv
+
+DEFAULT_SIZES = "1k,100k,1M"
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# 元帳を作る勘定科目（合成データで最も仕訳の多い科目の1つ）
+ACCOUNT = "現金"
+
+# 追加のレイテンシを測る回数
+ADD_REPEAT = 50
+
+# 全件を Transaction のリストにするケースはこの件数までにする（メモリ不足を避ける）
+MAX_LIST_ROWS = 1_000_000
+
+# 以前の結果よりこの割合以上遅ければ「悪化」と表示する
+REGRESSION_RATIO = 1.10
+
+
+def case_add(repository) -> dict:
+    """1件ずつ追加したときの1件あたりの時間"""
+    from datetime import date
+    from decimal import Decimal
+
+    from bookkeeper.domain.entity.transaction import Transaction
+
+    transaction = Transaction(
+        date=date(2025, 1, 1),
+        debit_account="消耗品費",
+        debit_amount=Decimal("1500"),
+        credit_account="現金",
+        credit_amount=Decimal("1500"),
+        description="ベンチマーク",
+    )
+    latencies = []
+    for _ in range(ADD_REPEAT):
+        started = time.perf_counter()
+        repository.add(transaction)
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    return {
+        "seconds": statistics.median(latencies),
+        "p95_seconds": latencies[int(len(latencies) * 0.95) - 1],
+    }
+
+
+def case_find_all(repository) -> dict:
+    """全件を Transaction のリストにする"""
+    return {"items": len(repository.find_all())}
+
+
+def case_find_by_account(repository) -> dict:
+    """勘定科目を含む仕訳を Transaction のリストにする"""
+    return {"items": len(repository.find_by_account(ACCOUNT))}
+
+
+def case_ledger_service(repository) -> dict:
+    """LedgerService.generate_ledger で元帳を作る（find_by_account を含む）"""
+    from bookkeeper.domain.service.ledger_service import LedgerService
+
+    transactions = repository.find_by_account(ACCOUNT)
+    return {"items": len(LedgerService.generate_ledger(transactions, ACCOUNT))}
+
+
+def case_find_ledger(repository) -> dict:
+    """リポジトリの一括計算で元帳を作る"""
+    return {"items": len(repository.find_ledger(ACCOUNT))}
+
+
+def case_journal_format(repository) -> dict:
+    """全件を読みながら仕訳帳の行に整形する"""
+    from bookkeeper.presentation.cli.formatters import iter_journal_lines
+
+    size = sum(len(line) for line in iter_journal_lines(repository.iter_all()))
+    return {"characters": size}
+
+
+# ケース名 → (関数, 全件をリストにするか)
+CASES = {
+    "add": (case_add, False),
+    "find_all": (case_find_all, True),
+    "find_by_account": (case_find_by_account, True),
+    "ledger_service": (case_ledger_service, True),
+    "find_ledger": (case_find_ledger, False),
+    "journal_format": (case_journal_format, False),
+}
+
+
+def run_child(case: str, path: Path) -> None:
+    """子プロセスで1つのケースを実行し、結果を JSON で標準出力に書く"""
+    from bookkeeper.infrastructure.repository.csv_transaction_repository import (
+        CsvTransactionRepository,
+    )
+
+    # キャッシュを使わず、毎回 CSV を解析する状態で比べる
+    repository = CsvTransactionRepository(path)
+    function, _ = CASES[case]
+    started = time.perf_counter()
+    result = {"seconds": None, **function(repository)}
+    if result["seconds"] is None:
+        result["seconds"] = time.perf_counter() - started
+    # Linux の ru_maxrss は KB 単位
+    result["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps(result))
+
+
+def measure(case: str, path: Path) -> dict:
+    """新しいプロセスで1つのケースを実行した結果"""
+    output = subprocess.run(
+        [sys.executable, __file__, "--child", case, str(path)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def environment() -> dict:
+    """結果を比べるときに必要な実行環境の情報"""
+    import polars as pl
+
+    commit = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        # git の管理外で実行した場合もコミットなしで結果を残す
+        check=False,
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).parent,
+    ).stdout.strip()
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "commit": commit or None,
+        "python": platform.python_version(),
+        "polars": pl.__version__,
+        "platform": platform.platform(),
+    }
+
+
+def compare(results: list[dict], baseline_path: Path) -> None:
+    """以前の結果と時間を比べて表示する"""
+    baseline = {
+        (result["rows"], result["case"]): result
+        for result in json.loads(baseline_path.read_text())["results"]
+    }
+    print()
+    print(f"{baseline_path.name} との比較（新 / 旧）")
+    for result in results:
+        old = baseline.get((result["rows"], result["case"]))
+        if old is None or not old.get("seconds") or not result.get("seconds"):
+            continue
+        ratio = result["seconds"] / old["seconds"]
+        mark = "  ← 悪化" if ratio >= REGRESSION_RATIO else ""
+        print(f"{result['rows']:>12,} {result['case']:<16} {ratio:>6.2f}x{mark}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="主要な処理のベンチマーク")
+    parser.add_argument(
+        "--sizes", default=DEFAULT_SIZES, help=f"件数の一覧（既定: {DEFAULT_SIZES}）"
+    )
+    parser.add_argument("--cases", default=",".join(CASES), help="実行するケース")
+    parser.add_argument("--output", type=Path, help="結果の JSON の保存先")
+    parser.add_argument("--compare", type=Path, help="比較する以前の結果の JSON")
+    args = parser.parse_args()
+
+    sizes = [parse_rows(size) for size in args.sizes.split(",")]
+    cases = args.cases.split(",")
+    output = args.output or RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}.json"
+
+    results = []
+    print(f"{'件数':>12} {'ケース':<16} {'時間(s)':>10} {'最大RSS(MB)':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in sizes:
+            source = write_journal_csv(Path(tmp) / "source.csv", rows)
+            for case in cases:
+                if CASES[case][1] and rows > MAX_LIST_ROWS:
+                    continue
+                # 追加でデータが変わらないよう、ケースごとに複製を使う
+                path = Path(tmp) / "journal.csv"
+                shutil.copyfile(source, path)
+                result = {"rows": rows, "case": case, **measure(case, path)}
+                results.append(result)
+                print(
+                    f"{rows:>12,} {case:<16} {result['seconds']:>10.4f} "
+                    f"{result['peak_rss_mb']:>12.1f}"
+                )
+                for sidecar in Path(tmp).glob("journal.csv.*"):
+                    sidecar.unlink()
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps({"environment": environment(), "results": results}, indent=2)
+    )
+    print(f"✓ 結果を {output} に保存しました")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--child":
+        run_child(sys.argv[2], Path(sys.argv[3]))
+    else:
+        main()
@@ -0,0 +1,140 @@
+"""
+ベンチマーク用の合成仕訳データ生成
+
+ACCOUNT_TYPE_MAP の勘定科目を使い、個人事業の取引に近い組み合わせ・頻度・金額の
+仕訳を生成する。乱数は行番号のハッシュから求めるので、同じ引数なら同じデータになる
+
+    uv run benchmarks/synthetic.py 1M data/journal_1m.csv
+"""
+
+import argparse
+from datetime import date
+from pathlib import Path
+
+import polars as pl
+
+from bookkeeper.domain.vo.account import ACCOUNT_TYPE_MAP
+from bookkeeper.infrastructure.repository.csv_transaction_repository import (
+    CsvTransactionRepository,
+)
+
+# (借方, 貸方, 摘要, 最小金額, 最大金額, 頻度の重み)
+_PATTERNS = [
+    ("売掛金", "売上", "売上計上", 10_000, 500_000, 10),
+    ("普通預金", "売掛金", "売掛金回収", 10_000, 500_000, 9),
+    ("現金", "売上", "現金売上", 1_000, 50_000, 6),
+    ("消耗品費", "現金", "コピー用紙代", 300, 5_000, 12),
+    ("消耗品費", "事業主借", "文房具", 200, 3_000, 6),
+    ("通信費", "普通預金", "インターネット料金", 3_000, 8_000, 5),
+    ("通信費", "未払金", "携帯電話料金", 2_000, 10_000, 5),
+    ("旅費交通費", "現金", "電車代", 150, 2_000, 15),
+    ("旅費交通費", "事業主借", "タクシー代", 700, 8_000, 5),
+    ("新聞図書費", "現金", "技術書", 1_000, 6_000, 4),
+    ("地代家賃", "普通預金", "事務所家賃", 50_000, 150_000, 2),
+    ("外注工賃", "買掛金", "外注費", 20_000, 300_000, 3),
+    ("買掛金", "普通預金", "買掛金支払", 20_000, 300_000, 3),
+    ("未払金", "普通預金", "未払金支払", 2_000, 10_000, 4),
+    ("現金", "普通預金", "ATM引出", 10_000, 50_000, 4),
+    ("当座預金", "普通預金", "資金移動", 100_000, 1_000_000, 1),
+    ("事業主貸", "普通預金", "生活費", 50_000, 200_000, 2),
+]
+
+_unknown = {
+    account for pattern in _PATTERNS for account in pattern[:2]
+} - ACCOUNT_TYPE_MAP.keys()
+assert not _unknown, f"勘定科目表にない科目があります: {_unknown}"
+
+# 証憑パスを付ける割合（10件に1件）
+_EVIDENCE_EVERY = 10
+
+# write_journal_csv で一度に生成する行数
+_CHUNK_ROWS = 1_000_000
+
+
+def generate_journal(
+    rows: int,
+    start: date = date(2020, 1, 1),
+    offset: int = 0,
+    rows_per_day: int = 100,
+    seed: int = 0,
+) -> pl.DataFrame:
+    """
+    rows 件の仕訳をスキーマ順のDataFrameとして生成
+
+    Args:
+        rows: 件数
+        start: 最初の仕訳の日付
+        offset: 先頭の行番号（分割して生成する場合に続きから作る）
+        rows_per_day: 1日あたりの件数
+        seed: 乱数の種
+    """
+    idx = pl.int_range(offset, offset + rows, eager=True)
+    weights = [pattern[5] for pattern in _PATTERNS]
+    bounds = pl.Series([sum(weights[: i + 1]) for i in range(len(weights))])
+    pattern = bounds.search_sorted(idx.hash(seed) % sum(weights), side="right")
+
+    def column(position: int, dtype: pl.DataType = pl.String) -> pl.Series:
+        return pl.Series([p[position] for p in _PATTERNS], dtype=dtype).gather(pattern)
+
+    low = column(3, pl.UInt64)
+    high = column(4, pl.UInt64)
+    # 10円単位の金額
+    amount = (low + idx.hash(seed + 1) % (high - low) // 10 * 10).cast(pl.String)
+    with_evidence = idx.hash(seed + 2) % _EVIDENCE_EVERY == 0
+    df = pl.DataFrame(
+        {
+            "id": pl.Series([None] * rows, dtype=pl.String),
+            "date": pl.select(
+                pl.lit(start) + pl.duration(days=idx // rows_per_day)
+            ).to_series(),
+            "debit_account": column(0),
+            "debit_amount": amount,
+            "credit_account": column(1),
+            "credit_amount": amount,
+            "description": column(2),
+            "note": pl.Series([""] * rows),
+            "evidence_path": pl.select(
+                pl.when(with_evidence)
+                .then(pl.format("evidence/{}.pdf", idx))
+                .otherwise(pl.lit(""))
+            ).to_series(),
+        }
+    )
+    return df.cast(CsvTransactionRepository.SCHEMA)
+
+
+def write_journal_csv(path: Path, rows: int, seed: int = 0) -> Path:
+    """rows 件の仕訳CSVを書き出す（_CHUNK_ROWS 件ずつ生成してメモリを抑える）"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as f:
+        for offset in range(0, max(rows, 1), _CHUNK_ROWS):
+            chunk = generate_journal(
+                min(_CHUNK_ROWS, rows - offset), offset=offset, seed=seed
+            )
+            chunk.write_csv(f, include_header=offset == 0)
+    return path
+
+
+def parse_rows(text: str) -> int:
+    """件数の表記（1k / 100k / 1M / 10M / 2500 など）を整数にする"""
+    units = {"k": 1_000, "m": 1_000_000}
+    suffix = text[-1].lower()
+    if suffix in units:
+        return int(float(text[:-1]) * units[suffix])
+    return int(text)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="合成仕訳データのCSVを書き出す")
+    parser.add_argument(
+        "rows", type=parse_rows, help="件数 (1k / 100k / 1M / 10M など)"
+    )
+    parser.add_argument("output", type=Path, help="出力先のCSV")
+    parser.add_argument("--seed", type=int, default=0, help="乱数の種")
+    args = parser.parse_args()
+    write_journal_csv(args.output, args.rows, args.seed)
+    print(f"✓ {args.rows:,} 件の仕訳を {args.output} に書き出しました")
+
+
+if __name__ == "__main__":
+    main()
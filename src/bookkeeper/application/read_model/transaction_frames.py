@@ -0,0 +1,165 @@
+"""
+仕訳の DataFrame 読み取りモデル
+
+仕訳帳・元帳・重複の組を Polars の DataFrame で読み出すポート。
+ユースケースが使い、列単位でまとめて整形・書き出しする表示（--format など）に渡す。
+ドメインのリポジトリ（TransactionRepository）は DataFrame を扱わないので、
+保存形式側で DataFrame をそのまま返せる実装（インフラ層）はこのポートも実装し、
+それ以外はリポジトリの結果を変換するアダプター（RecordFrameReader）を使う
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import astuple, fields
+from datetime import date
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Sequence
+
+import polars as pl
+
+from bookkeeper.domain.entity.transaction_record import TransactionRecord
+from bookkeeper.domain.repository.transaction_repository import TransactionRepository
+from bookkeeper.domain.service.ledger_service import LedgerEntry
+
+# records_to_frames で1つの DataFrame にする件数
+_FRAME_BATCH_SIZE = 50_000
+
+# 元帳の列（LedgerEntry のフィールド順）
+_LEDGER_COLUMNS = [field.name for field in fields(LedgerEntry)]
+
+
+class TransactionFrameReader(ABC):
+    """仕訳を DataFrame で読み出すインターフェース"""
+
+    @abstractmethod
+    def iter_frames(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> Iterator[pl.DataFrame]:
+        """
+        期間内の仕訳を追加順に DataFrame のバッチで返す
+
+        offset 件を飛ばし、最大 limit 件。列は TransactionRecord のフィールド順（金額は Decimal）
+        """
+        pass
+
+    @abstractmethod
+    def find_ledger_frame(
+        self, account_name: str, start: date | None = None, end: date | None = None
+    ) -> pl.DataFrame:
+        """
+        指定した勘定科目の元帳を DataFrame で取得
+
+        start より前の増減は繰越残高として残高に含める。
+        列は LedgerEntry のフィールド順（金額は Decimal）
+        """
+        pass
+
+    def find_ledger_frames(
+        self,
+        account_names: Sequence[str],
+        start: date | None = None,
+        end: date | None = None,
+    ) -> Dict[str, pl.DataFrame]:
+        """
+        複数の勘定科目の元帳を DataFrame でまとめて取得
+
+        各元帳は find_ledger_frame と同じ。取引のない勘定科目は空の DataFrame。
+        既定では勘定科目ごとに find_ledger_frame を呼ぶ。全件を1回読むだけで
+        まとめて計算できる実装はオーバーライドすること
+
+        Returns:
+            勘定科目名から元帳への辞書（account_names の順）
+        """
+        return {
+            account_name: self.find_ledger_frame(account_name, start, end)
+            for account_name in account_names
+        }
+
+    @abstractmethod
+    def find_duplicate_frame(
+        self, start: date | None = None, end: date | None = None
+    ) -> pl.DataFrame:
+        """
+        期間内で同じ内容（content_key）の仕訳が2件以上ある組を DataFrame で取得
+
+        列は group（組の番号。組の最初の仕訳の順に 1 から）と
+        TransactionRecord のフィールド順。組ごとに追加順に並べる
+        """
+        pass
+
+
+class RecordFrameReader(TransactionFrameReader):
+    """リポジトリの読み取りモデル・エンティティを DataFrame に変換するアダプター"""
+
+    def __init__(self, repository: TransactionRepository):
+        self.repository = repository
+
+    def iter_frames(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> Iterator[pl.DataFrame]:
+        """iter_all の結果を DataFrame のバッチに変換"""
+        return records_to_frames(self.repository.iter_all(start, end, offset, limit))
+
+    def find_ledger_frame(
+        self, account_name: str, start: date | None = None, end: date | None = None
+    ) -> pl.DataFrame:
+        """find_ledger の結果を DataFrame に変換"""
+        return ledger_to_frame(self.repository.find_ledger(account_name, start, end))
+
+    def find_duplicate_frame(
+        self, start: date | None = None, end: date | None = None
+    ) -> pl.DataFrame:
+        """期間内の全件を1回読み、内容のキーで分ける"""
+        groups: Dict[tuple, List[TransactionRecord]] = {}
+        for transaction in self.repository.find_all(start, end):
+            groups.setdefault(transaction.content_key, []).append(
+                TransactionRecord.from_transaction(transaction)
+            )
+        duplicates = (records for records in groups.values() if len(records) > 1)
+        rows = [
+            (group, *record)
+            for group, records in enumerate(duplicates, 1)
+            for record in records
+        ]
+        return pl.DataFrame(
+            rows,
+            schema=["group", *TransactionRecord._fields],
+            orient="row",
+            infer_schema_length=None,
+        )
+
+
+def records_to_frames(records: Iterable[TransactionRecord]) -> Iterator[pl.DataFrame]:
+    """仕訳の読み取りモデルを DataFrame のバッチにする（列は TransactionRecord の順）"""
+    records = iter(records)
+    while batch := list(islice(records, _FRAME_BATCH_SIZE)):
+        yield pl.DataFrame(
+            batch,
+            schema=TransactionRecord._fields,
+            orient="row",
+            infer_schema_length=None,
+        )
+
+
+def ledger_to_frame(entries: Iterable[LedgerEntry]) -> pl.DataFrame:
+    """元帳エントリを DataFrame にする（列は LedgerEntry のフィールド順）"""
+    return pl.DataFrame(
+        [astuple(entry) for entry in entries],
+        schema=_LEDGER_COLUMNS,
+        orient="row",
+        infer_schema_length=None,
+    )
+
+
+def as_frame_reader(repository: TransactionRepository) -> TransactionFrameReader:
+    """リポジトリの DataFrame の読み取りモデル（リポジトリが実装していればそのもの）"""
+    if isinstance(repository, TransactionFrameReader):
+        return repository
+    return RecordFrameReader(repository)
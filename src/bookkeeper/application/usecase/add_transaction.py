@@ -4,23 +4,96 @@ AddTransaction ユースケース
 仕訳を追加する
 """
 
+from typing import Iterable, List
+
 from bookkeeper.domain.entity.transaction import Transaction
 from bookkeeper.domain.repository.transaction_repository import TransactionRepository
+from bookkeeper.domain.vo.chart_of_accounts import ChartOfAccounts
+
+
+class DuplicateTransactionError(ValueError):
+    """同じ内容の仕訳が既にある"""
 
 
 class AddTransactionUseCase:
     """仕訳追加ユースケース"""
 
-    def __init__(self, repository: TransactionRepository):
+    def __init__(
+        self,
+        repository: TransactionRepository,
+        chart: ChartOfAccounts | None = None,
+    ):
         self.repository = repository
+        # 勘定科目を確認する勘定科目表（None なら表にない科目も受け付ける）
+        self.chart = chart
 
-    def execute(self, transaction: Transaction) -> None:
+    def execute(self, transaction: Transaction, allow_duplicates: bool = True) -> None:
         """
         仕訳を追加する
 
         Args:
             transaction: 追加する仕訳エンティティ
+            allow_duplicates: False なら、同じ内容の仕訳が既にある場合は追加しない
+
+        Raises:
+            DuplicateTransactionError: allow_duplicates が False で、
+                同じ内容の仕訳が既にある場合
+            ValueError: 勘定科目表にない科目の場合
         """
-        # エンティティ自体がバリデーションを持っているので、
-        # ここでは単純にリポジトリに保存するだけ
+        # 仕訳の不変条件はエンティティ自体が検証するので、ここでは勘定科目だけを確認する
+        self._check_accounts(transaction)
+        if not allow_duplicates:
+            self._check_duplicates([transaction])
         self.repository.add(transaction)
+
+    def execute_many(
+        self, transactions: Iterable[Transaction], allow_duplicates: bool = True
+    ) -> int:
+        """
+        複数の仕訳を1回の書き込みで追加する
+
+        Args:
+            transactions: 追加する仕訳エンティティ
+            allow_duplicates: False なら、同じ内容の仕訳が既にあるか
+                transactions の中で重なる場合は1件も追加しない
+
+        Returns:
+            追加した件数
+
+        Raises:
+            DuplicateTransactionError: allow_duplicates が False で、
+                同じ内容の仕訳がある場合（1件も追加しない）
+            ValueError: 勘定科目表にない科目の仕訳がある場合（1件も追加しない）
+        """
+        transactions = list(transactions)
+        for transaction in transactions:
+            self._check_accounts(transaction)
+        if not allow_duplicates:
+            self._check_duplicates(transactions)
+        return self.repository.add_many(transactions)
+
+    def _check_accounts(self, transaction: Transaction) -> None:
+        """借方・貸方の勘定科目が勘定科目表にあるかを確認"""
+        if self.chart is not None:
+            self.chart.check(transaction.debit_account)
+            self.chart.check(transaction.credit_account)
+
+    def _check_duplicates(self, transactions: List[Transaction]) -> None:
+        """同じ内容の仕訳が保存済みか、transactions の中で重なっていないかを確認"""
+        duplicates = [
+            transaction
+            for transaction, duplicated in zip(
+                transactions, self.repository.find_duplicates(transactions)
+            )
+            if duplicated
+        ]
+        if not duplicates:
+            return
+        first = duplicates[0]
+        message = (
+            f"同じ内容の仕訳が既にあります: {first.date} {first.debit_account} / "
+            f"{first.credit_account} {first.amount} {first.description}"
+        )
+        if len(duplicates) > 1:
+            message += f"（ほか {len(duplicates) - 1} 件）"
+        raise DuplicateTransactionError(message)
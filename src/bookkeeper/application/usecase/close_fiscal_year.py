@@ -0,0 +1,30 @@
+"""
+CloseFiscalYear ユースケース
+
+会計年度を締め、その年度の仕訳を変更できないようにする
+"""
+
+from bookkeeper.domain.repository.transaction_repository import TransactionRepository
+
+
+class CloseFiscalYearUseCase:
+    """年度締めユースケース"""
+
+    def __init__(self, repository: TransactionRepository):
+        self.repository = repository
+
+    def execute(self, year: int) -> int:
+        """
+        会計年度を締める
+
+        Args:
+            year: 締める会計年度（暦年）
+
+        Returns:
+            締めた年度の仕訳の件数
+
+        Raises:
+            ValueError: 保存形式が年度の締めに対応していない、年度の仕訳がない、
+                または既に締めている場合
+        """
+        return self.repository.close_fiscal_year(year)
@@ -0,0 +1,30 @@
+"""
+ConvertStorage ユースケース
+
+仕訳を別の保存形式のリポジトリへ移す
+"""
+
+from bookkeeper.domain.repository.transaction_repository import TransactionRepository
+
+
+class ConvertStorageUseCase:
+    """保存形式変換ユースケース"""
+
+    def __init__(self, source: TransactionRepository, target: TransactionRepository):
+        self.source = source
+        self.target = target
+
+    def execute(self) -> int:
+        """
+        変換元の全仕訳を変換先に書き込む
+
+        Returns:
+            書き込んだ件数
+
+        Raises:
+            ValueError: 変換先に既に仕訳がある場合
+        """
+        # 重複して書き込まないよう、変換先は空であることを求める
+        if self.target.find_all():
+            raise ValueError("変換先に既に仕訳があります")
+        return self.target.add_many(self.source.find_all())
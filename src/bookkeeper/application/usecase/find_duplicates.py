@@ -0,0 +1,39 @@
+"""
+FindDuplicates ユースケース
+
+同じ内容の仕訳の組を探す
+"""
+
+from datetime import date
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import polars as pl
+
+    from bookkeeper.application.read_model.transaction_frames import (
+        TransactionFrameReader,
+    )
+
+
+class FindDuplicatesUseCase:
+    """重複仕訳検出ユースケース"""
+
+    def __init__(self, frame_reader: "TransactionFrameReader"):
+        self.frame_reader = frame_reader
+
+    def execute(
+        self, start: date | None = None, end: date | None = None
+    ) -> "pl.DataFrame":
+        """
+        期間内で同じ内容（日付・借方科目・貸方科目・金額・摘要）の仕訳の組を探す
+
+        同じ内容の取引が実際に複数あることもあるので、削除はせずに一覧だけを返す
+
+        Args:
+            start: 開始日（省略時は制限しない）
+            end: 終了日（省略時は制限しない）
+
+        Returns:
+            組の番号（group）と仕訳の列の DataFrame（組ごとに追加順）
+        """
+        return self.frame_reader.find_duplicate_frame(start, end)
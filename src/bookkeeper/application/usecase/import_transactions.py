@@ -0,0 +1,155 @@
+"""
+ImportTransactions ユースケース
+
+ファイルから読み込んだ仕訳を一括で取り込む
+"""
+
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Tuple
+
+from pydantic import ValidationError
+
+from bookkeeper.domain.entity.transaction import Transaction
+from bookkeeper.domain.repository.transaction_repository import TransactionRepository
+from bookkeeper.domain.vo.chart_of_accounts import ChartOfAccounts
+
+# 取込行: (行番号, 列名→値)。解析できなかった行は値が None
+ImportRow = Tuple[int, dict[str, Any] | None]
+
+# 取込ファイルから受け付ける列（id はリポジトリが採番する）
+_IMPORT_FIELDS = frozenset(Transaction.model_fields) - {"id"}
+
+
+@dataclass
+class ImportRowError:
+    """取り込めなかった行"""
+
+    line: int
+    message: str
+
+
+@dataclass
+class ImportResult:
+    """取込結果"""
+
+    imported: int = 0
+    errors: List[ImportRowError] = field(default_factory=list)
+
+
+class ImportTransactionsUseCase:
+    """仕訳一括取込ユースケース"""
+
+    def __init__(
+        self,
+        repository: TransactionRepository,
+        chart: ChartOfAccounts | None = None,
+    ):
+        self.repository = repository
+        # 勘定科目を確認する勘定科目表（None なら表にない科目も受け付ける）
+        self.chart = chart
+
+    def execute(
+        self,
+        rows: Iterable[ImportRow],
+        chunk_size: int = 10_000,
+        allow_duplicates: bool = False,
+    ) -> ImportResult:
+        """
+        仕訳を一括で取り込む
+
+        不正な行はエラーとして記録し、残りの行の取込は続行する
+
+        Args:
+            rows: 取込行のイテラブル
+            chunk_size: 1回の書き込みでまとめる行数
+            allow_duplicates: False なら、同じ内容の仕訳が既にある行
+                （同じファイルの前の行を含む）をエラーとして取り込まない
+
+        Returns:
+            取込結果
+        """
+        result = ImportResult()
+        iterator = iter(rows)
+        while chunk := list(islice(iterator, chunk_size)):
+            valid = list(self._validate(chunk, result.errors))
+            if not allow_duplicates:
+                # 前のチャンクは保存済みなので、ファイル内の重なりも保存済みと照合される
+                valid = self._drop_duplicates(valid, result.errors)
+            result.imported += self._save(valid, result.errors)
+        return result
+
+    def _drop_duplicates(
+        self, valid: List[Tuple[int, Transaction]], errors: List[ImportRowError]
+    ) -> List[Tuple[int, Transaction]]:
+        """同じ内容の仕訳が既にある行をエラーに記録して除く"""
+        duplicated = self.repository.find_duplicates([txn for _, txn in valid])
+        kept = []
+        for (line, transaction), is_duplicate in zip(valid, duplicated):
+            if is_duplicate:
+                errors.append(ImportRowError(line, "同じ内容の仕訳が既にあります"))
+            else:
+                kept.append((line, transaction))
+        return kept
+
+    def _save(
+        self, valid: List[Tuple[int, Transaction]], errors: List[ImportRowError]
+    ) -> int:
+        """
+        チャンクを保存し、保存できた件数を返す
+
+        リポジトリが拒否した場合は、拒否した行を特定するため半分ずつに分けて
+        保存し直す（拒否される行が少なければ、書き込みは数十回で済む）
+        """
+        try:
+            return self.repository.add_many(txn for _, txn in valid)
+        except ValueError as e:
+            if len(valid) == 1:
+                errors.append(ImportRowError(valid[0][0], str(e)))
+                return 0
+        middle = len(valid) // 2
+        return self._save(valid[:middle], errors) + self._save(valid[middle:], errors)
+
+    def _validate(
+        self, chunk: List[ImportRow], errors: List[ImportRowError]
+    ) -> Iterator[Tuple[int, Transaction]]:
+        """行をTransactionに変換し、失敗した行はエラーに記録"""
+        for line, row in chunk:
+            if row is None:
+                errors.append(ImportRowError(line, "行を解析できません"))
+                continue
+            try:
+                transaction = Transaction(**_normalize_row(row))
+            except ValidationError as e:
+                errors.append(ImportRowError(line, _format_validation_error(e)))
+                continue
+            if self.chart is not None:
+                # 表にない科目の確認は辞書の参照だけで済む（候補は科目名ごとに1回だけ探す）
+                try:
+                    self.chart.check(transaction.debit_account)
+                    self.chart.check(transaction.credit_account)
+                except ValueError as e:
+                    errors.append(ImportRowError(line, str(e)))
+                    continue
+            yield line, transaction
+
+
+def _normalize_row(row: dict[str, Any]) -> dict[str, Any]:
+    """空欄を除き、貸方金額が空欄なら借方金額と同額にする"""
+    normalized = {
+        key: value
+        for key, value in row.items()
+        if key in _IMPORT_FIELDS and value not in (None, "")
+    }
+    if "credit_amount" not in normalized and "debit_amount" in normalized:
+        normalized["credit_amount"] = normalized["debit_amount"]
+    return normalized
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    """ValidationErrorを1行のメッセージにまとめる"""
+    messages = []
+    for detail in error.errors():
+        location = ".".join(str(loc) for loc in detail["loc"])
+        messages.append(f"{location}: {detail['msg']}" if location else detail["msg"])
+    return "; ".join(messages)
@@ -4,23 +4,74 @@ ListJournal ユースケース
 仕訳帳（全仕訳）を取得する
 """
 
-from typing import List
+from datetime import date
+from typing import TYPE_CHECKING, Iterator
 
-from bookkeeper.domain.entity.transaction import Transaction
+from bookkeeper.domain.entity.transaction_record import TransactionRecord
 from bookkeeper.domain.repository.transaction_repository import TransactionRepository
 
+if TYPE_CHECKING:
+    import polars as pl
+
+    from bookkeeper.application.read_model.transaction_frames import (
+        TransactionFrameReader,
+    )
+
 
 class ListJournalUseCase:
     """仕訳帳取得ユースケース"""
 
-    def __init__(self, repository: TransactionRepository):
+    def __init__(
+        self,
+        repository: TransactionRepository,
+        frame_reader: "TransactionFrameReader",
+    ):
         self.repository = repository
+        # DataFrame で読み出す読み取りモデル（execute_frames で使う）
+        self.frame_reader = frame_reader
+
+    def execute(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> Iterator[TransactionRecord]:
+        """
+        期間内の仕訳を追加順に1件ずつ取得する
+
+        全件をリストにせず順に返すので、大量の仕訳でもメモリ使用量は一定。
+        表示用なので、pydantic のエンティティではなく軽量な読み取りモデルで返す
 
-    def execute(self) -> List[Transaction]:
+        Args:
+            start: 期間の開始日（省略時は制限しない）
+            end: 期間の終了日（省略時は制限しない）
+            offset: 先頭から飛ばす件数
+            limit: 取得する最大件数（省略時は制限しない）
+
+        Returns:
+            仕訳（読み取りモデル）のイテレータ
         """
-        全ての仕訳を取得する
+        # 期間の絞り込みと分割読み込みはリポジトリ側で行う
+        return self.repository.iter_all(start, end, offset, limit)
+
+    def execute_frames(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> Iterator["pl.DataFrame"]:
+        """
+        execute と同じ仕訳を DataFrame のバッチで取得（列単位で整形・書き出しする場合）
+
+        Args:
+            start: 期間の開始日（省略時は制限しない）
+            end: 期間の終了日（省略時は制限しない）
+            offset: 先頭から飛ばす件数
+            limit: 取得する最大件数（省略時は制限しない）
 
         Returns:
-            仕訳のリスト
+            仕訳のバッチ（列は TransactionRecord のフィールド順）のイテレータ
         """
-        return self.repository.find_all()
+        return self.frame_reader.iter_frames(start, end, offset, limit)
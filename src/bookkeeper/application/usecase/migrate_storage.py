@@ -0,0 +1,18 @@
+"""
+MigrateStorage ユースケース
+
+保存済みの仕訳を現在の保存形式に移行する
+"""
+
+from bookkeeper.domain.repository.transaction_repository import TransactionRepository
+
+
+class MigrateStorageUseCase:
+    """保存形式移行ユースケース"""
+
+    def __init__(self, repository: TransactionRepository):
+        self.repository = repository
+
+    def execute(self) -> None:
+        """保存済みの仕訳を現在の保存形式で書き直す"""
+        self.repository.migrate()
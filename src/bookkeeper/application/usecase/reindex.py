@@ -0,0 +1,31 @@
+"""
+Reindex ユースケース
+
+集計用の索引を作り直す、または全件の再計算と照合する
+"""
+
+from typing import List
+
+from bookkeeper.domain.repository.transaction_repository import TransactionRepository
+
+
+class ReindexUseCase:
+    """索引再構築ユースケース"""
+
+    def __init__(self, repository: TransactionRepository):
+        self.repository = repository
+
+    def execute(self, check_only: bool = False) -> List[str]:
+        """
+        索引を作り直す
+
+        Args:
+            check_only: True なら作り直さず、全件の再計算との照合だけを行う
+
+        Returns:
+            照合で見つかった不一致の内容（作り直した場合は空）
+        """
+        if check_only:
+            return self.repository.verify_indexes()
+        self.repository.rebuild_indexes()
+        return []
@@ -0,0 +1,38 @@
+"""
+ViewBalanceSheet ユースケース
+
+貸借対照表を取得する
+"""
+
+from datetime import date
+
+from bookkeeper.domain.repository.transaction_repository import TransactionRepository
+from bookkeeper.domain.service.report_service import BalanceSheet, ReportService
+from bookkeeper.domain.vo.chart_of_accounts import ChartOfAccounts
+
+
+class ViewBalanceSheetUseCase:
+    """貸借対照表表示ユースケース"""
+
+    def __init__(
+        self,
+        repository: TransactionRepository,
+        chart: ChartOfAccounts | None = None,
+    ):
+        self.repository = repository
+        # 勘定科目の種類を引く勘定科目表
+        self.chart = chart if chart is not None else ChartOfAccounts.default()
+
+    def execute(self, as_of: date | None = None) -> BalanceSheet:
+        """
+        指定日時点の貸借対照表を取得
+
+        Args:
+            as_of: 基準日（省略時は全期間）
+
+        Returns:
+            貸借対照表
+        """
+        # 残高は期首からの累計なので開始日は指定しない
+        totals = self.repository.summarize_by_account(None, as_of)
+        return ReportService.balance_sheet(totals, self.chart)
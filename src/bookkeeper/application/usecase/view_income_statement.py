@@ -0,0 +1,40 @@
+"""
+ViewIncomeStatement ユースケース
+
+損益計算書を取得する
+"""
+
+from datetime import date
+
+from bookkeeper.domain.repository.transaction_repository import TransactionRepository
+from bookkeeper.domain.service.report_service import IncomeStatement, ReportService
+from bookkeeper.domain.vo.chart_of_accounts import ChartOfAccounts
+
+
+class ViewIncomeStatementUseCase:
+    """損益計算書表示ユースケース"""
+
+    def __init__(
+        self,
+        repository: TransactionRepository,
+        chart: ChartOfAccounts | None = None,
+    ):
+        self.repository = repository
+        # 勘定科目の種類を引く勘定科目表
+        self.chart = chart if chart is not None else ChartOfAccounts.default()
+
+    def execute(
+        self, start: date | None = None, end: date | None = None
+    ) -> IncomeStatement:
+        """
+        期間内の損益計算書を取得
+
+        Args:
+            start: 期間の開始日
+            end: 期間の終了日
+
+        Returns:
+            損益計算書
+        """
+        totals = self.repository.summarize_by_account(start, end)
+        return ReportService.income_statement(totals, self.chart)
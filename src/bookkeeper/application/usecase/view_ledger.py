@@ -4,31 +4,83 @@ ViewLedger ユースケース
 指定した勘定科目の元帳を取得する
 """
 
-from typing import List
+from datetime import date
+from typing import TYPE_CHECKING, Dict, List, Sequence
 
 from bookkeeper.domain.repository.transaction_repository import TransactionRepository
-from bookkeeper.domain.service.ledger_service import LedgerService, LedgerEntry
+from bookkeeper.domain.service.ledger_service import LedgerEntry
+
+if TYPE_CHECKING:
+    import polars as pl
+
+    from bookkeeper.application.read_model.transaction_frames import (
+        TransactionFrameReader,
+    )
 
 
 class ViewLedgerUseCase:
     """元帳表示ユースケース"""
 
-    def __init__(self, repository: TransactionRepository):
+    def __init__(
+        self,
+        repository: TransactionRepository,
+        frame_reader: "TransactionFrameReader",
+    ):
         self.repository = repository
-        self.ledger_service = LedgerService()
+        # DataFrame で読み出す読み取りモデル（execute_frame / execute_all で使う）
+        self.frame_reader = frame_reader
 
-    def execute(self, account_name: str) -> List[LedgerEntry]:
+    def execute(
+        self, account_name: str, start: date | None = None, end: date | None = None
+    ) -> List[LedgerEntry]:
         """
         指定した勘定科目の元帳を取得
 
         Args:
             account_name: 勘定科目名
+            start: 期間の開始日（それより前の増減は繰越残高に含める）
+            end: 期間の終了日
 
         Returns:
             元帳エントリのリスト
         """
-        # 全仕訳を取得
-        transactions = self.repository.find_all()
+        # 絞り込みと残高計算はリポジトリ側でまとめて行う
+        return self.repository.find_ledger(account_name, start, end)
+
+    def execute_frame(
+        self, account_name: str, start: date | None = None, end: date | None = None
+    ) -> "pl.DataFrame":
+        """
+        指定した勘定科目の元帳を DataFrame で取得（列単位で整形・書き出しする場合）
+
+        Args:
+            account_name: 勘定科目名
+            start: 期間の開始日（それより前の増減は繰越残高に含める）
+            end: 期間の終了日
+
+        Returns:
+            元帳（列は LedgerEntry のフィールド順）
+        """
+        return self.frame_reader.find_ledger_frame(account_name, start, end)
+
+    def execute_all(
+        self,
+        account_names: Sequence[str],
+        start: date | None = None,
+        end: date | None = None,
+    ) -> Dict[str, "pl.DataFrame"]:
+        """
+        複数の勘定科目の元帳を DataFrame でまとめて取得（決算時の一括出力など）
 
-        # 元帳を生成
-        return self.ledger_service.generate_ledger(transactions, account_name)
+        Args:
+            account_names: 勘定科目名（全ての元帳なら勘定科目表の全ての科目）
+            start: 期間の開始日（それより前の増減は繰越残高に含める）
+            end: 期間の終了日
+
+        Returns:
+            勘定科目名から元帳（列は LedgerEntry のフィールド順）への辞書
+            （account_names の順。取引のない勘定科目は空の DataFrame）
+        """
+        # 全件の読み込みは1回だけにし、勘定科目ごとの残高計算は読み取りモデル側で
+        # まとめて行う
+        return self.frame_reader.find_ledger_frames(account_names, start, end)
@@ -0,0 +1,42 @@
+"""
+ViewTrialBalance ユースケース
+
+試算表を取得する
+"""
+
+from datetime import date
+from typing import List
+
+from bookkeeper.domain.repository.transaction_repository import TransactionRepository
+from bookkeeper.domain.service.report_service import ReportService, TrialBalanceRow
+from bookkeeper.domain.vo.chart_of_accounts import ChartOfAccounts
+
+
+class ViewTrialBalanceUseCase:
+    """試算表表示ユースケース"""
+
+    def __init__(
+        self,
+        repository: TransactionRepository,
+        chart: ChartOfAccounts | None = None,
+    ):
+        self.repository = repository
+        # 勘定科目の種類を引く勘定科目表
+        self.chart = chart if chart is not None else ChartOfAccounts.default()
+
+    def execute(
+        self, start: date | None = None, end: date | None = None
+    ) -> List[TrialBalanceRow]:
+        """
+        期間内の試算表を取得
+
+        Args:
+            start: 期間の開始日
+            end: 期間の終了日
+
+        Returns:
+            試算表の行のリスト
+        """
+        # 勘定科目別の集計はリポジトリ側で1回の走査で行う
+        totals = self.repository.summarize_by_account(start, end)
+        return ReportService.trial_balance(totals, self.chart)
@@ -1,5 +1,17 @@
 from .di import (
+    STORAGE_BACKENDS,
+    get_chart_of_accounts,
+    get_frame_cache_stats,
     init_add_transaction_usecase,
+    init_close_fiscal_year_usecase,
+    init_convert_storage_usecase,
+    init_find_duplicates_usecase,
+    init_import_transactions_usecase,
     init_list_journal_usecase,
+    init_migrate_storage_usecase,
+    init_reindex_usecase,
+    init_view_balance_sheet_usecase,
+    init_view_income_statement_usecase,
     init_view_ledger_usecase,
+    init_view_trial_balance_usecase,
 )
@@ -1,38 +1,282 @@
 """
 依存性注入（DI）モジュール
 
-各ユースケースの初期化を行うファクトリ関数を提供
+各ユースケースの初期化を行うファクトリ関数を提供。
+起動を速くするため、ユースケースとリポジトリの実装（polars / pydantic を読み込む）は
+ファクトリ関数の中で import する
 """
 
-from bookkeeper.application.usecase.add_transaction import AddTransactionUseCase
-from bookkeeper.application.usecase.list_journal import ListJournalUseCase
-from bookkeeper.application.usecase.view_ledger import ViewLedgerUseCase
-from bookkeeper.domain.repository.transaction_repository import TransactionRepository
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, TypeVar
+
+from bookkeeper.common.profiling import instrument, is_enabled
 from bookkeeper.infrastructure.config.settings import settings
-from bookkeeper.infrastructure.repository.csv_transaction_repository import (
-    CsvTransactionRepository,
-)
+
+if TYPE_CHECKING:
+    from bookkeeper.application.read_model.transaction_frames import (
+        TransactionFrameReader,
+    )
+    from bookkeeper.application.usecase.add_transaction import AddTransactionUseCase
+    from bookkeeper.application.usecase.close_fiscal_year import (
+        CloseFiscalYearUseCase,
+    )
+    from bookkeeper.application.usecase.convert_storage import ConvertStorageUseCase
+    from bookkeeper.application.usecase.find_duplicates import FindDuplicatesUseCase
+    from bookkeeper.application.usecase.import_transactions import (
+        ImportTransactionsUseCase,
+    )
+    from bookkeeper.application.usecase.list_journal import ListJournalUseCase
+    from bookkeeper.application.usecase.migrate_storage import MigrateStorageUseCase
+    from bookkeeper.application.usecase.reindex import ReindexUseCase
+    from bookkeeper.application.usecase.view_balance_sheet import (
+        ViewBalanceSheetUseCase,
+    )
+    from bookkeeper.application.usecase.view_income_statement import (
+        ViewIncomeStatementUseCase,
+    )
+    from bookkeeper.application.usecase.view_ledger import ViewLedgerUseCase
+    from bookkeeper.application.usecase.view_trial_balance import (
+        ViewTrialBalanceUseCase,
+    )
+    from bookkeeper.domain.repository.transaction_repository import (
+        TransactionRepository,
+    )
+    from bookkeeper.domain.vo.chart_of_accounts import ChartOfAccounts
+    from bookkeeper.infrastructure.repository.frame_cache import (
+        CacheStats,
+        FrameCache,
+    )
+
+T = TypeVar("T")
+
+# 選択できる保存形式
+STORAGE_BACKENDS = ("csv", "ipc", "sqlite", "partitioned")
+
+# 解析済み仕訳のプロセス内キャッシュ（同じプロセスで作るリポジトリ間で共有する）
+_frame_cache: FrameCache | None = None
+
+# 勘定科目表（設定ファイルは初めて使うときに1回だけ読む）
+_chart_of_accounts: ChartOfAccounts | None = None
+
+
+def _shared_frame_cache() -> FrameCache:
+    """プロセス内で共有するキャッシュ（初めて使うときに作る）"""
+    global _frame_cache
+    if _frame_cache is None:
+        from bookkeeper.infrastructure.repository.frame_cache import FrameCache
+
+        _frame_cache = FrameCache(settings.FRAME_CACHE_MAX_MB * 1024 * 1024)
+    return _frame_cache
+
+
+def _get_frame_cache() -> FrameCache | None:
+    """Polars 系リポジトリに渡すキャッシュ（設定で無効なら None）"""
+    return _shared_frame_cache() if settings.FRAME_CACHE_MAX_MB > 0 else None
+
+
+def get_frame_cache_stats() -> CacheStats:
+    """解析済み仕訳キャッシュのヒット・ミス数などを取得"""
+    return _shared_frame_cache().stats
+
+
+def get_chart_of_accounts() -> ChartOfAccounts:
+    """
+    設定ファイルの勘定科目を加えた勘定科目表
+
+    Raises:
+        ValueError: 設定ファイルが不正な場合
+    """
+    global _chart_of_accounts
+    if _chart_of_accounts is None:
+        from bookkeeper.infrastructure.config.account_config import (
+            load_chart_of_accounts,
+        )
+
+        _chart_of_accounts = load_chart_of_accounts(settings.ACCOUNTS_FILE)
+    return _chart_of_accounts
 
 
-def _get_transaction_repository() -> TransactionRepository:
-    """TransactionRepositoryの実装を取得"""
+def _get_account_checker() -> ChartOfAccounts | None:
+    """追加・取込で勘定科目を確認する勘定科目表（設定で無効なら None）"""
+    return get_chart_of_accounts() if settings.STRICT_ACCOUNTS else None
+
+
+def _profiled(obj: T) -> T:
+    """計測中なら公開メソッドの呼び出しを区間として記録するようにする"""
+    return instrument(obj) if is_enabled() else obj
+
+
+def _get_transaction_repository(backend: str | None = None) -> TransactionRepository:
+    """TransactionRepositoryの実装を取得（省略時は設定の保存形式）"""
+    return _profiled(_create_transaction_repository(backend))
+
+
+def _create_transaction_repository(backend: str | None) -> TransactionRepository:
+    """設定に従って TransactionRepository の実装を作る"""
     settings.ensure_data_dir()
-    return CsvTransactionRepository(settings.TRANSACTIONS_CSV)
+    backend = backend or settings.STORAGE_BACKEND
+    # 使う保存形式の実装だけを読み込む
+    if backend == "csv":
+        from bookkeeper.infrastructure.repository.csv_transaction_repository import (
+            CsvTransactionRepository,
+        )
+
+        return CsvTransactionRepository(
+            settings.TRANSACTIONS_CSV,
+            amount_scale=settings.AMOUNT_SCALE,
+            frame_cache=_get_frame_cache(),
+            use_parse_cache=settings.PARSE_CACHE,
+            use_row_index=settings.CSV_ROW_INDEX,
+        )
+    if backend == "ipc":
+        from bookkeeper.infrastructure.repository.ipc_transaction_repository import (
+            IpcTransactionRepository,
+        )
+
+        return IpcTransactionRepository(
+            settings.TRANSACTIONS_IPC,
+            amount_scale=settings.AMOUNT_SCALE,
+            frame_cache=_get_frame_cache(),
+        )
+    if backend == "sqlite":
+        from bookkeeper.infrastructure.repository.sqlite_transaction_repository import (
+            SqliteTransactionRepository,
+        )
+
+        return SqliteTransactionRepository(
+            settings.TRANSACTIONS_DB, amount_scale=settings.AMOUNT_SCALE
+        )
+    if backend == "partitioned":
+        from bookkeeper.infrastructure.repository import (
+            partitioned_transaction_repository as partitioned,
+        )
+
+        return partitioned.PartitionedTransactionRepository(
+            settings.TRANSACTIONS_PARTITIONS,
+            amount_scale=settings.AMOUNT_SCALE,
+            frame_cache=_get_frame_cache(),
+            use_parse_cache=settings.PARSE_CACHE,
+            use_row_index=settings.CSV_ROW_INDEX,
+        )
+    raise ValueError(f"未対応の保存形式です: {backend}")
 
 
 def init_add_transaction_usecase() -> AddTransactionUseCase:
     """AddTransactionUseCaseを初期化"""
+    from bookkeeper.application.usecase.add_transaction import AddTransactionUseCase
+
+    repository = _get_transaction_repository()
+    return _profiled(AddTransactionUseCase(repository, _get_account_checker()))
+
+
+def init_import_transactions_usecase() -> ImportTransactionsUseCase:
+    """ImportTransactionsUseCaseを初期化"""
+    from bookkeeper.application.usecase.import_transactions import (
+        ImportTransactionsUseCase,
+    )
+
     repository = _get_transaction_repository()
-    return AddTransactionUseCase(repository)
+    return _profiled(ImportTransactionsUseCase(repository, _get_account_checker()))
+
+
+def _get_frame_reader(repository: TransactionRepository) -> TransactionFrameReader:
+    """仕訳帳・元帳・重複の組を DataFrame で読み出す読み取りモデル"""
+    from bookkeeper.application.read_model.transaction_frames import (
+        as_frame_reader,
+    )
+
+    reader = as_frame_reader(repository)
+    # Polars ベースの実装はリポジトリ自身が読み取りモデルを兼ねる（計測も済んでいる）
+    return reader if reader is repository else _profiled(reader)
 
 
 def init_list_journal_usecase() -> ListJournalUseCase:
     """ListJournalUseCaseを初期化"""
+    from bookkeeper.application.usecase.list_journal import ListJournalUseCase
+
     repository = _get_transaction_repository()
-    return ListJournalUseCase(repository)
+    return _profiled(ListJournalUseCase(repository, _get_frame_reader(repository)))
 
 
 def init_view_ledger_usecase() -> ViewLedgerUseCase:
     """ViewLedgerUseCaseを初期化"""
+    from bookkeeper.application.usecase.view_ledger import ViewLedgerUseCase
+
+    repository = _get_transaction_repository()
+    return _profiled(ViewLedgerUseCase(repository, _get_frame_reader(repository)))
+
+
+def init_find_duplicates_usecase() -> FindDuplicatesUseCase:
+    """FindDuplicatesUseCaseを初期化"""
+    from bookkeeper.application.usecase.find_duplicates import FindDuplicatesUseCase
+
+    repository = _get_transaction_repository()
+    return _profiled(FindDuplicatesUseCase(_get_frame_reader(repository)))
+
+
+def init_view_trial_balance_usecase() -> ViewTrialBalanceUseCase:
+    """ViewTrialBalanceUseCaseを初期化"""
+    from bookkeeper.application.usecase.view_trial_balance import (
+        ViewTrialBalanceUseCase,
+    )
+
+    repository = _get_transaction_repository()
+    return _profiled(ViewTrialBalanceUseCase(repository, get_chart_of_accounts()))
+
+
+def init_view_income_statement_usecase() -> ViewIncomeStatementUseCase:
+    """ViewIncomeStatementUseCaseを初期化"""
+    from bookkeeper.application.usecase.view_income_statement import (
+        ViewIncomeStatementUseCase,
+    )
+
+    repository = _get_transaction_repository()
+    return _profiled(ViewIncomeStatementUseCase(repository, get_chart_of_accounts()))
+
+
+def init_view_balance_sheet_usecase() -> ViewBalanceSheetUseCase:
+    """ViewBalanceSheetUseCaseを初期化"""
+    from bookkeeper.application.usecase.view_balance_sheet import (
+        ViewBalanceSheetUseCase,
+    )
+
     repository = _get_transaction_repository()
-    return ViewLedgerUseCase(repository)
+    return _profiled(ViewBalanceSheetUseCase(repository, get_chart_of_accounts()))
+
+
+def init_migrate_storage_usecase() -> MigrateStorageUseCase:
+    """MigrateStorageUseCaseを初期化"""
+    from bookkeeper.application.usecase.migrate_storage import MigrateStorageUseCase
+
+    repository = _get_transaction_repository()
+    return _profiled(MigrateStorageUseCase(repository))
+
+
+def init_reindex_usecase() -> ReindexUseCase:
+    """ReindexUseCaseを初期化"""
+    from bookkeeper.application.usecase.reindex import ReindexUseCase
+
+    repository = _get_transaction_repository()
+    return _profiled(ReindexUseCase(repository))
+
+
+def init_close_fiscal_year_usecase() -> CloseFiscalYearUseCase:
+    """CloseFiscalYearUseCaseを初期化"""
+    from bookkeeper.application.usecase.close_fiscal_year import (
+        CloseFiscalYearUseCase,
+    )
+
+    repository = _get_transaction_repository()
+    return _profiled(CloseFiscalYearUseCase(repository))
+
+
+def init_convert_storage_usecase(source: str, target: str) -> ConvertStorageUseCase:
+    """ConvertStorageUseCaseを初期化"""
+    from bookkeeper.application.usecase.convert_storage import ConvertStorageUseCase
+
+    return _profiled(
+        ConvertStorageUseCase(
+            _get_transaction_repository(source), _get_transaction_repository(target)
+        )
+    )
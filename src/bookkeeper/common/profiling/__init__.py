@@ -0,0 +1,13 @@
+from .profiling import (
+    Profiler,
+    Span,
+    add_bytes,
+    add_rows,
+    disable,
+    enable,
+    finish,
+    instrument,
+    instrument_functions,
+    is_enabled,
+    span,
+)
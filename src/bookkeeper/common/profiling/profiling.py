@@ -0,0 +1,225 @@
+"""
+処理時間の計測
+
+ユースケース・リポジトリ・フォーマッターの呼び出しを区間として入れ子に記録し、
+区間ごとの回数・経過時間・CPU 時間・行数・読み込んだバイト数を集計する。
+計測していないときの span() などは何もしない
+"""
+
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from functools import wraps
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+_NULL_SPAN = nullcontext()
+
+
+@dataclass
+class Span:
+    """区間の集計（同じ呼び出し経路の区間は1つにまとめる）"""
+
+    name: str
+    calls: int = 0
+    wall: float = 0.0  # 経過時間（秒）
+    # プロセスの CPU 時間（秒、Polars のスレッドを含む。イテレータの取り出しは含まない）
+    cpu: float = 0.0
+    rows: int = 0
+    bytes_read: int = 0
+    children: Dict[str, "Span"] = field(default_factory=dict)
+
+    @property
+    def self_wall(self) -> float:
+        """子の区間を除いた経過時間（秒）"""
+        return self.wall - sum(child.wall for child in self.children.values())
+
+    def to_dict(self) -> dict:
+        """JSON に書き出せる形にする"""
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "wall_seconds": self.wall,
+            "self_seconds": self.self_wall,
+            "cpu_seconds": self.cpu,
+            "rows": self.rows,
+            "bytes_read": self.bytes_read,
+            "children": [child.to_dict() for child in self.children.values()],
+        }
+
+
+class Profiler:
+    """区間の記録先（1つのスレッドから使う）"""
+
+    def __init__(self, name: str = "全体"):
+        self.root = Span(name)
+        self._stack: List[Span] = [self.root]
+        self._started = (time.perf_counter(), time.process_time())
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[Span]:
+        """現在の区間の子として区間を記録する"""
+        node = self._child(name)
+        self._stack.append(node)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield node
+        finally:
+            node.wall += time.perf_counter() - wall
+            node.cpu += time.process_time() - cpu
+            node.calls += 1
+            self._stack.pop()
+
+    def iterate(self, name: str, iterator: Iterator) -> Iterator:
+        """
+        取り出すたびに現在の区間の子として区間を記録し、件数を数えるイテレータ
+
+        1件ごとに呼ばれるので、コンテキストマネージャを使わず経過時間だけを記録する
+        （CPU 時間を取る呼び出しは経過時間の数倍かかる）
+        """
+        stack = self._stack
+        while True:
+            node = self._child(name)
+            stack.append(node)
+            started = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                node.wall += time.perf_counter() - started
+                stack.pop()
+            node.rows += 1
+            yield item
+
+    def _child(self, name: str) -> Span:
+        """現在の区間の子の区間（なければ作る）"""
+        children = self._stack[-1].children
+        node = children.get(name)
+        if node is None:
+            node = children[name] = Span(name)
+        return node
+
+    def finish(self) -> Span:
+        """全体の時間を確定して、区間の木を返す"""
+        wall, cpu = self._started
+        self.root.wall = time.perf_counter() - wall
+        self.root.cpu = time.process_time() - cpu
+        self.root.calls = 1
+        return self.root
+
+    @property
+    def current(self) -> Span:
+        """記録中の最も内側の区間"""
+        return self._stack[-1]
+
+
+# 計測中の記録先（計測していなければ None）
+_profiler: Profiler | None = None
+
+
+def enable(name: str = "全体") -> Profiler:
+    """計測を始める"""
+    global _profiler
+    _profiler = Profiler(name)
+    return _profiler
+
+
+def disable() -> None:
+    """計測をやめる"""
+    global _profiler
+    _profiler = None
+
+
+def finish() -> Span:
+    """全体の時間を確定して、計測中の区間の木を返す（計測していなければ空の木）"""
+    if _profiler is None:
+        return Span("全体")
+    return _profiler.finish()
+
+
+def is_enabled() -> bool:
+    """計測中かどうか"""
+    return _profiler is not None
+
+
+def span(name: str):
+    """区間を記録するコンテキストマネージャ（計測していなければ何もしない）"""
+    if _profiler is None:
+        return _NULL_SPAN
+    return _profiler.span(name)
+
+
+def add_rows(rows: int) -> None:
+    """記録中の区間で扱った行数を加える"""
+    if _profiler is not None:
+        _profiler.current.rows += rows
+
+
+def add_bytes(size: int) -> None:
+    """記録中の区間で読み込んだバイト数を加える"""
+    if _profiler is not None:
+        _profiler.current.bytes_read += size
+
+
+def instrument(obj: Any, methods: Iterable[str] | None = None) -> Any:
+    """
+    オブジェクトの公開メソッドを、呼び出しを区間として記録するものに置き換える
+
+    区間名は「クラス名.メソッド名」。戻り値がリストなら件数を行数とし、
+    イテレータなら取り出すたびに区間を記録して件数を数える
+
+    Args:
+        obj: 対象のオブジェクト（インスタンスの属性として置き換える）
+        methods: 対象のメソッド名（省略時は _ で始まらない全てのメソッド）
+
+    Returns:
+        obj（そのまま）
+    """
+    cls = type(obj)
+    if methods is None:
+        methods = [
+            name
+            for name in dir(cls)
+            if not name.startswith("_") and callable(getattr(cls, name))
+        ]
+    for name in methods:
+        setattr(obj, name, _timed(f"{cls.__name__}.{name}", getattr(obj, name)))
+    return obj
+
+
+def instrument_functions(namespace: ModuleType | type, names: Iterable[str]) -> None:
+    """
+    モジュールの関数・クラスの静的メソッドを、呼び出しを区間として記録するものに置き換える
+
+    区間名は「モジュール名.関数名」または「クラス名.メソッド名」
+    """
+    if isinstance(namespace, ModuleType):
+        prefix = namespace.__name__.rsplit(".", 1)[-1]
+    else:
+        prefix = namespace.__name__
+    for name in names:
+        function = getattr(namespace, name)
+        if getattr(function, "_profiled", False):
+            continue
+        timed = _timed(f"{prefix}.{name}", function)
+        if isinstance(namespace, type):
+            timed = staticmethod(timed)
+        setattr(namespace, name, timed)
+
+
+def _timed(name: str, function: Callable) -> Callable:
+    """呼び出しを区間として記録する関数にする"""
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        with span(name):
+            result = function(*args, **kwargs)
+            if isinstance(result, (list, tuple)):
+                add_rows(len(result))
+        if isinstance(result, Iterator) and _profiler is not None:
+            return _profiler.iterate(name, result)
+        return result
+
+    wrapper._profiled = True
+    return wrapper
@@ -71,3 +71,14 @@ class Transaction(BaseModel):
     def amount(self) -> Decimal:
         """取引金額（借方・貸方は同額なので、どちらかを返す）"""
         return self.debit_amount
+
+    @property
+    def content_key(self) -> tuple:
+        """同じ内容かを判定するキー（日付・借方科目・貸方科目・金額・摘要）"""
+        return (
+            self.date,
+            self.debit_account,
+            self.credit_account,
+            self.amount,
+            self.description,
+        )
@@ -0,0 +1,52 @@
+"""
+TransactionRecord 読み取りモデル
+
+保存済み（検証済み）の仕訳を仕訳帳の表示などに使うための軽量な表現。
+追加時の検証は Transaction エンティティが担い、読み出しではこちらを使う
+"""
+
+from datetime import date
+from decimal import Decimal
+from typing import NamedTuple
+
+from bookkeeper.domain.entity.transaction import Transaction
+
+
+class TransactionRecord(NamedTuple):
+    """
+    保存済みの仕訳（読み取り専用）
+
+    不変条件は保存時・読み込み時に検証済みなので、生成時には検証しない。
+    タプルなので Transaction（pydantic）より1件あたりのメモリが小さく、
+    行のタプルからそのまま生成できる
+    """
+
+    id: str | None  # 保存されている UUID の文字列
+    date: date
+    debit_account: str
+    debit_amount: Decimal
+    credit_account: str
+    credit_amount: Decimal
+    description: str
+    note: str = ""
+    evidence_path: str = ""
+
+    @property
+    def amount(self) -> Decimal:
+        """取引金額（借方・貸方は同額なので、どちらかを返す）"""
+        return self.debit_amount
+
+    @classmethod
+    def from_transaction(cls, transaction: Transaction) -> "TransactionRecord":
+        """Transactionエンティティから生成"""
+        return cls(
+            id=None if transaction.id is None else str(transaction.id),
+            date=transaction.date,
+            debit_account=transaction.debit_account,
+            debit_amount=transaction.debit_amount,
+            credit_account=transaction.credit_account,
+            credit_amount=transaction.credit_amount,
+            description=transaction.description,
+            note=transaction.note,
+            evidence_path=transaction.evidence_path,
+        )
@@ -5,9 +5,14 @@ TransactionRepository インターフェース
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import date
+from itertools import islice
+from typing import Iterable, Iterator, List, Sequence
 
 from bookkeeper.domain.entity.transaction import Transaction
+from bookkeeper.domain.entity.transaction_record import TransactionRecord
+from bookkeeper.domain.service.ledger_service import LedgerEntry, LedgerService
+from bookkeeper.domain.service.report_service import AccountTotal, ReportService
 
 
 class TransactionRepository(ABC):
@@ -19,11 +24,115 @@ class TransactionRepository(ABC):
         pass
 
     @abstractmethod
-    def find_all(self) -> List[Transaction]:
-        """全ての仕訳を取得"""
+    def add_many(self, transactions: Iterable[Transaction]) -> int:
+        """複数の仕訳を一括で追加し、追加した件数を返す"""
         pass
 
     @abstractmethod
-    def find_by_account(self, account_name: str) -> List[Transaction]:
-        """指定した勘定科目を含む仕訳を取得"""
+    def find_all(
+        self, start: date | None = None, end: date | None = None
+    ) -> List[Transaction]:
+        """期間内の全ての仕訳を取得（指定のない側は制限しない）"""
         pass
+
+    @abstractmethod
+    def find_by_account(
+        self, account_name: str, start: date | None = None, end: date | None = None
+    ) -> List[Transaction]:
+        """期間内の指定した勘定科目を含む仕訳を取得（指定のない側は制限しない）"""
+        pass
+
+    def find_duplicates(self, transactions: Sequence[Transaction]) -> List[bool]:
+        """
+        各仕訳と同じ内容（content_key）の仕訳が、保存済みか transactions の
+        前の方にあるかを判定
+
+        既定では保存済みの全件を読み、内容のキーの集合と照合する。
+        全件を読まずに照合できる実装はオーバーライドすること
+        """
+        seen = {transaction.content_key for transaction in self.find_all()}
+        duplicated = []
+        for transaction in transactions:
+            key = transaction.content_key
+            duplicated.append(key in seen)
+            seen.add(key)
+        return duplicated
+
+    def iter_all(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> Iterator[TransactionRecord]:
+        """
+        期間内の仕訳を追加順に1件ずつ返す（offset 件を飛ばし、最大 limit 件）
+
+        表示などの読み出し用なので、エンティティではなく読み取りモデルで返す。
+
+        既定では find_all の結果を切り出す。全件をメモリに載せずに
+        分割して読める実装はオーバーライドすること
+        """
+        stop = None if limit is None else offset + limit
+        transactions = islice(self.find_all(start, end), offset, stop)
+        return map(TransactionRecord.from_transaction, transactions)
+
+    def find_ledger(
+        self, account_name: str, start: date | None = None, end: date | None = None
+    ) -> List[LedgerEntry]:
+        """
+        指定した勘定科目の元帳を取得
+
+        start より前の増減は繰越残高として残高に含める。
+        既定では LedgerService で生成する。保存形式側で絞り込みと
+        残高の累計を一括で行える実装はオーバーライドすること
+        """
+        # 繰越残高に start より前の仕訳も必要なので、絞り込むのは終了日だけ
+        return LedgerService.generate_ledger(
+            self.find_by_account(account_name, end=end), account_name, start, end
+        )
+
+    def summarize_by_account(
+        self, start: date | None = None, end: date | None = None
+    ) -> List[AccountTotal]:
+        """
+        期間内の勘定科目別の借方・貸方合計を取得（勘定科目名順）
+
+        既定では ReportService で集計する。保存形式側で一括集計できる
+        実装はオーバーライドすること
+        """
+        return ReportService.summarize(self.find_all(start, end), start, end)
+
+    def migrate(self) -> None:
+        """保存形式を現在の形式に移行（既定では何もしない）"""
+        pass
+
+    def generation(self) -> int | None:
+        """
+        保存済みの仕訳の世代番号（書き込みのたびに増える）
+
+        読み込み結果を保持する側が、その後に変更されたかを判定するのに使う。
+        世代を管理しない実装では None
+        """
+        return None
+
+    def close_fiscal_year(self, year: int) -> int:
+        """
+        会計年度を締め、以後その年度に仕訳を追加できないようにする
+
+        Returns:
+            締めた年度の仕訳の件数
+
+        Raises:
+            ValueError: 保存形式が年度の締めに対応していない、年度の仕訳がない、
+                または既に締めている場合
+        """
+        raise ValueError("この保存形式は年度の締めに対応していません")
+
+    def rebuild_indexes(self) -> None:
+        """集計用の索引を作り直す（既定では何もしない）"""
+        pass
+
+    def verify_indexes(self) -> List[str]:
+        """集計用の索引を全件の再計算と照合し、不一致の内容を返す"""
+        return []
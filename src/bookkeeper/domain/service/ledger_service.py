@@ -4,18 +4,20 @@ LedgerService ドメインサービス
 仕訳帳から各種元帳を生成するビジネスロジック
 """
 
-from typing import List
+from typing import List, Sequence
 from dataclasses import dataclass
+from datetime import date
 from decimal import Decimal
 
 from bookkeeper.domain.entity.transaction import Transaction
+from bookkeeper.domain.entity.transaction_record import TransactionRecord
 
 
-@dataclass
+@dataclass(slots=True)
 class LedgerEntry:
-    """元帳の1行を表すデータ"""
+    """元帳の1行を表すデータ（件数が多いので __slots__ で1件あたりのメモリを抑える）"""
 
-    date: str
+    date: date
     description: str
     debit_amount: Decimal | None  # 借方に現れた場合
     credit_amount: Decimal | None  # 貸方に現れた場合
@@ -27,7 +29,10 @@ class LedgerService:
 
     @staticmethod
     def generate_ledger(
-        transactions: List[Transaction], account_name: str
+        transactions: Sequence[Transaction | TransactionRecord],
+        account_name: str,
+        start: date | None = None,
+        end: date | None = None,
     ) -> List[LedgerEntry]:
         """
         指定した勘定科目の元帳を生成
@@ -35,6 +40,8 @@ class LedgerService:
         Args:
             transactions: 全仕訳のリスト
             account_name: 対象の勘定科目名
+            start: 期間の開始日（この日より前の増減は繰越残高として残高に含める）
+            end: 期間の終了日
 
         Returns:
             元帳エントリのリスト
@@ -42,7 +49,18 @@ class LedgerService:
         ledger_entries = []
         balance = Decimal("0")
 
+        # 期間の開始日より前の仕訳は繰越残高として先に集計する
+        if start is not None:
+            for txn in transactions:
+                if txn.date < start:
+                    balance += LedgerService._movement(txn, account_name)
+
         for txn in transactions:
+            if start is not None and txn.date < start:
+                continue
+            if end is not None and txn.date > end:
+                continue
+
             debit_amt = None
             credit_amt = None
 
@@ -60,7 +78,7 @@ class LedgerService:
             if debit_amt is not None or credit_amt is not None:
                 ledger_entries.append(
                     LedgerEntry(
-                        date=txn.date.isoformat(),
+                        date=txn.date,
                         description=txn.description,
                         debit_amount=debit_amt,
                         credit_amount=credit_amt,
@@ -69,3 +87,13 @@ class LedgerService:
                 )
 
         return ledger_entries
+
+    @staticmethod
+    def _movement(txn: Transaction | TransactionRecord, account_name: str) -> Decimal:
+        """仕訳による勘定科目の増減（借方 - 貸方）"""
+        movement = Decimal("0")
+        if txn.debit_account == account_name:
+            movement += txn.debit_amount
+        if txn.credit_account == account_name:
+            movement -= txn.credit_amount
+        return movement
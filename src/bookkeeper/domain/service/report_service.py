@@ -0,0 +1,217 @@
+"""
+ReportService ドメインサービス
+
+勘定科目別の借方・貸方合計から試算表・損益計算書・貸借対照表を作成する
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, List, Tuple
+
+from bookkeeper.domain.entity.transaction import Transaction
+from bookkeeper.domain.vo.account import AccountType
+from bookkeeper.domain.vo.chart_of_accounts import ChartOfAccounts
+
+
+@dataclass
+class AccountTotal:
+    """勘定科目別の借方・貸方合計"""
+
+    account_name: str
+    debit_total: Decimal
+    credit_total: Decimal
+
+
+@dataclass
+class TrialBalanceRow:
+    """試算表の1行"""
+
+    account_name: str
+    account_type: AccountType | None  # 勘定科目表にない科目は None
+    debit_total: Decimal
+    credit_total: Decimal
+    balance: Decimal  # 借方残高を正とする
+
+
+@dataclass
+class ReportSection:
+    """損益計算書・貸借対照表の区分（資産・負債など）"""
+
+    account_type: AccountType
+    items: List[Tuple[str, Decimal]] = field(default_factory=list)
+
+    @property
+    def total(self) -> Decimal:
+        """区分の合計"""
+        return sum((amount for _, amount in self.items), Decimal("0"))
+
+
+@dataclass
+class IncomeStatement:
+    """損益計算書"""
+
+    revenue: ReportSection
+    expense: ReportSection
+    unclassified: List[str] = field(default_factory=list)  # 勘定科目表にない科目
+
+    @property
+    def net_income(self) -> Decimal:
+        """当期純利益（損失ならマイナス）"""
+        return self.revenue.total - self.expense.total
+
+
+@dataclass
+class BalanceSheet:
+    """貸借対照表"""
+
+    asset: ReportSection
+    liability: ReportSection
+    equity: ReportSection
+    net_income: Decimal  # 当期純利益（資本の部に加える）
+    unclassified: List[str] = field(default_factory=list)  # 勘定科目表にない科目
+
+    @property
+    def liability_and_equity_total(self) -> Decimal:
+        """負債・資本の部の合計（資産合計と一致する）"""
+        return self.liability.total + self.equity.total + self.net_income
+
+
+# 借方残高を正とする区分（それ以外は貸方残高を正とする）
+_DEBIT_NORMAL = (AccountType.ASSET, AccountType.EXPENSE)
+
+# 勘定科目表の指定がない場合の勘定科目表
+_DEFAULT_CHART = ChartOfAccounts.default()
+
+
+class ReportService:
+    """財務諸表作成サービス"""
+
+    @staticmethod
+    def summarize(
+        transactions: Iterable[Transaction],
+        start: date | None = None,
+        end: date | None = None,
+    ) -> List[AccountTotal]:
+        """
+        仕訳から勘定科目別の借方・貸方合計を求める
+
+        Args:
+            transactions: 仕訳のイテラブル
+            start: 期間の開始日
+            end: 期間の終了日
+
+        Returns:
+            勘定科目別の合計（勘定科目名順）
+        """
+        debit: Dict[str, Decimal] = {}
+        credit: Dict[str, Decimal] = {}
+        for txn in transactions:
+            if start is not None and txn.date < start:
+                continue
+            if end is not None and txn.date > end:
+                continue
+            debit[txn.debit_account] = (
+                debit.get(txn.debit_account, Decimal("0")) + txn.debit_amount
+            )
+            credit[txn.credit_account] = (
+                credit.get(txn.credit_account, Decimal("0")) + txn.credit_amount
+            )
+
+        return [
+            AccountTotal(
+                account_name=name,
+                debit_total=debit.get(name, Decimal("0")),
+                credit_total=credit.get(name, Decimal("0")),
+            )
+            for name in sorted(debit.keys() | credit.keys())
+        ]
+
+    @staticmethod
+    def trial_balance(
+        totals: List[AccountTotal], chart: ChartOfAccounts = _DEFAULT_CHART
+    ) -> List[TrialBalanceRow]:
+        """
+        試算表を作成
+
+        Args:
+            totals: 勘定科目別の合計
+            chart: 勘定科目の種類を引く勘定科目表
+
+        Returns:
+            勘定科目の種類順（勘定科目表にない科目は末尾）に並べた試算表
+        """
+        rows = [
+            TrialBalanceRow(
+                account_name=total.account_name,
+                account_type=chart.account_type(total.account_name),
+                debit_total=total.debit_total,
+                credit_total=total.credit_total,
+                balance=total.debit_total - total.credit_total,
+            )
+            for total in totals
+        ]
+        order = list(AccountType)
+        return sorted(
+            rows,
+            key=lambda row: (
+                order.index(row.account_type) if row.account_type else len(order),
+                row.account_name,
+            ),
+        )
+
+    @staticmethod
+    def income_statement(
+        totals: List[AccountTotal], chart: ChartOfAccounts = _DEFAULT_CHART
+    ) -> IncomeStatement:
+        """損益計算書を作成（期間内の合計を渡すこと）"""
+        sections = ReportService._sections(totals, chart)
+        return IncomeStatement(
+            revenue=sections[AccountType.REVENUE],
+            expense=sections[AccountType.EXPENSE],
+            unclassified=ReportService._unclassified(totals, chart),
+        )
+
+    @staticmethod
+    def balance_sheet(
+        totals: List[AccountTotal], chart: ChartOfAccounts = _DEFAULT_CHART
+    ) -> BalanceSheet:
+        """貸借対照表を作成（期末時点までの累計を渡すこと）"""
+        sections = ReportService._sections(totals, chart)
+        return BalanceSheet(
+            asset=sections[AccountType.ASSET],
+            liability=sections[AccountType.LIABILITY],
+            equity=sections[AccountType.EQUITY],
+            net_income=(
+                sections[AccountType.REVENUE].total
+                - sections[AccountType.EXPENSE].total
+            ),
+            unclassified=ReportService._unclassified(totals, chart),
+        )
+
+    @staticmethod
+    def _unclassified(totals: List[AccountTotal], chart: ChartOfAccounts) -> List[str]:
+        """勘定科目表にない（種類が分からない）科目"""
+        return [
+            total.account_name
+            for total in totals
+            if chart.account_type(total.account_name) is None
+        ]
+
+    @staticmethod
+    def _sections(
+        totals: List[AccountTotal], chart: ChartOfAccounts
+    ) -> Dict[AccountType, ReportSection]:
+        """勘定科目の種類ごとに、通常の残高側を正とした残高をまとめる"""
+        sections = {
+            account_type: ReportSection(account_type) for account_type in AccountType
+        }
+        for total in totals:
+            account_type = chart.account_type(total.account_name)
+            if account_type is None:
+                continue
+            balance = total.debit_total - total.credit_total
+            if account_type not in _DEBIT_NORMAL:
+                balance = -balance
+            sections[account_type].items.append((total.account_name, balance))
+        return sections
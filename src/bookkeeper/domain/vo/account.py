@@ -17,7 +17,8 @@ class AccountType(Enum):
     EXPENSE = "費用"  # 消耗品費、通信費、旅費交通費など
 
 
-# 勘定科目名とその種類のマッピング（将来的にはDBや設定ファイルから読み込む）
+# 既定の勘定科目名とその種類のマッピング（設定ファイルで科目を加えた勘定科目表は
+# ChartOfAccounts を使う）
 ACCOUNT_TYPE_MAP = {
     # 資産
     "現金": AccountType.ASSET,
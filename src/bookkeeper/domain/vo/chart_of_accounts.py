@@ -0,0 +1,149 @@
+"""
+ChartOfAccounts 値オブジェクト
+
+勘定科目表。勘定科目名から種類を引き、
+入力された科目名から前方一致・文字 bigram の類似度で候補を探す
+"""
+
+from bisect import bisect_left
+from typing import Dict, List, Mapping
+
+from bookkeeper.domain.vo.account import ACCOUNT_TYPE_MAP, AccountType
+
+# 候補とみなす bigram の類似度（Dice 係数）の下限
+_MIN_SIMILARITY = 0.25
+
+# 科目名の前後に付けて、先頭・末尾の文字も bigram に含める
+_BOUNDARY = "\x00"
+
+
+class ChartOfAccounts:
+    """勘定科目表（科目には内部で追加順に 0 からの番号を振る）"""
+
+    def __init__(self, accounts: Mapping[str, AccountType]):
+        # 番号 → 勘定科目名・種類
+        self._names: List[str] = list(accounts)
+        self._types: List[AccountType] = list(accounts.values())
+        # 勘定科目名 → 番号
+        self._codes: Dict[str, int] = {
+            name: code for code, name in enumerate(self._names)
+        }
+        # 前方一致の検索用に名前順に並べたもの
+        self._sorted = sorted(self._names)
+        # bigram → それを含む勘定科目の番号（と科目ごとの bigram の数）
+        self._grams: Dict[str, List[int]] = {}
+        self._gram_counts: List[int] = []
+        for code, name in enumerate(self._names):
+            grams = _bigrams(name)
+            for gram in grams:
+                self._grams.setdefault(gram, []).append(code)
+            self._gram_counts.append(len(grams))
+        # 表にない科目名ごとのエラーメッセージ（同じ誤りが大量に続く取込用）
+        self._errors: Dict[str, str] = {}
+
+    @classmethod
+    def default(cls) -> "ChartOfAccounts":
+        """ACCOUNT_TYPE_MAP だけの勘定科目表"""
+        return cls(ACCOUNT_TYPE_MAP)
+
+    def extended(self, accounts: Mapping[str, AccountType]) -> "ChartOfAccounts":
+        """
+        勘定科目を追加した勘定科目表（既存の科目は順番も変わらない）
+
+        Raises:
+            ValueError: 既存の科目の種類を変えようとした場合
+        """
+        for name, account_type in accounts.items():
+            current = self.account_type(name)
+            if current is not None and current != account_type:
+                raise ValueError(
+                    f"勘定科目の種類は変更できません: {name}"
+                    f"（{current.value} → {account_type.value}）"
+                )
+        merged = dict(zip(self._names, self._types))
+        merged.update(accounts)
+        return ChartOfAccounts(merged)
+
+    @property
+    def names(self) -> List[str]:
+        """勘定科目名（追加順）"""
+        return list(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._codes
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def account_type(self, name: str) -> AccountType | None:
+        """勘定科目名から種類を取得（表にない科目は None）"""
+        code = self._codes.get(name)
+        return None if code is None else self._types[code]
+
+    def complete(self, prefix: str) -> List[str]:
+        """prefix で始まる勘定科目名（名前順）"""
+        start = bisect_left(self._sorted, prefix)
+        matches = []
+        for name in self._sorted[start:]:
+            if not name.startswith(prefix):
+                break
+            matches.append(name)
+        return matches
+
+    def suggest(self, text: str, limit: int = 3) -> List[str]:
+        """
+        入力された科目名に近い勘定科目名
+
+        前方一致する科目を先に、続けて文字 bigram の類似度（Dice 係数）の
+        高い順に返す
+
+        Args:
+            text: 入力された科目名
+            limit: 返す候補の最大数
+        """
+        text = text.strip()
+        if not text:
+            return []
+        suggestions = self.complete(text)[:limit]
+
+        grams = _bigrams(text)
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for code in self._grams.get(gram, ()):
+                shared[code] = shared.get(code, 0) + 1
+        scored = sorted(
+            (
+                (-2 * count / (len(grams) + self._gram_counts[code]), code)
+                for code, count in shared.items()
+            )
+        )
+        for score, code in scored:
+            if len(suggestions) >= limit or -score < _MIN_SIMILARITY:
+                break
+            if self._names[code] not in suggestions:
+                suggestions.append(self._names[code])
+        return suggestions
+
+    def check(self, name: str) -> None:
+        """
+        勘定科目表にある科目かを確認
+
+        Raises:
+            ValueError: 表にない科目の場合（近い科目があれば候補を添える）
+        """
+        if name in self._codes:
+            return
+        message = self._errors.get(name)
+        if message is None:
+            message = f"勘定科目表にない科目です: {name}"
+            suggestions = self.suggest(name)
+            if suggestions:
+                message += f"（候補: {', '.join(suggestions)}）"
+            self._errors[name] = message
+        raise ValueError(message)
+
+
+def _bigrams(name: str) -> List[str]:
+    """前後に境界を付けた科目名の、重複のない文字 bigram"""
+    padded = f"{_BOUNDARY}{name}{_BOUNDARY}"
+    return list(dict.fromkeys(padded[i : i + 2] for i in range(len(padded) - 1)))
@@ -0,0 +1,57 @@
+"""
+勘定科目の設定ファイル
+
+既定の勘定科目表（ACCOUNT_TYPE_MAP）に、TOML で書いた勘定科目を加える
+
+    [accounts]
+    "支払手数料" = "費用"
+    "前払金" = "資産"
+"""
+
+import tomllib
+from pathlib import Path
+
+from bookkeeper.domain.vo.account import AccountType
+from bookkeeper.domain.vo.chart_of_accounts import ChartOfAccounts
+
+
+def load_chart_of_accounts(path: Path) -> ChartOfAccounts:
+    """
+    設定ファイルの勘定科目を加えた勘定科目表を読み込む
+
+    Args:
+        path: 設定ファイルのパス（なければ既定の勘定科目表のまま）
+
+    Returns:
+        勘定科目表
+
+    Raises:
+        ValueError: 設定ファイルの形式・勘定科目の種類が不正な場合
+    """
+    chart = ChartOfAccounts.default()
+    try:
+        content = path.read_bytes()
+    except FileNotFoundError:
+        return chart
+    try:
+        accounts = tomllib.loads(content.decode("utf-8")).get("accounts", {})
+    except (UnicodeDecodeError, tomllib.TOMLDecodeError) as e:
+        raise ValueError(f"勘定科目の設定ファイルを読めません: {path}: {e}")
+    if not isinstance(accounts, dict):
+        raise ValueError(f"{path}: [accounts] に勘定科目名と種類を書いてください")
+
+    types = {account_type.value: account_type for account_type in AccountType}
+    extra = {}
+    for name, type_name in accounts.items():
+        if not name.strip():
+            raise ValueError(f"{path}: 勘定科目名が空です")
+        if type_name not in types:
+            raise ValueError(
+                f"{path}: 勘定科目の種類が不正です: {name} = {type_name}"
+                f"（{' / '.join(types)} のいずれか）"
+            )
+        extra[name] = types[type_name]
+    try:
+        return chart.extended(extra)
+    except ValueError as e:
+        raise ValueError(f"{path}: {e}")
@@ -4,6 +4,7 @@
 データファイルのパスなどを管理
 """
 
+import os
 from pathlib import Path
 
 
@@ -19,6 +20,58 @@ class Settings:
     # 仕訳帳CSVファイル
     TRANSACTIONS_CSV = DATA_DIR / "transactions.csv"
 
+    # 仕訳帳 Arrow IPC ファイル（列指向形式）
+    TRANSACTIONS_IPC = DATA_DIR / "transactions.arrow"
+
+    # 仕訳帳 SQLite データベース
+    TRANSACTIONS_DB = DATA_DIR / "transactions.sqlite3"
+
+    # 仕訳帳の年度別ファイルのディレクトリ（YYYY.csv、締めた年度は YYYY.parquet）
+    TRANSACTIONS_PARTITIONS = DATA_DIR / "transactions"
+
+    # 保存形式（"csv" / "ipc" / "sqlite" / "partitioned"）
+    STORAGE_BACKEND = os.environ.get("BOOKKEEPER_STORAGE", "csv")
+
+    # 既定の勘定科目表に勘定科目を加える設定ファイル（TOML、なければ既定のまま）
+    ACCOUNTS_FILE = Path(
+        os.environ.get("BOOKKEEPER_ACCOUNTS_FILE", DATA_DIR / "accounts.toml")
+    )
+
+    # 勘定科目表にない科目の仕訳を add / import で拒否するか（"1" で有効）
+    # 既定では独自の科目を使う既存の仕訳帳をそのまま扱えるよう受け付ける
+    STRICT_ACCOUNTS = os.environ.get("BOOKKEEPER_STRICT_ACCOUNTS", "0") != "0"
+
+    # 金額の小数点以下の桁数（円単位なら 0）
+    # 変更後は `migrate` で既存データの表記を揃える
+    AMOUNT_SCALE = 0
+
+    # CSV の解析結果を横に保存して次回以降の解析・検証を省くか（"0" で無効）
+    PARSE_CACHE = os.environ.get("BOOKKEEPER_PARSE_CACHE", "1") != "0"
+
+    # CSV の横に勘定科目・月ごとの行の位置の索引を置き、元帳などでは該当する行だけを
+    # 解析するか（"1" で有効。索引は CSV の変更を検出して次に使うときに作り直す）
+    CSV_ROW_INDEX = os.environ.get("BOOKKEEPER_CSV_ROW_INDEX", "0") != "0"
+
+    # 解析済み仕訳のプロセス内キャッシュの上限（MB、0 で無効）
+    FRAME_CACHE_MAX_MB = int(os.environ.get("BOOKKEEPER_FRAME_CACHE_MB", "512"))
+
+    # API サーバー（`serve`）の UNIX ソケット
+    SERVER_SOCKET = Path(
+        os.environ.get("BOOKKEEPER_SERVER_SOCKET", DATA_DIR / "bookkeeper.sock")
+    )
+
+    # サーバーが動いていれば CLI の処理をサーバーに依頼するか（"0" で無効）
+    USE_SERVER = os.environ.get("BOOKKEEPER_USE_SERVER", "1") != "0"
+
+    # 処理時間の計測結果を標準エラー出力に表示するか（"1" で有効、--timings と同じ）
+    TIMINGS = os.environ.get("BOOKKEEPER_TIMINGS", "0") != "0"
+
+    # 処理時間の計測結果を書き出す JSON のパス（--timings-json と同じ）
+    TIMINGS_JSON = os.environ.get("BOOKKEEPER_TIMINGS_JSON") or None
+
+    # cProfile の結果（pstats 形式）を書き出すパス（--profile と同じ）
+    PROFILE_OUTPUT = os.environ.get("BOOKKEEPER_PROFILE") or None
+
     @classmethod
     def ensure_data_dir(cls):
         """データディレクトリが存在しない場合は作成"""
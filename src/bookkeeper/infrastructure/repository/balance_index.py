@@ -0,0 +1,158 @@
+"""
+勘定科目別 月次残高索引
+
+勘定科目ごとの月次増減（借方 - 貸方）をデータファイルの横に保存し、
+期間指定の元帳で開始月より前の仕訳を読まずに繰越残高を求める
+"""
+
+import json
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import polars as pl
+
+from bookkeeper.infrastructure.repository.file_io import (
+    file_fingerprint,
+    write_atomic,
+)
+
+# 勘定科目 → 月 (YYYY-MM) → 増減
+MonthlyMovements = Dict[str, Dict[str, Decimal]]
+
+# 索引ファイルの形式（互換性のない変更をしたら上げる）
+_FORMAT_VERSION = 1
+
+
+class BalanceIndex:
+    """勘定科目別の月次増減の索引"""
+
+    def __init__(
+        self,
+        data_path: Path,
+        fingerprint: Callable[[], List[int]] | None = None,
+    ):
+        self.data_path = data_path
+        self.index_path = data_path.with_name(f"{data_path.name}.balances.json")
+        # 複数のファイルに分けて保存する実装は、全てのファイルの指紋を返す関数を渡す
+        self._fingerprint = fingerprint
+
+    def fingerprint(self) -> List[int]:
+        """データファイルの指紋（サイズ・更新時刻・inode）"""
+        if self._fingerprint is not None:
+            return self._fingerprint()
+        return file_fingerprint(self.data_path)
+
+    def load(self, fingerprint: List[int] | None = None) -> MonthlyMovements | None:
+        """
+        索引を読み込む
+
+        Args:
+            fingerprint: 索引が対応しているべきデータファイルの指紋（省略時は現在の指紋）
+
+        Returns:
+            月次増減。索引がない・データファイルが索引の作成後に変更された場合は None
+        """
+        try:
+            stored = json.loads(self.index_path.read_bytes())
+        except (FileNotFoundError, ValueError):
+            return None
+        if stored.get("version") != _FORMAT_VERSION:
+            return None
+        if fingerprint is None:
+            fingerprint = self.fingerprint()
+        if stored.get("fingerprint") != fingerprint:
+            return None
+        return {
+            account: {month: Decimal(amount) for month, amount in months.items()}
+            for account, months in stored["movements"].items()
+        }
+
+    def rebuild(self, df: pl.DataFrame) -> MonthlyMovements:
+        """
+        データファイルの全行から索引を作り直す
+
+        現在の指紋とともに保存するので、df の読み込みからここまでを
+        データファイルの読み込み用のロックの中で行うこと
+        """
+        fingerprint = self.fingerprint()
+        movements = self.compute(df)
+        self._save(movements, fingerprint)
+        return movements
+
+    def update(self, new_rows: pl.DataFrame, before: List[int]) -> None:
+        """
+        追記した行の増減を索引に反映
+
+        追記前の時点で索引が最新でなければ何もしない（次に使うときに作り直す）
+
+        Args:
+            new_rows: 追記した行
+            before: 追記前のデータファイルの指紋
+        """
+        movements = self.load(before)
+        if movements is None:
+            return
+        for account, months in self.compute(new_rows).items():
+            current = movements.setdefault(account, {})
+            for month, amount in months.items():
+                current[month] = current.get(month, Decimal("0")) + amount
+        self._save(movements, self.fingerprint())
+
+    @staticmethod
+    def compute(df: pl.DataFrame) -> MonthlyMovements:
+        """仕訳の DataFrame から勘定科目別の月次増減を1回の集計で求める"""
+        month = pl.col("date").dt.strftime("%Y-%m").alias("month")
+        sides = pl.concat(
+            [
+                df.select(
+                    pl.col("debit_account").alias("account"),
+                    month,
+                    pl.col("debit_amount").alias("amount"),
+                ),
+                df.select(
+                    pl.col("credit_account").alias("account"),
+                    month,
+                    (-pl.col("credit_amount")).alias("amount"),
+                ),
+            ]
+        )
+        movements: MonthlyMovements = {}
+        for account, month_key, amount in (
+            sides.group_by("account", "month").agg(pl.col("amount").sum()).iter_rows()
+        ):
+            movements.setdefault(account, {})[month_key] = amount
+        return movements
+
+    @staticmethod
+    def balance_before(
+        movements: MonthlyMovements, account_name: str, month_start: date
+    ) -> Decimal:
+        """指定した月より前の増減の合計（= 前月末の残高）"""
+        month_key = month_start.strftime("%Y-%m")
+        return sum(
+            (
+                amount
+                for month, amount in movements.get(account_name, {}).items()
+                if month < month_key
+            ),
+            Decimal("0"),
+        )
+
+    def _save(self, movements: MonthlyMovements, fingerprint: List[int]) -> None:
+        """索引が対応するデータファイルの指紋とともに保存"""
+        content = {
+            "version": _FORMAT_VERSION,
+            "fingerprint": fingerprint,
+            "movements": {
+                account: {
+                    month: str(amount) for month, amount in sorted(months.items())
+                }
+                for account, months in sorted(movements.items())
+            },
+        }
+        write_atomic(
+            self.index_path,
+            lambda f: f.write(json.dumps(content, ensure_ascii=False).encode("utf-8")),
+        )
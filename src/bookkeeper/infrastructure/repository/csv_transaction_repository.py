@@ -4,122 +4,211 @@ CSV TransactionRepository 実装
 Polarsを使って効率的にCSVで仕訳を永続化
 """
 
+import io
+import os
+from datetime import date
 from pathlib import Path
-from typing import List
-from decimal import Decimal
-from uuid import UUID, uuid4
+from typing import IO, List
 
 import polars as pl
 
-from bookkeeper.domain.entity.transaction import Transaction
-from bookkeeper.domain.repository.transaction_repository import TransactionRepository
+from bookkeeper.common.profiling import add_bytes, add_rows, span
+from bookkeeper.infrastructure.repository.file_io import write_atomic
+from bookkeeper.infrastructure.repository.frame_cache import FrameCache
+from bookkeeper.infrastructure.repository.parse_cache import ParseCache
+from bookkeeper.infrastructure.repository.polars_transaction_repository import (
+    PolarsTransactionRepository,
+)
+from bookkeeper.infrastructure.repository.row_index import RowIndex
+from bookkeeper.infrastructure.repository.transaction_frame import (
+    validate_transaction_frame,
+)
 
 
-class CsvTransactionRepository(TransactionRepository):
+class CsvTransactionRepository(PolarsTransactionRepository):
     """CSV形式の仕訳リポジトリ（Polarsベース）"""
 
-    # スキーマ定義
+    # CSVファイル上のスキーマ定義
     SCHEMA = {
         "id": pl.String,  # UUID を文字列として保存
         "date": pl.Date,
         "debit_account": pl.String,
-        "debit_amount": pl.String,  # Decimalとして扱うため文字列で保存
+        "debit_amount": pl.String,  # 誤差なく読むため文字列で読み込む
         "credit_account": pl.String,
-        "credit_amount": pl.String,  # Decimalとして扱うため文字列で保存
+        "credit_amount": pl.String,  # 誤差なく読むため文字列で読み込む
         "description": pl.String,
         "note": pl.String,
         "evidence_path": pl.String,
     }
 
-    def __init__(self, csv_path: Path):
+    def __init__(
+        self,
+        csv_path: Path,
+        amount_scale: int = 0,
+        frame_cache: FrameCache | None = None,
+        use_parse_cache: bool = False,
+        use_row_index: bool = False,
+    ):
         self.csv_path = csv_path
+        super().__init__(csv_path, amount_scale, frame_cache)
+        # 解析・検証済みの仕訳を CSV の横に保存し、次のプロセスで再利用する
+        self.parse_cache = (
+            ParseCache(csv_path, amount_scale) if use_parse_cache else None
+        )
+        # 勘定科目・月ごとの行の位置を CSV の横に保存し、該当する行だけを読む
+        self.row_index = RowIndex(csv_path) if use_row_index else None
         self._ensure_csv_exists()
 
     def _ensure_csv_exists(self):
         """CSVファイルが存在しない場合はヘッダー付きで作成"""
-        if not self.csv_path.exists():
-            self.csv_path.parent.mkdir(parents=True, exist_ok=True)
-            # 空のDataFrameを作成してヘッダーを書き込む
-            df = pl.DataFrame(schema=self.SCHEMA)
-            df.write_csv(self.csv_path)
-
-    def add(self, transaction: Transaction) -> None:
-        """仕訳を追加"""
-        # UUID を生成（transaction.id が None の場合）
-        transaction_id = transaction.id if transaction.id else uuid4()
-
-        # 新しい行をDataFrameとして作成
-        new_row = pl.DataFrame(
-            {
-                "id": [str(transaction_id)],
-                "date": [transaction.date],
-                "debit_account": [transaction.debit_account],
-                "debit_amount": [str(transaction.debit_amount)],
-                "credit_account": [transaction.credit_account],
-                "credit_amount": [str(transaction.credit_amount)],
-                "description": [transaction.description],
-                "note": [transaction.note],
-                "evidence_path": [transaction.evidence_path],
-            }
+        if self.csv_path.exists():
+            return
+        with self.lock.exclusive():
+            # ロックを待つ間に他プロセスが作成・追記していれば上書きしない
+            if not self.csv_path.exists():
+                # 空のDataFrameを作成してヘッダーを書き込む
+                self._write_all(self._empty_df())
+
+    def _scan(self) -> pl.LazyFrame:
+        """CSVをスキーマ順の LazyFrame として読み込む（金額は文字列のまま）"""
+        return self._scan_source(self.csv_path, self._read_header())
+
+    def _scan_validated(self, refresh: bool = True) -> pl.LazyFrame | None:
+        """解析結果キャッシュから検証済みの仕訳を読む（キャッシュを使わない場合は None）"""
+        if self.parse_cache is None:
+            return None
+        return self.parse_cache.scan(self._parse_validated, refresh)
+
+    def rebuild_indexes(self) -> None:
+        """月次残高索引・内容の指紋索引と行位置索引（使う場合）を全件から作り直す"""
+        # 読み込みから指紋の記録までの間に追記されないよう、読み込み用のロックの中で行う
+        with self.lock.shared():
+            df = self._read_df()
+            self.balance_index.rebuild(df)
+            self.fingerprint_index.rebuild(df)
+            if self.row_index is not None:
+                self.row_index.rebuild(df)
+
+    def verify_indexes(self) -> List[str]:
+        """月次残高索引・内容の指紋索引と行位置索引（使う場合）を全件の再計算と照合する"""
+        problems = super().verify_indexes()
+        if self.row_index is None:
+            return problems
+        index = self.row_index.load()
+        if index is None:
+            return problems + ["行位置索引がないか、CSV の変更後に更新されていません"]
+
+        expected = self._read_df()
+        rows = self._collect(self._scan_rows(index.select("offset", "length")))
+        columns = ["debit_account", "credit_account"]
+        if not rows.equals(expected):
+            problems.append("行位置索引の指す行が CSV の行と一致しません")
+        elif not index.select(columns).equals(expected.select(columns)):
+            problems.append("行位置索引の勘定科目が CSV の行と一致しません")
+        return problems
+
+    def _scan_account(
+        self, account_name: str, start: date | None, end: date | None
+    ) -> pl.LazyFrame | None:
+        """
+        行位置索引から、指定した勘定科目を含む期間の月の行だけを読む
+
+        索引がない・CSV の変更後に更新されていない場合は全件から作り直す。
+        作り直せない（CSV の行と解析結果を対応づけられない）場合は None
+        """
+        if self.row_index is None:
+            return None
+        index = self.row_index.load()
+        if index is None:
+            with span("行位置索引の作成"):
+                index = self.row_index.rebuild(self._read_df())
+            if index is None:
+                return None
+
+        return self._scan_rows(RowIndex.lookup(index, account_name, start, end))
+
+    def _scan_rows(self, spans: pl.DataFrame) -> pl.LazyFrame:
+        """索引の位置の行だけを CSV から読み出し、スキーマ順の LazyFrame にする"""
+        content = self.row_index.read(spans)
+        add_bytes(len(content))
+        header = self._read_header()
+        line = (",".join(header) + "\n").encode("utf-8")
+        return self._scan_source(io.BytesIO(line + content), header)
+
+    def _parse_validated(self, content: bytes) -> pl.DataFrame:
+        """CSV の内容（ヘッダー行から始まるバイト列）を解析・検証する"""
+        first_line = content.split(b"\n", 1)[0].decode("utf-8-sig")
+        header = _parse_header(first_line)
+        with span("解析"):
+            df = self._collect(self._scan_source(io.BytesIO(content), header))
+            add_rows(df.height)
+        with span("検証"):
+            validate_transaction_frame(df)
+        return df
+
+    def _scan_source(self, source: Path | IO[bytes], header: List[str]) -> pl.LazyFrame:
+        """ヘッダーが header の CSV をスキーマ順の LazyFrame として読み込む"""
+        if not header:
+            return pl.LazyFrame(schema=self.SCHEMA)
+
+        lf = pl.scan_csv(
+            source,
+            schema_overrides={k: v for k, v in self.SCHEMA.items() if k in header},
         )
-
-        # 既存のデータを読み込んで追加
-        if self.csv_path.stat().st_size > 0:
+        # 欠けている列（旧形式の id など）は null で補う
+        missing = [
+            pl.lit(None, dtype=dtype).alias(name)
+            for name, dtype in self.SCHEMA.items()
+            if name not in header
+        ]
+        return lf.with_columns(missing).select(list(self.SCHEMA))
+
+    def _write_rows(self, new_rows: pl.DataFrame) -> None:
+        """新しい行を永続化"""
+        # ヘッダーがスキーマと一致していれば末尾に追記するだけで済む
+        if self._read_header() == list(self.SCHEMA):
+            before = None if self.row_index is None else self.row_index.fingerprint()
+            self._append(new_rows)
+            if before is not None:
+                self.row_index.update(new_rows, before)
+            return
+
+        # 列構成が異なる（旧形式・手編集など）場合のみ全体を書き直す
+        existing = self._collect(self._scan())
+        self._write_all(pl.concat([existing, new_rows], how="diagonal"))
+
+    def _write_all(self, df: pl.DataFrame) -> None:
+        """一時ファイル + rename で全体をアトミックに書き直す"""
+        write_atomic(self.csv_path, df.write_csv)
+
+    def _read_header(self) -> List[str]:
+        """CSVのヘッダー行を列名のリストとして取得（空ファイルなら空リスト）"""
+        with self.csv_path.open("r", encoding="utf-8-sig", newline="") as f:
+            return _parse_header(f.readline())
+
+    def _append(self, df: pl.DataFrame) -> None:
+        """
+        ヘッダーなしで末尾に追記し、ディスクへ同期する
+
+        書き込みに失敗した場合は追記前の大きさに切り詰め、途中までの行を残さない
+        """
+        # バッファを介さずに書き、失敗時に未書き込みの分が後から書かれないようにする
+        with self.csv_path.open("r+b", buffering=0) as f:
+            size = f.seek(0, os.SEEK_END)
             try:
-                df = pl.read_csv(self.csv_path, schema_overrides=self.SCHEMA)
-                df = pl.concat([df, new_row])
-            except pl.exceptions.NoDataError:
-                # ヘッダーのみの場合
-                df = new_row
-        else:
-            df = new_row
-
-        # 書き込み
-        df.write_csv(self.csv_path)
-
-    def find_all(self) -> List[Transaction]:
-        """全ての仕訳を取得"""
-        if not self.csv_path.exists() or self.csv_path.stat().st_size == 0:
-            return []
-
-        try:
-            df = pl.read_csv(self.csv_path, schema_overrides=self.SCHEMA)
-            return self._df_to_transactions(df)
-        except pl.exceptions.NoDataError:
-            # ヘッダーのみの場合
-            return []
-
-    def find_by_account(self, account_name: str) -> List[Transaction]:
-        """指定した勘定科目を含む仕訳を取得"""
-        if not self.csv_path.exists() or self.csv_path.stat().st_size == 0:
-            return []
-
-        try:
-            df = pl.read_csv(self.csv_path, schema_overrides=self.SCHEMA)
-            # Polarsの効率的なフィルタリング
-            filtered = df.filter(
-                (pl.col("debit_account") == account_name)
-                | (pl.col("credit_account") == account_name)
-            )
-            return self._df_to_transactions(filtered)
-        except pl.exceptions.NoDataError:
-            return []
-
-    def _df_to_transactions(self, df: pl.DataFrame) -> List[Transaction]:
-        """DataFrameをTransactionのリストに変換"""
-        transactions = []
-        for row in df.iter_rows(named=True):
-            transactions.append(
-                Transaction(
-                    id=UUID(row["id"]) if row.get("id") else None,
-                    date=row["date"],
-                    debit_account=row["debit_account"],
-                    debit_amount=Decimal(row["debit_amount"]),
-                    credit_account=row["credit_account"],
-                    credit_amount=Decimal(row["credit_amount"]),
-                    description=row["description"],
-                    note=row.get("note", "") or "",
-                    evidence_path=row.get("evidence_path", "") or "",
-                )
-            )
-        return transactions
+                # 手編集などで末尾に改行がない場合は補ってから追記
+                if size > 0:
+                    f.seek(size - 1)
+                    if f.read(1) != b"\n":
+                        f.write(b"\n")
+                df.write_csv(f, include_header=False)
+                os.fsync(f.fileno())
+            except BaseException:
+                f.truncate(size)
+                raise
+
+
+def _parse_header(line: str) -> List[str]:
+    """CSVのヘッダー行を列名のリストにする（空行なら空リスト）"""
+    header = line.rstrip("\r\n")
+    return header.split(",") if header else []
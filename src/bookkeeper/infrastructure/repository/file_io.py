@@ -0,0 +1,72 @@
+"""
+ファイル書き込みユーティリティ
+
+リポジトリ実装が共通で使うクラッシュ安全な書き込み処理
+"""
+
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Callable, List
+
+# 新しく作るファイルの既定の権限（open() と同じく umask を適用する）。
+# umask は設定しないと読めないので、スレッドを使う前の import 時に1回だけ読む
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_DEFAULT_MODE = 0o666 & ~_UMASK
+
+
+def write_atomic(path: Path, write: Callable[[BinaryIO], None]) -> None:
+    """
+    一時ファイルに書き出してから rename で置き換える
+
+    書き込み途中でクラッシュしても元のファイルは壊れない。
+    置き換えるファイルの権限は引き継ぎ、新しいファイルは umask に従う
+    （一時ファイルの 0600 のままにしない）
+
+    Args:
+        path: 書き込み先のパス
+        write: 一時ファイルに内容を書き込む関数
+    """
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            os.fchmod(f.fileno(), _file_mode(path))
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    fsync_dir(path.parent)
+
+
+def _file_mode(path: Path) -> int:
+    """書き込み先の権限（まだなければ新しいファイルの既定の権限）"""
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        return _DEFAULT_MODE
+
+
+def fsync_dir(directory: Path) -> None:
+    """rename などのディレクトリ操作を永続化するためディレクトリを同期"""
+    dir_fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def file_fingerprint(path: Path) -> List[int]:
+    """
+    ファイルの指紋（サイズ・更新時刻・inode）
+
+    追記ではサイズと更新時刻が、rename による置き換えでは inode が変わる
+    """
+    stat = path.stat()
+    return [stat.st_size, stat.st_mtime_ns, stat.st_ino]
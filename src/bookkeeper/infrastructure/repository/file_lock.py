@@ -0,0 +1,94 @@
+"""
+データファイルの排他制御と世代番号
+
+データファイルの横のロックファイルに fcntl の助言ロックをかけ、
+書き込みのたびにロックファイルに保存した世代番号を1つ進める。
+読み込み側は世代番号を比べるだけで、ロックを取らずに変更を検出できる
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows では助言ロックを使わない
+    fcntl = None
+
+# 世代番号の桁数（固定長で上書きし、読み込み途中の値を読まないようにする）
+_GENERATION_WIDTH = 20
+
+
+class FileLock:
+    """データファイルの読み書きロック（同じスレッドでは入れ子にできる）"""
+
+    def __init__(self, data_path: Path):
+        self.lock_path = data_path.with_name(f"{data_path.name}.lock")
+        self._local = threading.local()
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        """読み込み用のロック（他の読み込みとは同時に取れる）"""
+        with self._acquire(exclusive=False):
+            yield
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        """書き込み用のロック（他の読み書きが終わるまで待つ）"""
+        with self._acquire(exclusive=True):
+            yield
+
+    def generation(self) -> int:
+        """現在の世代番号（まだ書き込みがなければ 0）"""
+        try:
+            content = self.lock_path.read_bytes()
+        except FileNotFoundError:
+            return 0
+        return int(content or b"0")
+
+    def bump(self) -> int:
+        """
+        世代番号を1つ進めて返す
+
+        exclusive() の中で呼ぶこと
+        """
+        generation = self.generation() + 1
+        fd = os.open(self.lock_path, os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            os.pwrite(fd, str(generation).zfill(_GENERATION_WIDTH).encode(), 0)
+        finally:
+            os.close(fd)
+        return generation
+
+    @contextmanager
+    def _acquire(self, exclusive: bool) -> Iterator[None]:
+        """ロックを取る。既にこのスレッドが取っていれば何もしない"""
+        depth = getattr(self._local, "depth", 0)
+        if depth > 0:
+            if exclusive and not self._local.exclusive:
+                raise RuntimeError(
+                    "読み込み用のロックを書き込み用に切り替えることはできません"
+                )
+            self._local.depth = depth + 1
+            try:
+                yield
+            finally:
+                self._local.depth -= 1
+            return
+
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            self._local.depth = 1
+            self._local.exclusive = exclusive
+            try:
+                yield
+            finally:
+                self._local.depth = 0
+        finally:
+            # close でロックも解放される
+            os.close(fd)
@@ -0,0 +1,163 @@
+"""
+仕訳の内容の指紋索引
+
+仕訳ごとの内容（日付・借方科目・貸方科目・金額・摘要）の 64 ビットのハッシュ値を
+並べ替えてデータファイルの横に Arrow IPC 形式で保存する。追加する仕訳と同じ内容の
+仕訳が既にあるかを、データファイルを読まずにハッシュ値の二分探索だけで判定する。
+追記した行のハッシュ値は並べ替えた新しいセグメントに書き、索引全体は書き直さない
+"""
+
+from pathlib import Path
+from typing import Callable, List
+
+import polars as pl
+
+from bookkeeper.infrastructure.repository.file_io import file_fingerprint
+from bookkeeper.infrastructure.repository.index_segments import IndexSegments
+
+# 同じ内容かを判定する列（id・備考・証憑は含めない）
+CONTENT_COLUMNS = (
+    "date",
+    "debit_account",
+    "credit_account",
+    "debit_amount",
+    "description",
+)
+
+# 索引ファイルの形式（互換性のない変更をしたら上げる）
+_FORMAT_VERSION = 2
+
+# 追記した行がこの件数以下なら、全体を並べ替えずに挿入位置へ差し込む
+_MERGE_LIMIT = 1_000
+
+
+class FingerprintIndex:
+    """
+    仕訳の内容のハッシュ値の索引
+
+    異なる内容のハッシュ値が一致する確率は、100 万件の全ての組で 10^-8 程度なので
+    照合ではハッシュ値の一致を同じ内容とみなす
+    """
+
+    def __init__(
+        self,
+        data_path: Path,
+        amount_scale: int = 0,
+        fingerprint: Callable[[], List[int]] | None = None,
+    ):
+        self.data_path = data_path
+        self.amount_scale = amount_scale
+        # セグメントごとに昇順。まとめるときは2つの昇順の列を1つの昇順の列にする
+        self.segments = IndexSegments(
+            data_path,
+            "fingerprints",
+            lambda older, newer: _merge(
+                older.to_series().set_sorted(), newer.to_series()
+            ).to_frame(),
+        )
+        # 複数のファイルに分けて保存する実装は、全てのファイルの指紋を返す関数を渡す
+        self._fingerprint = fingerprint
+
+    def fingerprint(self) -> List[int]:
+        """データファイルの指紋（サイズ・更新時刻・inode）"""
+        if self._fingerprint is not None:
+            return self._fingerprint()
+        return file_fingerprint(self.data_path)
+
+    def load(self, fingerprint: List[int] | None = None) -> List[pl.Series] | None:
+        """
+        索引を読み込む
+
+        Args:
+            fingerprint: 索引が対応しているべきデータファイルの指紋（省略時は現在の指紋）
+
+        Returns:
+            セグメントごとの昇順のハッシュ値（全ての行のハッシュ値をセグメントに
+            分けたもの）。索引がない・データファイルが索引の作成後に変更された・
+            ハッシュ値の計算方法が変わった場合は None
+        """
+        if fingerprint is None:
+            fingerprint = self.fingerprint()
+        segments = self.segments.load(self._header(fingerprint))
+        if segments is None:
+            return None
+        return [segment.to_series().set_sorted() for segment in segments]
+
+    def rebuild(self, df: pl.DataFrame) -> List[pl.Series]:
+        """
+        データファイルの全行から索引を作り直す
+
+        現在の指紋とともに保存するので、df の読み込みからここまでを
+        データファイルの読み込み用のロックの中で行うこと
+        """
+        fingerprint = self.fingerprint()
+        hashes = self.compute(df).sort()
+        self.segments.save(hashes.to_frame(), self._header(fingerprint))
+        return [hashes]
+
+    def update(self, new_rows: pl.DataFrame, before: List[int]) -> None:
+        """
+        追記した行のハッシュ値を索引に反映
+
+        追記前の時点で索引が最新でなければ何もしない（次に使うときに作り直す）
+
+        Args:
+            new_rows: 追記した行
+            before: 追記前のデータファイルの指紋
+        """
+        # 索引全体は読まず、追記前のデータファイルに対応していれば新しい行だけを加える
+        self.segments.append(
+            self.compute(new_rows).sort().to_frame(),
+            self._header(before),
+            self._header(self.fingerprint()),
+        )
+
+    @staticmethod
+    def compute(df: pl.DataFrame) -> pl.Series:
+        """仕訳の DataFrame の行ごとの内容のハッシュ値"""
+        return df.select(
+            pl.struct(CONTENT_COLUMNS).hash(seed=0).alias("fingerprint")
+        ).to_series()
+
+    @staticmethod
+    def lookup(stored: List[pl.Series], hashes: pl.Series) -> pl.Series:
+        """
+        hashes の各値が stored（セグメントごとに昇順）のどれかにあるか
+
+        セグメントごとの二分探索なので、保存済みの件数が増えても1件あたり
+        O(log² N) で済み、メモリマップした索引のうち探索で触れる部分しか読まない
+        """
+        found = pl.repeat(False, hashes.len(), eager=True)
+        for segment in stored:
+            if segment.is_empty():
+                continue
+            positions = segment.search_sorted(hashes).clip(
+                upper_bound=segment.len() - 1
+            )
+            found |= segment.gather(positions) == hashes
+        return found
+
+    def _header(self, fingerprint: List[int]) -> dict:
+        """索引が対応するデータファイルの指紋と、ハッシュ値の計算方法"""
+        return {
+            "version": _FORMAT_VERSION,
+            # ハッシュ値は Polars のバージョンと金額の桁数によって変わる
+            "polars": pl.__version__,
+            "amount_scale": self.amount_scale,
+            "source": fingerprint,
+        }
+
+
+def _merge(stored: pl.Series, new: pl.Series) -> pl.Series:
+    """昇順のハッシュ値に新しい昇順のハッシュ値を加え、昇順に並べる"""
+    if new.len() > _MERGE_LIMIT:
+        return pl.concat([stored, new]).sort()
+    # 少しの追加は挿入位置で切り分けてつなぐ（全体の並べ替えより 10 倍ほど速い）
+    parts = []
+    start = 0
+    for i, position in enumerate(stored.search_sorted(new).to_list()):
+        parts.append(stored.slice(start, position - start))
+        parts.append(new.slice(i, 1))
+        start = position
+    parts.append(stored.slice(start))
+    return pl.concat(parts).set_sorted()
@@ -0,0 +1,139 @@
+"""
+解析済み仕訳 DataFrame のプロセス内キャッシュ
+
+データファイルごとに、金額を固定小数点に変換済みの DataFrame を保持する。
+ファイルの指紋（サイズ・更新時刻・inode）が変わったエントリは使わず、
+合計サイズがメモリ上限を超えたら最も長く使われていないものから破棄する
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable, List, Tuple
+
+import polars as pl
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """キャッシュの利用状況"""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
+
+
+class FrameCache:
+    """指紋で無効化する LRU キャッシュ（メモリ上限つき）"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        # キー → (指紋, DataFrame, 推定サイズ)。末尾ほど最近使われたもの
+        self._entries: OrderedDict[Hashable, Tuple[List[int], pl.DataFrame, int]] = (
+            OrderedDict()
+        )
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, fingerprint: List[int]) -> pl.DataFrame | None:
+        """
+        キャッシュ済みの DataFrame を取得
+
+        Args:
+            key: データファイルを表すキー
+            fingerprint: データファイルの現在の指紋
+
+        Returns:
+            指紋が一致するエントリの DataFrame。ない・古い場合は None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != fingerprint:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, fingerprint: List[int], df: pl.DataFrame) -> None:
+        """
+        DataFrame をキャッシュに入れる
+
+        単独でメモリ上限を超える DataFrame は入れない
+        """
+        size = df.estimated_size()
+        with self._lock:
+            self._discard(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (fingerprint, df, size)
+            self._size_bytes += size
+            while self._size_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+                self._evictions += 1
+
+    def append(
+        self,
+        key: Hashable,
+        before: List[int],
+        after: List[int],
+        new_rows: pl.DataFrame,
+    ) -> None:
+        """
+        自分で追記した行をキャッシュに反映
+
+        追記前の指紋のエントリがあれば末尾に行を足して追記後の指紋にする。
+        なければ何もしない（次に読むときに作り直す）
+
+        Args:
+            key: データファイルを表すキー
+            before: 追記前のデータファイルの指紋
+            after: 追記後のデータファイルの指紋
+            new_rows: 追記した行
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            if entry[0] != before:
+                self._discard(key)
+                return
+            df = pl.concat([entry[1], new_rows])
+        self.put(key, after, df)
+
+    def invalidate(self, key: Hashable) -> None:
+        """エントリを破棄"""
+        with self._lock:
+            self._discard(key)
+
+    def clear(self) -> None:
+        """全てのエントリを破棄（統計は残す）"""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """キャッシュの利用状況"""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+                max_bytes=self.max_bytes,
+            )
+
+    def _discard(self, key: Hashable) -> None:
+        """エントリがあれば取り除く（ロックを取った状態で呼ぶ）"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= entry[2]
@@ -0,0 +1,150 @@
+"""
+追記専用のセグメントに分けた索引ファイル
+
+データファイルの横に、索引を Arrow IPC 形式の複数のセグメント
+（{データファイル名}.{種類}.{番号}.arrow）に分けて保存する。
+追記では新しい行だけのセグメントを書き、直前のセグメントの行数が新しい
+セグメント以下なら1つにまとめる。セグメントの行数は古い方ほど大きくなるので、
+セグメントは O(log N) 個に保たれ、1行あたりの書き込みも償却 O(log N) で済む
+（追記のたびに索引全体を書き直さない）
+"""
+
+import json
+from pathlib import Path
+from typing import Callable, List
+
+import polars as pl
+
+from bookkeeper.infrastructure.repository.file_io import (
+    file_fingerprint,
+    write_atomic,
+)
+
+
+class IndexSegments:
+    """索引のセグメントファイルと、それらを束ねるメタデータ"""
+
+    def __init__(
+        self,
+        data_path: Path,
+        kind: str,
+        merge: Callable[[pl.DataFrame, pl.DataFrame], pl.DataFrame],
+    ):
+        """
+        Args:
+            data_path: 索引を付けるデータファイル
+            kind: 索引の種類（ファイル名に使う）
+            merge: 古いセグメントと新しいセグメントを1つにまとめる関数
+        """
+        self.directory = data_path.parent
+        self.prefix = f"{data_path.name}.{kind}."
+        self.meta_path = data_path.with_name(f"{data_path.name}.{kind}.json")
+        self.merge = merge
+
+    def load(self, header: dict) -> List[pl.DataFrame] | None:
+        """
+        全てのセグメントを古い順に読み込む（メモリマップするので読んだ分だけ触れる）
+
+        Args:
+            header: 索引が対応しているべきデータファイルの指紋と索引の形式
+
+        Returns:
+            セグメントのリスト。索引がない・header が一致しない・セグメントが
+            書き換わっている場合は None
+        """
+        meta = self._read_meta(header)
+        if meta is None:
+            return None
+        try:
+            return [
+                pl.read_ipc(self.directory / segment["file"], memory_map=True)
+                for segment in meta["segments"]
+            ]
+        except FileNotFoundError:
+            return None
+
+    def save(self, frame: pl.DataFrame, header: dict) -> None:
+        """索引全体を1つのセグメントとして書き直す"""
+        # 以前の形式（索引全体を1つのファイルに保存していた）のファイルも消す
+        stale = [*self._segment_files(), self.directory / f"{self.prefix}arrow"]
+        # 空でも1つ書き、読み込みで列の型が分かるようにする
+        segments = [self._write_segment(frame, 0)]
+        self._write_meta(header, segments, 1)
+        self._remove(stale, segments)
+
+    def append(self, frame: pl.DataFrame, before: dict, header: dict) -> bool:
+        """
+        追記した行の索引を新しいセグメントとして加える
+
+        Args:
+            frame: 追記した行の索引
+            before: 追記前のデータファイルに対応する header
+            header: 追記後のデータファイルに対応する header
+
+        Returns:
+            加えた場合は True。追記前の時点で索引が最新でなければ何もせず False
+        """
+        meta = self._read_meta(before)
+        if meta is None:
+            return False
+        segments = meta["segments"]
+        number = meta["next"]
+        merged = []
+        if not frame.is_empty():
+            # 直前のセグメントが新しいセグメント以下の行数なら1つにまとめる
+            while segments and segments[-1]["rows"] <= frame.height:
+                merged.append(segments.pop())
+                older = pl.read_ipc(self.directory / merged[-1]["file"])
+                frame = self.merge(older, frame)
+            segments.append(self._write_segment(frame, number))
+            number += 1
+        self._write_meta(header, segments, number)
+        self._remove([self.directory / segment["file"] for segment in merged], segments)
+        return True
+
+    def _read_meta(self, header: dict) -> dict | None:
+        """header と一致し、全てのセグメントが書いたときのままのメタデータ"""
+        try:
+            meta = json.loads(self.meta_path.read_bytes())
+            if any(meta.get(key) != value for key, value in header.items()):
+                return None
+            for segment in meta["segments"]:
+                # 索引だけが書き換わった場合（書き込み途中の中断など）を検出する
+                if segment["index"] != file_fingerprint(
+                    self.directory / segment["file"]
+                ):
+                    return None
+        except (FileNotFoundError, KeyError, TypeError, ValueError):
+            return None
+        return meta
+
+    def _write_segment(self, frame: pl.DataFrame, number: int) -> dict:
+        """セグメントを書き込み、メタデータに記録する内容を返す"""
+        path = self.directory / f"{self.prefix}{number}.arrow"
+        # メモリマップで読めるよう圧縮はしない
+        write_atomic(path, lambda f: frame.write_ipc(f, compression="uncompressed"))
+        return {
+            "file": path.name,
+            "rows": frame.height,
+            "index": file_fingerprint(path),
+        }
+
+    def _write_meta(self, header: dict, segments: List[dict], number: int) -> None:
+        """セグメントの一覧と、対応するデータファイルの指紋を書き込む"""
+        meta = {**header, "segments": segments, "next": number}
+        write_atomic(self.meta_path, lambda f: f.write(json.dumps(meta).encode()))
+
+    def _segment_files(self) -> List[Path]:
+        """この索引のセグメントファイル（メタデータにないものも含む）"""
+        return [
+            path
+            for path in self.directory.glob(f"{self.prefix}*.arrow")
+            if path.name[len(self.prefix) : -len(".arrow")].isdigit()
+        ]
+
+    def _remove(self, paths: List[Path], segments: List[dict]) -> None:
+        """メタデータを書き換えた後で、使わなくなったセグメントを消す"""
+        used = {segment["file"] for segment in segments}
+        for path in paths:
+            if path.name not in used:
+                path.unlink(missing_ok=True)
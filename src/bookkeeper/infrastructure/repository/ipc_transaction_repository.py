@@ -0,0 +1,61 @@
+"""
+Arrow IPC TransactionRepository 実装
+
+列指向の Arrow IPC (Feather v2) ファイルで仕訳を永続化する。
+読み込みはメモリマップで行うため、CSV のような解析処理が不要
+"""
+
+from pathlib import Path
+
+import polars as pl
+
+from bookkeeper.infrastructure.repository.file_io import write_atomic
+from bookkeeper.infrastructure.repository.frame_cache import FrameCache
+from bookkeeper.infrastructure.repository.polars_transaction_repository import (
+    PolarsTransactionRepository,
+)
+
+
+class IpcTransactionRepository(PolarsTransactionRepository):
+    """Arrow IPC 形式の仕訳リポジトリ（Polarsベース）"""
+
+    def __init__(
+        self,
+        ipc_path: Path,
+        amount_scale: int = 0,
+        frame_cache: FrameCache | None = None,
+    ):
+        self.ipc_path = ipc_path
+        super().__init__(ipc_path, amount_scale, frame_cache)
+        self._ensure_ipc_exists()
+
+    def _ensure_ipc_exists(self):
+        """IPCファイルが存在しない場合は空のファイルを作成"""
+        if self.ipc_path.exists():
+            return
+        with self.lock.exclusive():
+            # ロックを待つ間に他プロセスが作成・追記していれば上書きしない
+            if not self.ipc_path.exists():
+                self._write_all(self._empty_df())
+
+    def _scan(self) -> pl.LazyFrame:
+        """メモリマップした IPC ファイルを LazyFrame として読み込む"""
+        # フィルタは読み込み時に適用されるため、該当しない行は実体化されない
+        return pl.scan_ipc(self.ipc_path, memory_map=True)
+
+    def _write_rows(self, new_rows: pl.DataFrame) -> None:
+        """
+        新しい行を永続化
+
+        IPC ファイルは途中に追記できないため全体を書き直す。
+        大量の仕訳は add_many でまとめて追加すること
+        """
+        self._write_all(pl.concat([self._read_df(), new_rows]))
+
+    def _write_all(self, df: pl.DataFrame) -> None:
+        """一時ファイル + rename で全体をアトミックに書き直す"""
+        # メモリマップで読めるよう圧縮はしない
+        write_atomic(
+            self.ipc_path,
+            lambda f: df.write_ipc(f, compression="uncompressed"),
+        )
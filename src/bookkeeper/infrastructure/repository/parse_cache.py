@@ -0,0 +1,174 @@
+"""
+CSV の解析結果キャッシュ
+
+解析・検証済みの仕訳を Arrow IPC 形式で CSV の横に保存し、
+次のプロセスからはメモリマップで読み込んで CSV の解析と検証を省く。
+CSV の内容のハッシュを併せて保存し、末尾に追記されただけの場合は
+追記部分だけを解析して反映する
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import BinaryIO, Callable, List, Tuple
+
+import polars as pl
+
+from bookkeeper.common.profiling import add_bytes, span
+from bookkeeper.infrastructure.repository.file_io import (
+    file_fingerprint,
+    write_atomic,
+)
+
+# CSV の内容（ヘッダー行から始まるバイト列）を検証済みの DataFrame にする関数
+ParseFunction = Callable[[bytes], pl.DataFrame]
+
+# キャッシュの形式（互換性のない変更をしたら上げる）
+_FORMAT_VERSION = 1
+
+# ハッシュを求めるときに一度に読む大きさ
+_READ_SIZE = 1024 * 1024
+
+
+class ParseCache:
+    """CSV の解析・検証結果の保存先"""
+
+    def __init__(self, csv_path: Path, amount_scale: int):
+        self.csv_path = csv_path
+        self.amount_scale = amount_scale
+        self.cache_path = csv_path.with_name(f"{csv_path.name}.cache.arrow")
+        self.meta_path = csv_path.with_name(f"{csv_path.name}.cache.json")
+
+    def scan(self, parse: ParseFunction, refresh: bool = True) -> pl.LazyFrame | None:
+        """
+        検証済みの仕訳をメモリマップで読む LazyFrame を取得
+
+        CSV が保存時から変わっていなければそのまま使う。末尾に追記されただけなら
+        追記部分だけを parse して反映し、それ以外は全体を parse して作り直す
+
+        Args:
+            parse: CSV の内容を解析・検証する関数
+            refresh: False なら、反映や作り直しが必要な場合は None を返す
+
+        Raises:
+            ValueError: 不変条件に違反する行がある場合（キャッシュは更新しない）
+        """
+        meta = self._load_meta()
+        current = file_fingerprint(self.csv_path)
+        if meta is not None and meta["source"]["fingerprint"] == current:
+            add_bytes(meta["cache"][0])
+            return self._scan_cache()
+        if not refresh:
+            return None
+
+        # 指紋を取った時点の大きさまでを読む（読み込み中の追記は次回に反映する）
+        size = current[0]
+        add_bytes(size)
+        with self.csv_path.open("rb") as f:
+            if meta is not None:
+                refreshed = self._refresh_tail(f, meta, size, parse)
+                if refreshed is not None:
+                    return self._save(*refreshed, current)
+                f.seek(0)
+            content = f.read(size)
+        source = {
+            "digest": hashlib.blake2b(content).hexdigest(),
+            "ends_with_newline": content.endswith(b"\n"),
+        }
+        return self._save(parse(content), source, current)
+
+    def _refresh_tail(
+        self, f: BinaryIO, meta: dict, size: int, parse: ParseFunction
+    ) -> Tuple[pl.DataFrame, dict] | None:
+        """
+        追記された部分だけを解析してキャッシュの DataFrame に足す
+
+        Args:
+            f: 先頭に位置する CSV ファイル
+            meta: 保存時の情報
+            size: 現在の CSV の大きさ
+            parse: CSV の内容を解析・検証する関数
+
+        Returns:
+            追記後の DataFrame と CSV の情報。保存時の内容が先頭に
+            そのまま残っていない（追記以外の変更がある）場合や、
+            キャッシュが保存時の情報を読んだ後に置き換えられた場合は None
+        """
+        source = meta["source"]
+        cached_size = source["size"]
+        if size < cached_size or not source["ends_with_newline"]:
+            return None
+
+        # 保存時の範囲のハッシュが一致すれば、その範囲は変わっていない
+        hasher = hashlib.blake2b()
+        header = b""
+        remaining = cached_size
+        while remaining > 0:
+            chunk = f.read(min(_READ_SIZE, remaining))
+            if not chunk:
+                return None
+            if not header:
+                header = chunk.split(b"\n", 1)[0] + b"\n"
+            hasher.update(chunk)
+            remaining -= len(chunk)
+        if hasher.hexdigest() != source["digest"]:
+            return None
+
+        # 同時に読み込んだ他のプロセスが、保存時の情報を読んだ後にキャッシュを
+        # 追記後の内容に置き換えていれば、追記部分を二重に足さないよう使わない
+        with self.cache_path.open("rb") as cache_file:
+            stat = os.fstat(cache_file.fileno())
+            if [stat.st_size, stat.st_mtime_ns, stat.st_ino] != meta["cache"]:
+                return None
+            cached = pl.read_ipc(cache_file)
+
+        tail = f.read(size - cached_size)
+        hasher.update(tail)
+        new_rows = parse(header + tail)
+        refreshed_source = {
+            "digest": hasher.hexdigest(),
+            "ends_with_newline": tail.endswith(b"\n") if tail else True,
+        }
+        return pl.concat([cached, new_rows]), refreshed_source
+
+    def _scan_cache(self) -> pl.LazyFrame:
+        """キャッシュをメモリマップで読む"""
+        return pl.scan_ipc(self.cache_path, memory_map=True)
+
+    def _load_meta(self) -> dict | None:
+        """保存時の情報を読み込む（形式・桁数が違う、キャッシュが壊れている場合は None）"""
+        try:
+            meta = json.loads(self.meta_path.read_bytes())
+            if (
+                meta.get("version") != _FORMAT_VERSION
+                or meta.get("amount_scale") != self.amount_scale
+                or meta.get("cache") != file_fingerprint(self.cache_path)
+            ):
+                return None
+        except (FileNotFoundError, ValueError):
+            return None
+        return meta
+
+    def _save(
+        self, df: pl.DataFrame, source: dict, fingerprint: List[int]
+    ) -> pl.LazyFrame:
+        """キャッシュと保存時の情報を書き込み、キャッシュを読む LazyFrame を返す"""
+        with span("解析結果キャッシュの保存"):
+            # メモリマップで読めるよう圧縮はしない
+            write_atomic(
+                self.cache_path, lambda f: df.write_ipc(f, compression="uncompressed")
+            )
+            meta = {
+                "version": _FORMAT_VERSION,
+                "amount_scale": self.amount_scale,
+                "source": {
+                    "fingerprint": fingerprint,
+                    "size": fingerprint[0],
+                    **source,
+                },
+                # キャッシュだけが書き換わった場合（書き込み途中の中断など）を検出する
+                "cache": file_fingerprint(self.cache_path),
+            }
+            write_atomic(self.meta_path, lambda f: f.write(json.dumps(meta).encode()))
+        return self._scan_cache()
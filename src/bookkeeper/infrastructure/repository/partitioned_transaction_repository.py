@@ -0,0 +1,330 @@
+"""
+年度別パーティション TransactionRepository 実装
+
+仕訳を会計年度（暦年）ごとのファイルに分けてディレクトリに保存する。
+締めていない年度は CSV（YYYY.csv）に追記し、締めた年度は以後変更されないので
+圧縮した列指向の Parquet（YYYY.parquet）に凍結する。
+期間を指定した読み込みでは、期間と重なる年度のファイルだけを読む。
+仕訳は年度順・年度内は追加順に返す（年度をまたいで追加した順ではない）
+"""
+
+import re
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+import polars as pl
+
+from bookkeeper.common.profiling import add_rows, span
+from bookkeeper.infrastructure.repository.amount import AMOUNT_COLUMNS, parse_amounts
+from bookkeeper.infrastructure.repository.balance_index import BalanceIndex
+from bookkeeper.infrastructure.repository.csv_transaction_repository import (
+    CsvTransactionRepository,
+)
+from bookkeeper.infrastructure.repository.file_io import (
+    file_fingerprint,
+    fsync_dir,
+    write_atomic,
+)
+from bookkeeper.infrastructure.repository.fingerprint_index import FingerprintIndex
+from bookkeeper.infrastructure.repository.frame_cache import FrameCache
+from bookkeeper.infrastructure.repository.polars_transaction_repository import (
+    PolarsTransactionRepository,
+)
+from bookkeeper.infrastructure.repository.transaction_frame import (
+    validate_transaction_frame,
+)
+
+# 年度のファイル名（YYYY.csv / YYYY.parquet）
+_PARTITION_NAME = re.compile(r"(\d{4})\.(csv|parquet)")
+
+
+class PartitionedTransactionRepository(PolarsTransactionRepository):
+    """
+    会計年度ごとのファイルに分けた仕訳リポジトリ（Polarsベース）
+
+    仕訳は年度順・年度内は追加順に返す
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        amount_scale: int = 0,
+        frame_cache: FrameCache | None = None,
+        use_parse_cache: bool = False,
+        use_row_index: bool = False,
+    ):
+        self.directory = directory
+        # キャッシュ・索引は年度のファイルごとに持つ（全体はキャッシュしない）
+        super().__init__(directory, amount_scale, None)
+        self.partition_cache = frame_cache
+        self.use_parse_cache = use_parse_cache
+        self.use_row_index = use_row_index
+        # 年度のファイルごとのリポジトリ（解析結果キャッシュ・索引の状態ごと使い回す）
+        self._partition_repositories: Dict[Path, PolarsTransactionRepository] = {}
+        self.balance_index = BalanceIndex(directory, self._files_fingerprint)
+        self.fingerprint_index = FingerprintIndex(
+            directory, amount_scale, self._files_fingerprint
+        )
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def close_fiscal_year(self, year: int) -> int:
+        """
+        年度の CSV を Parquet に凍結し、以後その年度には追加できないようにする
+
+        Raises:
+            ValueError: 年度の仕訳がない、または既に締めている場合
+        """
+        with span("年度の締め"), self.lock.exclusive():
+            path = self._partitions(year, year).get(year)
+            if path is None:
+                raise ValueError(f"{year} 年度の仕訳がありません")
+            if path.suffix == ".parquet":
+                raise ValueError(f"{year} 年度は既に締めています")
+
+            before = self.balance_index.fingerprint()
+            partition = self._partition(path)
+            df = partition._read_df()
+            add_rows(df.height)
+            self._partition(path.with_suffix(".parquet"))._write_all(df)
+            # Parquet を書き終えてから CSV と、その解析結果キャッシュ・索引を消す
+            # （途中で止まって両方が残っても、読み込みでは Parquet を使う）
+            for sidecar in self.directory.glob(f"{path.name}.*"):
+                sidecar.unlink(missing_ok=True)
+            path.unlink()
+            fsync_dir(self.directory)
+            self._partition_repositories.pop(path, None)
+            self.lock.bump()
+            # 仕訳は変わらないので、索引はファイルの指紋だけを更新する
+            self.balance_index.update(df.clear(), before)
+            self.fingerprint_index.update(df.clear(), before)
+        if self.partition_cache is not None:
+            self.partition_cache.invalidate(partition._cache_key)
+        return df.height
+
+    def _scan(self) -> pl.LazyFrame:
+        """全ての年度のファイルを年度順につなげた LazyFrame（金額は文字列）"""
+        scans = [self._partition(path)._scan() for path in self._partitions().values()]
+        if not scans:
+            return pl.LazyFrame(schema=CsvTransactionRepository.SCHEMA)
+        return pl.concat(scans)
+
+    def _load(
+        self, condition: pl.Expr, start: date | None = None, end: date | None = None
+    ) -> pl.DataFrame:
+        """期間と重なる年度のファイルだけを読み込み、年度順につなげる"""
+        with self.lock.shared():
+            return self._concat(
+                self._partition(path)._select(condition, start, end)
+                for path in self._partitions(start, end).values()
+            )
+
+    def _select_account(
+        self, account_name: str, start: date | None, end: date | None
+    ) -> pl.DataFrame:
+        """期間と重なる年度のファイルから、指定した勘定科目を含む行を読み込む"""
+        with self.lock.shared():
+            return self._concat(
+                self._partition(path)._select_account(account_name, start, end)
+                for path in self._partitions(start, end).values()
+            )
+
+    def _iter_batches(
+        self, start: date | None = None, end: date | None = None
+    ) -> Tuple[Iterator[pl.DataFrame], bool]:
+        """期間と重なる年度のファイルを年度順に、検証済みのバッチで読み込む"""
+        return self._iter_partition_batches(start, end), True
+
+    def _iter_partition_batches(
+        self, start: date | None, end: date | None
+    ) -> Iterator[pl.DataFrame]:
+        """年度のファイルごとのバッチを、検証していなければ検証して返す"""
+        for path in self._partitions(start, end).values():
+            batches, validated = self._partition(path)._iter_batches()
+            row_offset = 0
+            for batch in batches:
+                if not validated:
+                    with span("検証"):
+                        add_rows(batch.height)
+                        batch = parse_amounts(batch, self.amount_scale, row_offset)
+                        validate_transaction_frame(batch, row_offset)
+                    row_offset += batch.height
+                yield batch
+
+    def _write_rows(self, new_rows: pl.DataFrame) -> None:
+        """
+        新しい行を年度ごとに分け、その年度の CSV に年度順に追記
+
+        書き込む前に全ての年度を確かめ、CSV を用意する。年度ごとの追記は
+        それぞれアトミックだが、年度をまたいではアトミックでない
+        （ある年度の書き込みが I/O エラーで失敗すると、それより前の年度の行は残る）
+
+        Raises:
+            ValueError: 締めた年度の行が含まれる場合（どの年度にも書き込まない）
+            OSError: 年度の CSV に書き込めない場合
+        """
+        groups = _split_by_year(new_rows)
+        partitions = self._partitions()
+        closed = [
+            year
+            for year in groups
+            if year in partitions and partitions[year].suffix == ".parquet"
+        ]
+        if closed:
+            years = ", ".join(str(year) for year in closed)
+            raise ValueError(f"締めた年度には仕訳を追加できません: {years}")
+
+        targets = [
+            (self._partition(self.directory / f"{year}.csv"), rows)
+            for year, rows in groups.items()
+        ]
+        for partition, rows in targets:
+            partition._store(rows)
+
+    def _write_all(self, df: pl.DataFrame) -> None:
+        """
+        締めていない年度ごとに書き直す。行のない年度は消す
+
+        締めた年度の Parquet は書き直さない（移行などで同じ仕訳を渡された場合はそのまま）
+
+        Raises:
+            ValueError: 締めた年度の仕訳が変わる・なくなる場合（どの年度も書き直さない）
+        """
+        partitions = self._partitions()
+        groups = _split_by_year(df)
+        changed = [
+            year
+            for year, path in partitions.items()
+            if path.suffix == ".parquet"
+            and not self._partition(path)
+            ._read_df()
+            .equals(groups.get(year, self._empty_df()))
+        ]
+        if changed:
+            years = ", ".join(str(year) for year in changed)
+            raise ValueError(f"締めた年度の仕訳は変更できません: {years}")
+
+        cache_keys = [self._partition(path)._cache_key for path in partitions.values()]
+        for year, rows in groups.items():
+            path = partitions.get(year, self.directory / f"{year}.csv")
+            if path.suffix == ".csv":
+                self._partition(path)._write_all(rows)
+        for year, path in partitions.items():
+            if year not in groups:
+                path.unlink()
+                self._partition_repositories.pop(path, None)
+        if self.partition_cache is not None:
+            for key in cache_keys:
+                self.partition_cache.invalidate(key)
+
+    def _fingerprint(self) -> List[int]:
+        """全ての年度のファイルの指紋と世代番号"""
+        return [*self._files_fingerprint(), self.lock.generation()]
+
+    def _files_fingerprint(self) -> List[int]:
+        """全ての年度のファイルの年度・サイズ・更新時刻・inode を並べたもの"""
+        return [
+            value
+            for year, path in self._partitions().items()
+            for value in (year, *file_fingerprint(path))
+        ]
+
+    def _data_size(self) -> int:
+        """全ての年度のファイルの大きさの合計（バイト）"""
+        return sum(file_fingerprint(path)[0] for path in self._partitions().values())
+
+    def _partitions(
+        self, start: date | int | None = None, end: date | int | None = None
+    ) -> Dict[int, Path]:
+        """
+        期間と重なる年度のファイル（年度順）
+
+        同じ年度の CSV と Parquet がある（締める途中で止まった）場合は Parquet を使う
+
+        Args:
+            start: 期間の開始日または開始年度（省略時は制限しない）
+            end: 期間の終了日または終了年度（省略時は制限しない）
+        """
+        first = start.year if isinstance(start, date) else start
+        last = end.year if isinstance(end, date) else end
+        found: Dict[int, Path] = {}
+        for path in self.directory.iterdir():
+            match = _PARTITION_NAME.fullmatch(path.name)
+            if match is None:
+                continue
+            year = int(match.group(1))
+            if first is not None and year < first:
+                continue
+            if last is not None and year > last:
+                continue
+            if year not in found or path.suffix == ".parquet":
+                found[year] = path
+        return dict(sorted(found.items()))
+
+    def _partition(self, path: Path) -> PolarsTransactionRepository:
+        """年度のファイルを読み書きするリポジトリ（ファイルごとに1つ作って使い回す）"""
+        partition = self._partition_repositories.get(path)
+        if partition is None:
+            partition = self._create_partition(path)
+            self._partition_repositories[path] = partition
+        elif isinstance(partition, CsvTransactionRepository):
+            # 他のプロセスが行のなくなった年度を消していれば、空の CSV を作り直す
+            partition._ensure_csv_exists()
+        return partition
+
+    def _create_partition(self, path: Path) -> PolarsTransactionRepository:
+        """年度のファイルを読み書きするリポジトリを作る"""
+        if path.suffix == ".parquet":
+            return _FrozenPartition(path, self.amount_scale, self.partition_cache)
+        return _OpenPartition(
+            path,
+            amount_scale=self.amount_scale,
+            frame_cache=self.partition_cache,
+            use_parse_cache=self.use_parse_cache,
+            use_row_index=self.use_row_index,
+        )
+
+    def _concat(self, frames: Iterator[pl.DataFrame]) -> pl.DataFrame:
+        """年度ごとの DataFrame をつなげる（年度のファイルがなければ空）"""
+        frames = list(frames)
+        return pl.concat(frames) if frames else self._empty_df()
+
+
+class _OpenPartition(CsvTransactionRepository):
+    """締めていない年度の CSV（月次残高索引・内容の指紋索引は全体で持つ）"""
+
+    def _update_indexes(self, new_rows: pl.DataFrame, before: List[int]) -> None:
+        """年度のファイルごとの月次残高索引・内容の指紋索引は使わない"""
+
+
+class _FrozenPartition(PolarsTransactionRepository):
+    """締めた年度の Parquet ファイル（検証済みの仕訳を保存し、追記はできない）"""
+
+    def _scan(self) -> pl.LazyFrame:
+        """Parquet を LazyFrame として読み込む（金額は解析し直せるよう文字列にする）"""
+        return pl.scan_parquet(self.data_path).with_columns(
+            pl.col(AMOUNT_COLUMNS).cast(pl.String)
+        )
+
+    def _scan_validated(self, refresh: bool = True) -> pl.LazyFrame | None:
+        """締めたときに検証済みの仕訳を読む（金額の桁数が変わっていれば None）"""
+        lf = pl.scan_parquet(self.data_path)
+        if dict(lf.collect_schema()) != self.schema:
+            return None
+        return lf
+
+    def _write_rows(self, new_rows: pl.DataFrame) -> None:
+        """締めた年度には追加できない"""
+        raise ValueError(f"締めた年度には仕訳を追加できません: {self.data_path.stem}")
+
+    def _write_all(self, df: pl.DataFrame) -> None:
+        """一時ファイル + rename で全体をアトミックに書き直す"""
+        write_atomic(self.data_path, lambda f: df.write_parquet(f, compression="zstd"))
+
+
+def _split_by_year(df: pl.DataFrame) -> Dict[int, pl.DataFrame]:
+    """行を日付の年度ごとに分ける（年度内の順序は保つ）"""
+    groups = df.with_columns(pl.col("date").dt.year().alias("year")).partition_by(
+        "year", as_dict=True, include_key=False, maintain_order=True
+    )
+    return {year: rows for (year,), rows in sorted(groups.items())}
@@ -0,0 +1,699 @@
+"""
+Polars ベースの TransactionRepository 共通実装
+
+保存形式ごとの読み書きだけをサブクラスに任せ、
+検索・変換・検証は Polars の DataFrame 上で共通に行う
+"""
+
+from abc import abstractmethod
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+from uuid import uuid4
+
+import polars as pl
+
+from bookkeeper.common.profiling import add_bytes, add_rows, span
+from bookkeeper.domain.entity.transaction import Transaction
+from bookkeeper.domain.entity.transaction_record import TransactionRecord
+from bookkeeper.domain.repository.transaction_repository import TransactionRepository
+from bookkeeper.domain.service.ledger_service import LedgerEntry
+from bookkeeper.domain.service.report_service import AccountTotal
+from bookkeeper.application.read_model.transaction_frames import (
+    TransactionFrameReader,
+)
+from bookkeeper.infrastructure.repository.amount import (
+    amount_dtype,
+    fixed_point_series,
+    parse_amounts,
+    to_fixed_point,
+)
+from bookkeeper.infrastructure.repository.balance_index import (
+    BalanceIndex,
+    MonthlyMovements,
+)
+from bookkeeper.infrastructure.repository.file_io import file_fingerprint
+from bookkeeper.infrastructure.repository.fingerprint_index import (
+    CONTENT_COLUMNS,
+    FingerprintIndex,
+)
+from bookkeeper.infrastructure.repository.file_lock import FileLock
+from bookkeeper.infrastructure.repository.frame_cache import FrameCache
+from bookkeeper.infrastructure.repository.transaction_frame import (
+    COLUMNS,
+    build_transactions,
+    frame_to_records,
+    shared_values,
+    validate_transaction_frame,
+)
+
+# iter_all で一度に実体化する行数
+_BATCH_SIZE = 50_000
+
+
+class PolarsTransactionRepository(TransactionRepository, TransactionFrameReader):
+    """
+    Polarsベースの仕訳リポジトリの基底クラス
+
+    検証済みの DataFrame をそのまま返す読み取りモデル（TransactionFrameReader）も兼ねる
+    """
+
+    def __init__(
+        self,
+        data_path: Path,
+        amount_scale: int = 0,
+        frame_cache: FrameCache | None = None,
+    ):
+        self.data_path = data_path
+        self.amount_scale = amount_scale
+        # 解析済みの全件をプロセス内で共有するキャッシュ（None なら毎回読み込む）
+        self.frame_cache = frame_cache
+        self._cache_key = (str(data_path.absolute()), amount_scale)
+        # 他プロセスとの読み書きの排他制御と、書き込みごとに進む世代番号
+        self.lock = FileLock(data_path)
+        # 期間指定の元帳で繰越残高を求めるための月次残高索引
+        self.balance_index = BalanceIndex(data_path)
+        # 同じ内容の仕訳が既にあるかを判定するための内容の指紋索引
+        self.fingerprint_index = FingerprintIndex(data_path, amount_scale)
+        # メモリ上のスキーマ（金額は小数点以下 amount_scale 桁の固定小数点）
+        self.schema = {
+            "id": pl.String,  # UUID を文字列として保持
+            "date": pl.Date,
+            "debit_account": pl.String,
+            "debit_amount": amount_dtype(amount_scale),
+            "credit_account": pl.String,
+            "credit_amount": amount_dtype(amount_scale),
+            "description": pl.String,
+            "note": pl.String,
+            "evidence_path": pl.String,
+        }
+
+    @abstractmethod
+    def _scan(self) -> pl.LazyFrame:
+        """保存済みの仕訳をスキーマ順の LazyFrame として取得（金額は文字列でもよい）"""
+        pass
+
+    def _scan_validated(self, refresh: bool = True) -> pl.LazyFrame | None:
+        """
+        検証済みの仕訳をスキーマ順の LazyFrame として取得（金額は固定小数点）
+
+        解析・検証の結果を保存しておける実装はオーバーライドすること（既定では None）。
+        refresh が False なら、保存済みの結果を作り直す必要がある場合も None を返す
+        """
+        return None
+
+    @abstractmethod
+    def _write_rows(self, new_rows: pl.DataFrame) -> None:
+        """新しい行を永続化"""
+        pass
+
+    @abstractmethod
+    def _write_all(self, df: pl.DataFrame) -> None:
+        """全ての行を書き直す"""
+        pass
+
+    def add(self, transaction: Transaction) -> None:
+        """仕訳を追加"""
+        self._store(self._transactions_to_df([transaction]))
+
+    def add_many(self, transactions: Iterable[Transaction]) -> int:
+        """複数の仕訳を一括で追加（1回の書き込みで済ませる）"""
+        new_rows = self._transactions_to_df(transactions)
+        if new_rows.height > 0:
+            self._store(new_rows)
+        return new_rows.height
+
+    def migrate(self) -> None:
+        """列構成と金額の表記を現在の形式に揃えて書き直す"""
+        with self.lock.exclusive():
+            self._write_all(self._collect(self._scan()))
+            self.lock.bump()
+        if self.frame_cache is not None:
+            self.frame_cache.invalidate(self._cache_key)
+
+    def generation(self) -> int:
+        """データファイルの世代番号（書き込みのたびに1つ進む）"""
+        return self.lock.generation()
+
+    def rebuild_indexes(self) -> None:
+        """月次残高索引と内容の指紋索引を全件から作り直す"""
+        # 読み込みから指紋の記録までの間に追記されないよう、読み込み用のロックの中で行う
+        with self.lock.shared():
+            df = self._read_df()
+            self.balance_index.rebuild(df)
+            self.fingerprint_index.rebuild(df)
+
+    def verify_indexes(self) -> List[str]:
+        """月次残高索引と内容の指紋索引を全件の再計算と照合し、不一致の内容を返す"""
+        df = self._read_df()
+        problems = []
+        hashes = self.fingerprint_index.load()
+        if hashes is None:
+            problems.append(
+                "内容の指紋索引がないか、データファイルの変更後に更新されていません"
+            )
+        elif not pl.concat(hashes).sort().equals(FingerprintIndex.compute(df).sort()):
+            problems.append("内容の指紋索引が仕訳の内容と一致しません")
+
+        stored = self.balance_index.load()
+        if stored is None:
+            return problems + [
+                "月次残高索引がないか、データファイルの変更後に更新されていません"
+            ]
+
+        expected = BalanceIndex.compute(df)
+        for account in sorted(stored.keys() | expected.keys()):
+            stored_months = stored.get(account, {})
+            expected_months = expected.get(account, {})
+            for month in sorted(stored_months.keys() | expected_months.keys()):
+                actual = stored_months.get(month, Decimal("0"))
+                correct = expected_months.get(month, Decimal("0"))
+                if actual != correct:
+                    problems.append(
+                        f"{account} {month}: 索引 {actual} / 再計算 {correct}"
+                    )
+        return problems
+
+    def find_duplicates(self, transactions: Sequence[Transaction]) -> List[bool]:
+        """
+        同じ内容の仕訳が保存済みか、transactions の前の方にあるかを判定
+
+        内容の指紋索引のハッシュ値を二分探索するので、データファイルは読まない
+        （索引がない・古い場合だけ全件から作り直す）。金額を小数点以下
+        amount_scale 桁で表現できない仕訳は保存できないので、重複とはしない
+        （保存するときのエラーとして、その仕訳だけを報告できるようにする）
+        """
+        try:
+            # 貸方金額は借方金額と等しい（Transaction で検証済み）ので借方だけ変換する
+            new_rows = self._content_df(transactions)
+        except ValueError:
+            storable = [self._is_storable(txn) for txn in transactions]
+            found = iter(
+                self.find_duplicates(
+                    [txn for txn, ok in zip(transactions, storable) if ok]
+                )
+            )
+            return [ok and next(found) for ok in storable]
+        hashes = FingerprintIndex.compute(new_rows)
+        stored = self.fingerprint_index.load()
+        if stored is None:
+            # 読み込みから指紋の記録までの間に追記されないよう、ロックの中で作り直す
+            with span("指紋索引の作成"), self.lock.shared():
+                stored = self.fingerprint_index.rebuild(self._read_df())
+        with span("重複の照合"):
+            add_rows(hashes.len())
+            duplicated = (
+                FingerprintIndex.lookup(stored, hashes) | ~hashes.is_first_distinct()
+            )
+        return duplicated.to_list()
+
+    def find_duplicate_frame(
+        self, start: date | None = None, end: date | None = None
+    ) -> pl.DataFrame:
+        """期間内で同じ内容の仕訳の組を、1回の読み込みと集計で求める"""
+        df = self._select(_within(start, end), start, end)
+        with span("重複の集計"):
+            add_rows(df.height)
+            first_row = pl.col("row").min().over(CONTENT_COLUMNS)
+            return (
+                df.with_row_index("row")
+                .filter(pl.struct(CONTENT_COLUMNS).is_duplicated())
+                .with_columns(first_row.rank("dense").alias("group"))
+                .sort("group", "row")
+                .select("group", *COLUMNS)
+            )
+
+    def find_all(
+        self, start: date | None = None, end: date | None = None
+    ) -> List[Transaction]:
+        """期間内の全ての仕訳を取得"""
+        # 期間の条件は読み込み時に適用し、範囲外の行は金額の変換・検証をしない
+        return self._df_to_transactions(self._select(_within(start, end), start, end))
+
+    def find_by_account(
+        self, account_name: str, start: date | None = None, end: date | None = None
+    ) -> List[Transaction]:
+        """期間内の指定した勘定科目を含む仕訳を取得"""
+        # Polarsの効率的なフィルタリング（保存形式が対応していれば読み込み時に絞り込む）
+        filtered = self._select_account(account_name, start, end)
+        return self._df_to_transactions(filtered)
+
+    def iter_all(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> Iterator[TransactionRecord]:
+        """期間内の仕訳を追加順に1件ずつ返す（iter_frames のバッチを順に変換する）"""
+        for batch in self.iter_frames(start, end, offset, limit):
+            with span("読み取りモデル生成"):
+                add_rows(batch.height)
+                records = frame_to_records(batch)
+            yield from records
+
+    def iter_frames(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> Iterator[pl.DataFrame]:
+        """
+        期間内の仕訳を追加順に、検証済みの DataFrame のバッチで返す
+
+        ストリーミングエンジンで _BATCH_SIZE 行ずつ読み込み、変換・検証するので、
+        メモリ使用量は仕訳の件数によらず一定になる。
+        読み込み中に書き込みを止めないよう、ロックは取らない
+        """
+        # 期間の条件はバッチごとに適用する（LazyFrame 側に filter を置くと、
+        # 読み込みが出力より先行してバッファが件数に応じて増えるため）
+        condition = _within(start, end)
+        skip, remaining = offset, limit
+        row_offset = offset
+        batches, validated = self._iter_batches(start, end)
+        for batch in batches:
+            batch = batch.filter(condition)
+            if skip > 0:
+                skipped = min(skip, batch.height)
+                batch = batch.slice(skipped)
+                skip -= skipped
+            if remaining is not None:
+                batch = batch.head(remaining)
+                remaining -= batch.height
+            if batch.height > 0:
+                if not validated:
+                    with span("検証"):
+                        add_rows(batch.height)
+                        batch = parse_amounts(batch, self.amount_scale, row_offset)
+                        validate_transaction_frame(batch, row_offset)
+                yield batch.with_columns(pl.col("note", "evidence_path").fill_null(""))
+                row_offset += batch.height
+            if remaining == 0:
+                # 必要な件数に達したら残りは読まない
+                break
+
+    def find_ledger(
+        self, account_name: str, start: date | None = None, end: date | None = None
+    ) -> List[LedgerEntry]:
+        """指定した勘定科目の元帳を取得（find_ledger_frame の結果を変換する）"""
+        ledger = self.find_ledger_frame(account_name, start, end)
+        # 残高以外は同じ値のオブジェクトを行の間で共有する
+        return [
+            LedgerEntry(*row)
+            for row in zip(
+                *(shared_values(column) for column in ledger[:, :4].iter_columns()),
+                ledger.get_column("balance").to_list(),
+            )
+        ]
+
+    def find_ledger_frame(
+        self, account_name: str, start: date | None = None, end: date | None = None
+    ) -> pl.DataFrame:
+        """
+        指定した勘定科目の元帳を DataFrame で取得
+
+        絞り込みと残高の累計を Polars の式で一括計算する。
+        開始日の指定があれば、開始月より前の増減は月次残高索引から求め、
+        開始月以降の仕訳だけを読む。行の順序・金額は LedgerService と同じ
+        """
+        opening = Decimal("0")
+        month_start = None
+        if start is not None:
+            month_start = start.replace(day=1)
+            movements = self._load_movements()
+            opening = BalanceIndex.balance_before(movements, account_name, month_start)
+        df = self._select_account(account_name, month_start, end)
+
+        debit = pl.when(pl.col("debit_account") == account_name).then("debit_amount")
+        credit = pl.when(pl.col("credit_account") == account_name).then("credit_amount")
+        movement = debit.fill_null(0) - credit.fill_null(0)
+        if start is not None:
+            # 開始月の初日から開始日の前日までの増減も繰越残高に含める
+            before_start = df.filter(pl.col("date") < start)
+            opening += before_start.select(movement.sum()).item() or Decimal("0")
+            df = df.filter(pl.col("date") >= start)
+
+        return df.select(
+            "date",
+            "description",
+            debit.alias("debit_amount"),
+            credit.alias("credit_amount"),
+            (
+                movement.cum_sum()
+                + pl.lit(opening, dtype=amount_dtype(self.amount_scale))
+            ).alias("balance"),
+        )
+
+    def find_ledger_frames(
+        self,
+        account_names: Sequence[str],
+        start: date | None = None,
+        end: date | None = None,
+    ) -> Dict[str, pl.DataFrame]:
+        """
+        複数の勘定科目の元帳を DataFrame でまとめて取得
+
+        全件を1回だけ読み、仕訳を借方・貸方の勘定科目ごとの行に展開して、
+        残高の累計を勘定科目ごとの window 式（over）で並列に計算する。
+        各元帳は find_ledger_frame と同じ
+        """
+        month_start = None if start is None else start.replace(day=1)
+        df = self._select(_within(month_start, end), month_start, end)
+        df = df.with_row_index("row")
+
+        # 借方・貸方の両方に同じ勘定科目がある仕訳は1行にする（LedgerService と同じ）
+        sides = pl.concat(
+            [
+                df.with_columns(pl.col("debit_account").alias("account")),
+                df.filter(
+                    pl.col("credit_account") != pl.col("debit_account")
+                ).with_columns(pl.col("credit_account").alias("account")),
+            ]
+        )
+        # 勘定科目ごとの行の順序を元の仕訳の順序にそろえる
+        sides = sides.filter(pl.col("account").is_in(list(account_names))).sort("row")
+
+        # 開始月より前の増減は月次残高索引から求める
+        dtype = amount_dtype(self.amount_scale)
+        openings = {account_name: Decimal("0") for account_name in account_names}
+        if month_start is not None:
+            movements = self._load_movements()
+            for account_name in account_names:
+                openings[account_name] = BalanceIndex.balance_before(
+                    movements, account_name, month_start
+                )
+        opening = pl.DataFrame(
+            {"account": list(openings), "opening": list(openings.values())},
+            schema={"account": pl.String, "opening": dtype},
+        )
+
+        debit = pl.when(pl.col("debit_account") == pl.col("account")).then(
+            "debit_amount"
+        )
+        credit = pl.when(pl.col("credit_account") == pl.col("account")).then(
+            "credit_amount"
+        )
+        movement = debit.fill_null(0) - credit.fill_null(0)
+        # 開始月の初日から開始日の前日までの行も累計に含めてから除く
+        ledgers = (
+            sides.join(opening, on="account", how="left")
+            .select(
+                "account",
+                "date",
+                "description",
+                debit.alias("debit_amount"),
+                credit.alias("credit_amount"),
+                (movement.cum_sum().over("account") + pl.col("opening"))
+                .cast(dtype)
+                .alias("balance"),
+            )
+            .filter(_within(start, None))
+        )
+
+        partitions = ledgers.partition_by("account", as_dict=True, include_key=False)
+        empty = ledgers.clear().drop("account")
+        return {
+            account_name: partitions.get((account_name,), empty)
+            for account_name in account_names
+        }
+
+    def summarize_by_account(
+        self, start: date | None = None, end: date | None = None
+    ) -> List[AccountTotal]:
+        """
+        期間内の勘定科目別の借方・貸方合計を取得
+
+        勘定科目の数に関わらず、1回の読み込みと1回の group_by で集計する
+        """
+        df = self._select(_within(start, end), start, end)
+
+        zero = pl.lit(0, dtype=amount_dtype(self.amount_scale))
+        sides = pl.concat(
+            [
+                df.select(
+                    pl.col("debit_account").alias("account"),
+                    pl.col("debit_amount").alias("debit"),
+                    zero.alias("credit"),
+                ),
+                df.select(
+                    pl.col("credit_account").alias("account"),
+                    zero.alias("debit"),
+                    pl.col("credit_amount").alias("credit"),
+                ),
+            ]
+        )
+        totals = sides.group_by("account").agg(pl.sum("debit"), pl.sum("credit"))
+        return [
+            AccountTotal(account_name=account, debit_total=debit, credit_total=credit)
+            for account, debit, credit in totals.sort("account").iter_rows()
+        ]
+
+    def _store(self, new_rows: pl.DataFrame) -> None:
+        """
+        新しい行を永続化し、月次残高索引・内容の指紋索引・キャッシュに反映
+
+        書き込み前の状態の確認から索引・キャッシュへの反映までを
+        書き込み用のロックの中で行い、他プロセスの書き込みと混ざらないようにする
+        """
+        with span("書き込み"), self.lock.exclusive():
+            add_rows(new_rows.height)
+            before = self.balance_index.fingerprint()
+            cached_before = self._fingerprint()
+            self._write_rows(new_rows)
+            self.lock.bump()
+            self._update_indexes(new_rows, before)
+            if self.frame_cache is not None:
+                self.frame_cache.append(
+                    self._cache_key, cached_before, self._fingerprint(), new_rows
+                )
+
+    def _update_indexes(self, new_rows: pl.DataFrame, before: List[int]) -> None:
+        """追記した行を月次残高索引・内容の指紋索引に反映（before は追記前の指紋）"""
+        self.balance_index.update(new_rows, before)
+        self.fingerprint_index.update(new_rows, before)
+
+    def _load_movements(self) -> MonthlyMovements:
+        """月次残高索引を読み込む（ない・古い場合は全件から作り直す）"""
+        movements = self.balance_index.load()
+        if movements is not None:
+            return movements
+        # 読み込みから指紋の記録までの間に追記されると、追記した行を含まない索引が
+        # 最新として記録されるので、読み込み用のロックの中で作り直す
+        with span("残高索引の作成"), self.lock.shared():
+            return self.balance_index.rebuild(self._read_df())
+
+    def _read_df(self) -> pl.DataFrame:
+        """全ての仕訳をスキーマ順のDataFrameとして読み込み、検証する（金額は固定小数点）"""
+        if self.frame_cache is None:
+            return self._load(pl.lit(True))
+
+        # 読み込み前の指紋で登録するので、読み込み中に変更されても次回は読み直す
+        fingerprint = self._fingerprint()
+        df = self.frame_cache.get(self._cache_key, fingerprint)
+        if df is None:
+            df = self._load(pl.lit(True))
+            self.frame_cache.put(self._cache_key, fingerprint, df)
+        return df
+
+    def _select(
+        self, condition: pl.Expr, start: date | None = None, end: date | None = None
+    ) -> pl.DataFrame:
+        """
+        条件に合う行を読み込み、検証する（金額は固定小数点）
+
+        キャッシュを使う場合は全件をキャッシュしてから絞り込み、
+        使わない場合は条件を読み込み時に適用する。
+        start / end は condition が絞り込む期間（_load に渡す）
+        """
+        if self.frame_cache is None:
+            return self._load(condition, start, end)
+        return self._read_df().filter(condition)
+
+    def _select_account(
+        self, account_name: str, start: date | None, end: date | None
+    ) -> pl.DataFrame:
+        """
+        指定した勘定科目を含む期間内の行を読み込み、検証する（金額は固定小数点）
+
+        全件がキャッシュ済みならそこから絞り込む。なければ索引から候補の行だけを
+        読み（_scan_account）、索引を使えない場合は _select と同じく読み込む
+        """
+        condition = _involves(account_name) & _within(start, end)
+        if self.frame_cache is not None:
+            cached = self.frame_cache.get(self._cache_key, self._fingerprint())
+            if cached is not None:
+                return cached.filter(condition)
+
+        with span("読み込み"), self.lock.shared():
+            candidates = self._scan_account(account_name, start, end)
+            if candidates is not None:
+                df = self._collect(candidates.filter(condition))
+                add_rows(df.height)
+        if candidates is None:
+            return self._select(condition, start, end)
+        with span("検証"):
+            validate_transaction_frame(df)
+        return df
+
+    def _scan_account(
+        self, account_name: str, start: date | None, end: date | None
+    ) -> pl.LazyFrame | None:
+        """
+        指定した勘定科目を含む期間内の行の候補を、索引から読む LazyFrame として取得
+
+        候補には条件に合わない行が含まれてもよい（金額は文字列でもよい）。
+        索引を持つ実装はオーバーライドすること（既定では None）
+        """
+        return None
+
+    def _load(
+        self, condition: pl.Expr, start: date | None = None, end: date | None = None
+    ) -> pl.DataFrame:
+        """
+        保存形式から条件に合う行を読み込み、検証する（金額は固定小数点）
+
+        検証済みの結果を読める保存形式では、解析・検証を省く。
+        追記途中の行を読まないよう、読み込み用のロックの中で読む。
+        start / end は condition が絞り込む期間で、期間ごとにファイルを分ける
+        実装が読むファイルを選ぶのに使う（既定では使わない）
+
+        Raises:
+            ValueError: 不変条件に違反する行がある場合
+        """
+        with span("読み込み"), self.lock.shared():
+            validated = self._scan_validated()
+            if validated is not None:
+                df = validated.filter(condition).collect()
+                add_rows(df.height)
+                return df
+            add_bytes(self._data_size())
+            df = self._collect(self._scan().filter(condition))
+            add_rows(df.height)
+        with span("検証"):
+            validate_transaction_frame(df)
+        return df
+
+    def _iter_batches(
+        self, start: date | None = None, end: date | None = None
+    ) -> Tuple[Iterator[pl.DataFrame], bool]:
+        """
+        全ての仕訳を _BATCH_SIZE 行ずつ読み込む
+
+        キャッシュ済みならそこから切り出し、なければキャッシュに入れずに
+        ストリーミングエンジンで読む。バッチには期間外の行が含まれてもよい
+        （start / end は _load と同じく読むファイルを選ぶためのもの）
+
+        Returns:
+            バッチのイテレータと、バッチが検証済み（金額は固定小数点）かどうか
+        """
+        if self.frame_cache is not None:
+            cached = self.frame_cache.get(self._cache_key, self._fingerprint())
+            if cached is not None:
+                return cached.iter_slices(_BATCH_SIZE), True
+        # 保存済みの検証結果は、作り直しが要らない場合だけ使う（全件を読み込まない）
+        validated = self._scan_validated(refresh=False)
+        if validated is not None:
+            return validated.collect_batches(chunk_size=_BATCH_SIZE, lazy=True), True
+        add_bytes(self._data_size())
+        return self._scan().collect_batches(chunk_size=_BATCH_SIZE, lazy=True), False
+
+    def _fingerprint(self) -> List[int]:
+        """データファイルの指紋（サイズ・更新時刻・inode）と世代番号"""
+        # 更新時刻の精度が粗いファイルシステムでも、世代番号で変更を区別できる
+        return [*file_fingerprint(self.data_path), self.lock.generation()]
+
+    def _data_size(self) -> int:
+        """データファイルの大きさ（バイト）"""
+        return file_fingerprint(self.data_path)[0]
+
+    def _collect(self, lf: pl.LazyFrame) -> pl.DataFrame:
+        """LazyFrameを実体化し、金額を固定小数点に変換"""
+        return parse_amounts(lf.collect(), self.amount_scale)
+
+    def _empty_df(self) -> pl.DataFrame:
+        """スキーマ通りの空のDataFrame"""
+        return pl.DataFrame(schema=self.schema)
+
+    def _is_storable(self, transaction: Transaction) -> bool:
+        """金額を小数点以下 amount_scale 桁で表現できるか"""
+        try:
+            to_fixed_point(transaction.debit_amount, self.amount_scale)
+            to_fixed_point(transaction.credit_amount, self.amount_scale)
+        except ValueError:
+            return False
+        return True
+
+    def _transactions_to_df(self, transactions: Iterable[Transaction]) -> pl.DataFrame:
+        """
+        Transactionの列をスキーマ順のDataFrameに変換
+
+        Raises:
+            ValueError: 金額が小数点以下 amount_scale 桁で表現できない場合
+        """
+        transactions = list(transactions)
+        columns = {
+            "id": [str(txn.id or uuid4()) for txn in transactions],
+            **self._content_columns(transactions),
+            "credit_amount": fixed_point_series(
+                "credit_amount",
+                (txn.credit_amount for txn in transactions),
+                self.amount_scale,
+            ),
+            "note": [txn.note for txn in transactions],
+            "evidence_path": [txn.evidence_path for txn in transactions],
+        }
+        return pl.DataFrame(
+            {name: columns[name] for name in COLUMNS}, schema=self.schema
+        )
+
+    def _content_df(self, transactions: Sequence[Transaction]) -> pl.DataFrame:
+        """
+        Transactionの列を内容の列（CONTENT_COLUMNS）だけのDataFrameに変換
+
+        Raises:
+            ValueError: 金額が小数点以下 amount_scale 桁で表現できない場合
+        """
+        return pl.DataFrame(
+            self._content_columns(transactions),
+            schema={name: self.schema[name] for name in CONTENT_COLUMNS},
+        )
+
+    def _content_columns(self, transactions: Sequence[Transaction]) -> dict:
+        """内容の列（CONTENT_COLUMNS）の値（金額は固定小数点の列）"""
+        scale = self.amount_scale
+        return {
+            "date": [txn.date for txn in transactions],
+            "debit_account": [txn.debit_account for txn in transactions],
+            "credit_account": [txn.credit_account for txn in transactions],
+            "debit_amount": fixed_point_series(
+                "debit_amount", (txn.debit_amount for txn in transactions), scale
+            ),
+            "description": [txn.description for txn in transactions],
+        }
+
+    def _df_to_transactions(self, df: pl.DataFrame) -> List[Transaction]:
+        """検証済みのDataFrameをTransactionのリストに変換"""
+        with span("Transaction 生成"):
+            add_rows(df.height)
+            return build_transactions(
+                zip(*(df.get_column(name).to_list() for name in COLUMNS))
+            )
+
+
+def _involves(account_name: str) -> pl.Expr:
+    """借方・貸方のどちらかが指定した勘定科目である行"""
+    return (pl.col("debit_account") == account_name) | (
+        pl.col("credit_account") == account_name
+    )
+
+
+def _within(start: date | None, end: date | None) -> pl.Expr:
+    """日付が期間内の行（指定のない側は制限しない）"""
+    condition = pl.lit(True)
+    if start is not None:
+        condition &= pl.col("date") >= start
+    if end is not None:
+        condition &= pl.col("date") <= end
+    return condition
@@ -0,0 +1,189 @@
+"""
+CSV の行位置索引
+
+CSV の各行のバイト位置と長さを、借方・貸方の勘定科目と月とともに CSV の横に
+Arrow IPC 形式で保存する。勘定科目や期間で絞り込む読み込みでは、索引から
+該当する行だけを読み出して解析し、CSV 全体は解析しない。
+追記した行の位置は新しいセグメントに書き、索引全体は書き直さない
+"""
+
+import mmap
+from datetime import date
+from pathlib import Path
+from typing import List
+
+import polars as pl
+
+from bookkeeper.infrastructure.repository.file_io import file_fingerprint
+from bookkeeper.infrastructure.repository.index_segments import IndexSegments
+
+# 索引ファイルの形式（互換性のない変更をしたら上げる）
+_FORMAT_VERSION = 2
+
+
+class RowIndex:
+    """CSV の行位置索引"""
+
+    def __init__(self, csv_path: Path):
+        self.csv_path = csv_path
+        # 追記した行の位置は、CSV 上の順に後ろのセグメントへつなげる
+        self.segments = IndexSegments(
+            csv_path, "rows", lambda older, newer: pl.concat([older, newer])
+        )
+
+    def fingerprint(self) -> List[int]:
+        """CSV の指紋（サイズ・更新時刻・inode）"""
+        return file_fingerprint(self.csv_path)
+
+    def load(self, fingerprint: List[int] | None = None) -> pl.DataFrame | None:
+        """
+        索引を読み込む
+
+        Args:
+            fingerprint: 索引が対応しているべき CSV の指紋（省略時は現在の指紋）
+
+        Returns:
+            行ごとの offset・length・debit_account・credit_account・month。
+            索引がない・CSV が索引の作成後に変更された場合は None
+        """
+        segments = self.segments.load(self._header(fingerprint or self.fingerprint()))
+        if segments is None:
+            return None
+        return pl.concat(segments)
+
+    def rebuild(self, df: pl.DataFrame) -> pl.DataFrame | None:
+        """
+        CSV の全行とその解析結果から索引を作り直す
+
+        Args:
+            df: CSV の全行を解析・検証した DataFrame（CSV と同じ順序）
+
+        Returns:
+            作り直した索引。CSV の行と df の行を対応づけられない場合は None
+        """
+        fingerprint = self.fingerprint()
+        with self.csv_path.open("rb") as f:
+            content = f.read(fingerprint[0])
+        spans = _record_spans(content, 0)
+        if spans is None or spans.height != df.height + 1:
+            return None
+        # 先頭の記録はヘッダー行
+        index = _index_rows(spans.slice(1), df)
+        self.segments.save(index, self._header(fingerprint))
+        return index
+
+    def update(self, new_rows: pl.DataFrame, before: List[int]) -> None:
+        """
+        末尾に追記した行の位置を索引に反映
+
+        追記前の時点で索引が最新でない、または CSV が置き換えられた
+        （全体を書き直した）場合は何もしない（次に使うときに作り直す）
+
+        Args:
+            new_rows: 追記した行
+            before: 追記前の CSV の指紋
+        """
+        current = self.fingerprint()
+        if current[2] != before[2] or current[0] < before[0]:
+            return
+        with self.csv_path.open("rb") as f:
+            f.seek(before[0])
+            tail = f.read(current[0] - before[0])
+        spans = _record_spans(tail, before[0])
+        if spans is None or spans.height != new_rows.height:
+            return
+        # 索引全体は読まず、追記前の CSV に対応していれば新しい行の位置だけを加える
+        self.segments.append(
+            _index_rows(spans, new_rows), self._header(before), self._header(current)
+        )
+
+    @staticmethod
+    def lookup(
+        index: pl.DataFrame,
+        account_name: str,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> pl.DataFrame:
+        """借方・貸方のどちらかが指定した勘定科目で、期間を含む月の行の位置"""
+        condition = (pl.col("debit_account") == account_name) | (
+            pl.col("credit_account") == account_name
+        )
+        if start is not None:
+            condition &= pl.col("month") >= start.replace(day=1)
+        if end is not None:
+            condition &= pl.col("month") <= end
+        return index.filter(condition).select("offset", "length")
+
+    def read(self, spans: pl.DataFrame) -> bytes:
+        """位置を指定した行を CSV から読み出し、ファイル上の順につなげる"""
+        if spans.height == 0:
+            return b""
+        with (
+            self.csv_path.open("rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        ):
+            return b"".join(
+                [
+                    mapped[offset : offset + length]
+                    for offset, length in spans.iter_rows()
+                ]
+            )
+
+    @staticmethod
+    def _header(fingerprint: List[int]) -> dict:
+        """索引が対応する CSV の指紋と索引の形式"""
+        return {"version": _FORMAT_VERSION, "source": fingerprint}
+
+
+def _record_spans(content: bytes, base: int) -> pl.DataFrame | None:
+    """
+    CSV の内容を記録（ヘッダー行・データ行）ごとの位置と長さに分ける
+
+    引用符の中の改行は記録の区切りにしない。空行は除く
+
+    Args:
+        content: CSV の一部（記録の境界から始まる）
+        base: content の先頭の CSV 上の位置
+
+    Returns:
+        offset・length の DataFrame。UTF-8 として読めない場合は None
+    """
+    try:
+        lines = pl.Series("line", content.split(b"\n"), dtype=pl.Binary).cast(pl.String)
+    except pl.exceptions.InvalidOperationError:
+        return None
+
+    line = pl.col("line")
+    length = line.str.len_bytes().cast(pl.Int64) + 1
+    spans = pl.DataFrame(lines).select(
+        (length.cum_sum() - length + base).alias("offset"),
+        length.alias("length"),
+        # 引用符の数が偶数になった行で記録が終わる
+        (line.str.count_matches('"', literal=True).cum_sum() % 2 == 0).alias("ends"),
+        (line.str.strip_chars("\r") == "").alias("blank"),
+    )
+    if not spans.get_column("ends").all():
+        record = pl.col("ends").shift(1, fill_value=True).cum_sum()
+        spans = spans.group_by(record.alias("record"), maintain_order=True).agg(
+            pl.col("offset").first(), pl.col("length").sum(), pl.col("blank").all()
+        )
+    # 末尾に改行がない最後の記録も、長さには改行を含める（読み出しはファイルの
+    # 末尾で切れる。後から追記されるときに補われる改行を含めるため）
+    return spans.filter(~pl.col("blank")).select(
+        "offset", pl.col("length").cast(pl.UInt32)
+    )
+
+
+def _index_rows(spans: pl.DataFrame, df: pl.DataFrame) -> pl.DataFrame:
+    """記録の位置と、その行の勘定科目・月を並べた索引の行"""
+    return pl.concat(
+        [
+            spans,
+            # 勘定科目の種類は少ないので辞書で持つ
+            df.select(
+                pl.col("debit_account", "credit_account").cast(pl.Categorical),
+                pl.col("date").dt.truncate("1mo").alias("month"),
+            ),
+        ],
+        how="horizontal",
+    )
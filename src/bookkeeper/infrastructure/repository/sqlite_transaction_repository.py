@@ -0,0 +1,322 @@
+"""
+SQLite TransactionRepository 実装
+
+勘定科目・日付のインデックスを持つ SQLite データベースで仕訳を永続化
+"""
+
+import sqlite3
+from datetime import date
+from pathlib import Path
+from typing import Iterable, Iterator, List, Sequence
+from uuid import uuid4
+
+from bookkeeper.domain.entity.transaction import Transaction
+from bookkeeper.domain.entity.transaction_record import TransactionRecord
+from bookkeeper.domain.repository.transaction_repository import TransactionRepository
+from bookkeeper.domain.service.ledger_service import LedgerEntry
+from bookkeeper.domain.service.report_service import AccountTotal
+from bookkeeper.infrastructure.repository.amount import (
+    from_minor_units,
+    to_minor_units,
+)
+from bookkeeper.infrastructure.repository.transaction_frame import (
+    build_records,
+    build_transactions,
+)
+
+# 金額は最小単位の整数で保存する。
+# 不変条件は CHECK 制約で保証するので、読み込み時の再検証は行わない
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS transactions (
+    seq INTEGER PRIMARY KEY,  -- 追加順
+    id TEXT NOT NULL UNIQUE,
+    date TEXT NOT NULL,  -- YYYY-MM-DD
+    debit_account TEXT NOT NULL CHECK (trim(debit_account) <> ''),
+    debit_amount INTEGER NOT NULL CHECK (debit_amount > 0),
+    credit_account TEXT NOT NULL CHECK (trim(credit_account) <> ''),
+    credit_amount INTEGER NOT NULL CHECK (credit_amount > 0),
+    description TEXT NOT NULL CHECK (trim(description) <> ''),
+    note TEXT NOT NULL DEFAULT '',
+    evidence_path TEXT NOT NULL DEFAULT '',
+    CHECK (debit_amount = credit_amount)
+);
+CREATE INDEX IF NOT EXISTS idx_transactions_debit
+    ON transactions (debit_account, date);
+CREATE INDEX IF NOT EXISTS idx_transactions_credit
+    ON transactions (credit_account, date);
+CREATE INDEX IF NOT EXISTS idx_transactions_date
+    ON transactions (date);
+"""
+
+_COLUMNS_SQL = (
+    "id, date, debit_account, debit_amount, credit_account, credit_amount, "
+    "description, note, evidence_path"
+)
+
+# iter_all でカーソルから一度に取り出す行数
+_BATCH_SIZE = 10_000
+
+# 日付の指定がないときの範囲
+_MIN_DATE = "0001-01-01"
+_MAX_DATE = "9999-12-31"
+
+# 勘定科目と期間の条件。
+# 借方・貸方それぞれの (勘定科目, 日付) インデックスを範囲で走査できるよう、
+# 日付の条件を OR の両側に置く
+_ACCOUNT_PERIOD_SQL = (
+    "((debit_account = :account AND date BETWEEN :start AND :end)"
+    " OR (credit_account = :account AND date BETWEEN :start AND :end))"
+)
+
+# 元帳: 絞り込みと残高の累計（ウィンドウ関数）をまとめて SQL で行う
+_LEDGER_SQL = f"""
+SELECT date, description, debit, credit,
+       :opening + SUM(coalesce(debit, 0) - coalesce(credit, 0))
+           OVER (ORDER BY seq ROWS UNBOUNDED PRECEDING) AS balance
+FROM (
+    SELECT seq, date, description,
+           CASE WHEN debit_account = :account THEN debit_amount END AS debit,
+           CASE WHEN credit_account = :account THEN credit_amount END AS credit
+    FROM transactions
+    WHERE {_ACCOUNT_PERIOD_SQL}
+)
+ORDER BY seq
+"""
+
+# 繰越残高: (勘定科目, 日付) のインデックスだけで開始日より前の増減を集計する
+_OPENING_SQL = """
+SELECT
+    (SELECT coalesce(SUM(debit_amount), 0) FROM transactions
+     WHERE debit_account = :account AND date < :start)
+  - (SELECT coalesce(SUM(credit_amount), 0) FROM transactions
+     WHERE credit_account = :account AND date < :start)
+"""
+
+# 勘定科目別の借方・貸方合計を1回の GROUP BY で集計する
+_SUMMARY_SQL = """
+SELECT account, SUM(debit), SUM(credit)
+FROM (
+    SELECT debit_account AS account, debit_amount AS debit, 0 AS credit
+    FROM transactions WHERE date BETWEEN :start AND :end
+    UNION ALL
+    SELECT credit_account, 0, credit_amount
+    FROM transactions WHERE date BETWEEN :start AND :end
+)
+GROUP BY account
+ORDER BY account
+"""
+
+# 同じ内容の仕訳: (借方科目, 日付) のインデックスで候補を絞る
+_DUPLICATE_SQL = """
+SELECT 1 FROM transactions
+WHERE debit_account = ? AND date = ? AND credit_account = ?
+  AND debit_amount = ? AND description = ?
+LIMIT 1
+"""
+
+_INSERT_SQL = (
+    f"INSERT INTO transactions ({_COLUMNS_SQL}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+class SqliteTransactionRepository(TransactionRepository):
+    """SQLite形式の仕訳リポジトリ"""
+
+    def __init__(self, db_path: Path, amount_scale: int = 0):
+        self.db_path = db_path
+        self.amount_scale = amount_scale
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # トランザクションは明示的に制御する
+        self._conn = sqlite3.connect(db_path, isolation_level=None)
+        # WAL: 書き込み中も読み込みをブロックしない
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # 他プロセスの書き込み中はロック解放を待つ
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(_SCHEMA_SQL)
+
+    def add(self, transaction: Transaction) -> None:
+        """仕訳を追加"""
+        self.add_many([transaction])
+
+    def add_many(self, transactions: Iterable[Transaction]) -> int:
+        """複数の仕訳を1トランザクションで一括追加"""
+        rows = [self._to_row(transaction) for transaction in transactions]
+        if not rows:
+            return 0
+
+        # 他の書き込みと競合しないよう最初から書き込みロックを取る
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.executemany(_INSERT_SQL, rows)
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+        return len(rows)
+
+    def find_duplicates(self, transactions: Sequence[Transaction]) -> List[bool]:
+        """
+        同じ内容の保存済みの仕訳を、仕訳ごとにインデックスで探す
+
+        金額を小数点以下 amount_scale 桁で表現できない仕訳は保存できないので、
+        重複とはしない（保存するときのエラーとして報告する）
+        """
+        seen = set()
+        duplicated = []
+        for transaction in transactions:
+            try:
+                amount = to_minor_units(transaction.amount, self.amount_scale)
+            except ValueError:
+                duplicated.append(False)
+                continue
+            key = transaction.content_key
+            row = self._conn.execute(
+                _DUPLICATE_SQL,
+                (
+                    transaction.debit_account,
+                    transaction.date.isoformat(),
+                    transaction.credit_account,
+                    amount,
+                    transaction.description,
+                ),
+            ).fetchone()
+            duplicated.append(key in seen or row is not None)
+            seen.add(key)
+        return duplicated
+
+    def find_all(
+        self, start: date | None = None, end: date | None = None
+    ) -> List[Transaction]:
+        """期間内の全ての仕訳を取得"""
+        return self._query(_select_all_sql(start, end), _period_params(start, end))
+
+    def iter_all(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> Iterator[TransactionRecord]:
+        """期間内の仕訳を追加順に1件ずつ返す（カーソルから _BATCH_SIZE 行ずつ取り出す）"""
+        params = {
+            **_period_params(start, end),
+            "offset": offset,
+            "limit": -1 if limit is None else limit,  # -1 は件数の制限なし
+        }
+        cursor = self._conn.execute(
+            f"{_select_all_sql(start, end)} LIMIT :limit OFFSET :offset", params
+        )
+        while rows := cursor.fetchmany(_BATCH_SIZE):
+            yield from build_records(self._from_rows(rows))
+
+    def find_by_account(
+        self, account_name: str, start: date | None = None, end: date | None = None
+    ) -> List[Transaction]:
+        """期間内の指定した勘定科目を含む仕訳を取得"""
+        return self._query(
+            f"SELECT {_COLUMNS_SQL} FROM transactions "
+            f"WHERE {_ACCOUNT_PERIOD_SQL} ORDER BY seq",
+            {"account": account_name, **_period_params(start, end)},
+        )
+
+    def find_ledger(
+        self, account_name: str, start: date | None = None, end: date | None = None
+    ) -> List[LedgerEntry]:
+        """指定した勘定科目の元帳を取得（残高は SQL のウィンドウ関数で累計）"""
+        scale = self.amount_scale
+        params = {"account": account_name, **_period_params(start, end)}
+        (params["opening"],) = self._conn.execute(_OPENING_SQL, params).fetchone()
+        return [
+            LedgerEntry(
+                date=date.fromisoformat(txn_date),
+                description=description,
+                debit_amount=None if debit is None else from_minor_units(debit, scale),
+                credit_amount=(
+                    None if credit is None else from_minor_units(credit, scale)
+                ),
+                balance=from_minor_units(balance, scale),
+            )
+            for txn_date, description, debit, credit, balance in self._conn.execute(
+                _LEDGER_SQL, params
+            )
+        ]
+
+    def summarize_by_account(
+        self, start: date | None = None, end: date | None = None
+    ) -> List[AccountTotal]:
+        """期間内の勘定科目別の借方・貸方合計を取得（SQL で一括集計）"""
+        scale = self.amount_scale
+        params = _period_params(start, end)
+        return [
+            AccountTotal(
+                account_name=account,
+                debit_total=from_minor_units(debit, scale),
+                credit_total=from_minor_units(credit, scale),
+            )
+            for account, debit, credit in self._conn.execute(_SUMMARY_SQL, params)
+        ]
+
+    def _query(self, sql: str, params: tuple | dict = ()) -> List[Transaction]:
+        """SELECT の結果をTransactionのリストに変換"""
+        return build_transactions(self._from_rows(self._conn.execute(sql, params)))
+
+    def _to_row(self, transaction: Transaction) -> tuple:
+        """Transactionを INSERT 用のタプルに変換"""
+        return (
+            str(transaction.id if transaction.id else uuid4()),
+            transaction.date.isoformat(),
+            transaction.debit_account,
+            to_minor_units(transaction.debit_amount, self.amount_scale),
+            transaction.credit_account,
+            to_minor_units(transaction.credit_amount, self.amount_scale),
+            transaction.description,
+            transaction.note,
+            transaction.evidence_path,
+        )
+
+    def _from_rows(self, rows: Iterable[tuple]) -> Iterator[tuple]:
+        """SELECT の行を日付・金額を変換したタプルにする"""
+        scale = self.amount_scale
+        for (
+            txn_id,
+            txn_date,
+            debit_account,
+            debit_amount,
+            credit_account,
+            credit_amount,
+            description,
+            note,
+            evidence_path,
+        ) in rows:
+            yield (
+                txn_id,
+                date.fromisoformat(txn_date),
+                debit_account,
+                from_minor_units(debit_amount, scale),
+                credit_account,
+                from_minor_units(credit_amount, scale),
+                description,
+                note,
+                evidence_path,
+            )
+
+
+def _select_all_sql(start: date | None, end: date | None) -> str:
+    """期間内の仕訳を追加順に取得する SELECT 文"""
+    if start is None and end is None:
+        return f"SELECT {_COLUMNS_SQL} FROM transactions ORDER BY seq"
+    # 日付のインデックスで期間内の行だけを読み、追加順に並べ替える
+    # （他の保存形式と同じ順序にするため。並べ替えるので途中では打ち切れない）
+    return (
+        f"SELECT {_COLUMNS_SQL} FROM transactions "
+        "WHERE date BETWEEN :start AND :end ORDER BY seq"
+    )
+
+
+def _period_params(start: date | None, end: date | None) -> dict:
+    """期間の SQL パラメータ（指定のない側は制限しない）"""
+    return {
+        "start": start.isoformat() if start else _MIN_DATE,
+        "end": end.isoformat() if end else _MAX_DATE,
+    }
@@ -0,0 +1,245 @@
+"""
+仕訳 DataFrame のバリデーションと変換
+
+Transaction エンティティと同じ不変条件を Polars の式で一括検証し、
+検証済みの行から行ごとのバリデーションを省いてエンティティ・読み取りモデルを生成する
+"""
+
+import gc
+from contextlib import contextmanager
+from decimal import Decimal
+from typing import Iterable, Iterator, List
+from uuid import UUID
+
+import polars as pl
+
+from bookkeeper.domain.entity.transaction import Transaction
+from bookkeeper.domain.entity.transaction_record import TransactionRecord
+
+# DataFrame の列順（Transaction のフィールド順と一致）
+COLUMNS = list(Transaction.model_fields)
+
+# 金額比較用の固定小数点型（文字列金額をこの精度で解釈する）
+_AMOUNT_DTYPE = pl.Decimal(38, 18)
+
+# エラーメッセージに含める最大行数
+_MAX_REPORTED_ROWS = 5
+
+# 値の種類が少なく、同じ値のオブジェクトを行の間で共有する列
+# （貸方金額は借方金額と等しいので、借方金額のオブジェクトを使う）
+_SHARED_COLUMNS = (
+    "date",
+    "debit_account",
+    "debit_amount",
+    "credit_account",
+    "description",
+    "note",
+)
+
+
+def _blank(column: str) -> pl.Expr:
+    """null または空白のみの文字列"""
+    return pl.col(column).is_null() | (pl.col(column).str.strip_chars() == "")
+
+
+def _amount(column: str, dtype: pl.DataType) -> pl.Expr:
+    """金額列を比較可能な固定小数点に変換（解釈できない値は null）"""
+    expr = pl.col(column)
+    if dtype == pl.String:
+        expr = expr.str.strip_chars()
+    return expr.cast(_AMOUNT_DTYPE, strict=False)
+
+
+def transaction_errors(df: pl.DataFrame) -> pl.Series:
+    """
+    各行の不変条件違反をメッセージとして返す
+
+    Args:
+        df: 仕訳 DataFrame
+
+    Returns:
+        行ごとのエラーメッセージ（違反がない行は null）
+    """
+    debit = _amount("debit_amount", df.schema["debit_amount"])
+    credit = _amount("credit_amount", df.schema["credit_amount"])
+    checks = [
+        (pl.col("date").is_null(), "日付がありません"),
+        (_blank("debit_account"), "借方勘定科目が空です"),
+        (_blank("credit_account"), "貸方勘定科目が空です"),
+        (_blank("description"), "摘要が空です"),
+        (debit.is_null(), "借方金額が数値ではありません"),
+        (credit.is_null(), "貸方金額が数値ではありません"),
+        (debit <= 0, "借方金額は正の数でなければなりません"),
+        (credit <= 0, "貸方金額は正の数でなければなりません"),
+        (debit != credit, "借方金額と貸方金額が一致しません"),
+    ]
+    return df.select(
+        pl.concat_str(
+            [pl.when(cond).then(pl.lit(message)) for cond, message in checks],
+            separator="; ",
+            ignore_nulls=True,
+        )
+        .replace("", None)
+        .alias("error")
+    ).to_series()
+
+
+def validate_transaction_frame(df: pl.DataFrame, row_offset: int = 0) -> None:
+    """
+    仕訳 DataFrame 全体を検証
+
+    Args:
+        df: 仕訳 DataFrame
+        row_offset: エラーメッセージの行番号に加える件数（分割して読む場合）
+
+    Raises:
+        ValueError: 不変条件に違反する行がある場合
+    """
+    invalid = (
+        pl.DataFrame({"error": transaction_errors(df)})
+        .with_row_index("row", offset=row_offset + 1)
+        .filter(pl.col("error").is_not_null())
+    )
+    if invalid.is_empty():
+        return
+
+    details = "\n".join(
+        f"  {row} 件目: {error}"
+        for row, error in invalid.head(_MAX_REPORTED_ROWS).iter_rows()
+    )
+    raise ValueError(f"不正な仕訳が {invalid.height} 件あります\n{details}")
+
+
+def frame_to_transactions(df: pl.DataFrame, row_offset: int = 0) -> List[Transaction]:
+    """
+    DataFrameをTransactionのリストに変換
+
+    不変条件は列単位で一括検証するので、行ごとの pydantic
+    バリデーションは行わない
+
+    Args:
+        df: 仕訳 DataFrame
+        row_offset: エラーメッセージの行番号に加える件数（分割して読む場合）
+
+    Returns:
+        仕訳のリスト
+
+    Raises:
+        ValueError: 不変条件に違反する行がある場合
+    """
+    validate_transaction_frame(df, row_offset)
+    return build_transactions(zip(*(df.get_column(name).to_list() for name in COLUMNS)))
+
+
+def build_transactions(rows: Iterable[tuple]) -> List[Transaction]:
+    """
+    検証済みの行からTransactionを生成
+
+    行ごとの pydantic バリデーションを省く（model_construct で生成する）。
+    不変条件が保証されている行にだけ使うこと
+
+    Args:
+        rows: COLUMNS 順の値のタプル（id は文字列、金額は Decimal または文字列）
+
+    Returns:
+        仕訳のリスト
+    """
+    fields_set = frozenset(COLUMNS)
+    construct = Transaction.model_construct
+    transactions = []
+    with _without_gc():
+        for (
+            txn_id,
+            txn_date,
+            debit_account,
+            debit_amount,
+            credit_account,
+            credit_amount,
+            description,
+            note,
+            evidence_path,
+        ) in rows:
+            transactions.append(
+                construct(
+                    set(fields_set),
+                    id=UUID(txn_id) if txn_id else None,
+                    date=txn_date,
+                    debit_account=debit_account,
+                    debit_amount=Decimal(debit_amount),
+                    credit_account=credit_account,
+                    credit_amount=Decimal(credit_amount),
+                    description=description,
+                    note=note or "",
+                    evidence_path=evidence_path or "",
+                )
+            )
+    return transactions
+
+
+def frame_to_records(df: pl.DataFrame) -> List[TransactionRecord]:
+    """
+    検証済みのDataFrameをTransactionRecordのリストに変換
+
+    列ごとに Python の値にしてから行のタプルをそのまま使うので、行ごとの
+    検証や属性の設定を行わない。勘定科目・摘要・日付・金額は同じ値のオブジェクトを
+    行の間で共有し、貸方金額には（検証済みで等しい）借方金額のオブジェクトを使う
+
+    Args:
+        df: 検証済みの仕訳 DataFrame（金額は固定小数点）
+
+    Returns:
+        仕訳の読み取りモデルのリスト
+    """
+    df = df.with_columns(pl.col("note", "evidence_path").fill_null(""))
+    columns = {}
+    for name in COLUMNS:
+        if name == "credit_amount":
+            columns[name] = columns["debit_amount"]
+        elif name in _SHARED_COLUMNS:
+            columns[name] = shared_values(df.get_column(name))
+        else:
+            columns[name] = df.get_column(name).to_list()
+    return build_records(zip(*columns.values()))
+
+
+def build_records(rows: Iterable[tuple]) -> List[TransactionRecord]:
+    """
+    検証済みの行からTransactionRecordを生成
+
+    Args:
+        rows: COLUMNS 順の値のタプル（id は文字列、金額は Decimal、
+            備考・証憑パスは null でなく文字列）
+
+    Returns:
+        仕訳の読み取りモデルのリスト
+    """
+    new = tuple.__new__
+    with _without_gc():
+        return [new(TransactionRecord, row) for row in rows]
+
+
+def shared_values(series: pl.Series) -> List:
+    """
+    列を Python の値のリストにする（等しい値は同じオブジェクトを共有する）
+
+    重複のない値だけを Python の値にし、各行はその添字で引くので、
+    値の種類が少ない列ではメモリが減り、Decimal などの変換も速くなる
+    """
+    uniques = series.unique(maintain_order=True)
+    codes = series.replace_strict(
+        uniques, pl.int_range(uniques.len(), eager=True, dtype=pl.UInt32)
+    )
+    values = uniques.to_list()
+    return [values[code] for code in codes.to_list()]
+
+
+@contextmanager
+def _without_gc() -> Iterator[None]:
+    """大量のオブジェクト生成中に世代別GCが繰り返し走るのを避ける"""
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if gc_was_enabled:
+            gc.enable()
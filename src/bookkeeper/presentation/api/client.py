@@ -0,0 +1,211 @@
+"""
+API クライアント
+
+常駐している API サーバーにユースケースの実行を依頼し、
+結果をドメインのオブジェクトに戻す
+"""
+
+import http.client
+import json
+import socket
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List
+from urllib.parse import urlencode
+
+from bookkeeper.domain.entity.transaction import Transaction
+from bookkeeper.domain.entity.transaction_record import TransactionRecord
+from bookkeeper.domain.service.ledger_service import LedgerEntry
+from bookkeeper.domain.service.report_service import (
+    BalanceSheet,
+    IncomeStatement,
+    TrialBalanceRow,
+)
+from bookkeeper.presentation.api.codec import (
+    balance_sheet_from_json,
+    dumps,
+    income_statement_from_json,
+    ledger_from_json,
+    record_from_json,
+    trial_balance_from_json,
+)
+
+# 応答を待つ時間（秒）
+_TIMEOUT = 60.0
+
+
+class ServerError(Exception):
+    """サーバーがエラーを返した"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """UNIX ソケットで接続する HTTPConnection"""
+
+    def __init__(self, socket_path: Path, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(str(self.socket_path))
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class BookkeeperClient:
+    """API サーバーのクライアント"""
+
+    def __init__(
+        self,
+        socket_path: Path | None = None,
+        host: str = "127.0.0.1",
+        port: int | None = None,
+        timeout: float = _TIMEOUT,
+    ):
+        if port is not None:
+            self._conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        else:
+            self._conn = _UnixHTTPConnection(socket_path, timeout)
+
+    @classmethod
+    def connect_if_running(cls, socket_path: Path) -> "BookkeeperClient | None":
+        """サーバーが UNIX ソケットで待ち受けていれば接続する（いなければ None）"""
+        if not socket_path.exists():
+            return None
+        client = cls(socket_path)
+        try:
+            client.health()
+        except (OSError, http.client.HTTPException):
+            # 前回のサーバーが残したソケットなど
+            client.close()
+            return None
+        return client
+
+    def close(self) -> None:
+        """接続を閉じる"""
+        self._conn.close()
+
+    def health(self) -> dict:
+        """稼働確認"""
+        return self._get_json("/health")
+
+    def journal(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> Iterator[TransactionRecord]:
+        """期間内の仕訳を追加順に1件ずつ返す（応答を読みながら返す）"""
+        response = self._request(
+            "GET",
+            _url(
+                "/journal",
+                {"from": start, "to": end, "offset": offset, "limit": limit},
+            ),
+        )
+        return self._iter_transactions(response)
+
+    def ledger(
+        self, account_name: str, start: date | None = None, end: date | None = None
+    ) -> List[LedgerEntry]:
+        """指定した勘定科目の元帳を取得"""
+        data = self._get_json(
+            _url("/ledger", {"account": account_name, "from": start, "to": end})
+        )
+        return ledger_from_json(data["entries"])
+
+    def trial_balance(
+        self, start: date | None = None, end: date | None = None
+    ) -> List[TrialBalanceRow]:
+        """期間内の試算表を取得"""
+        data = self._get_json(_url("/trial-balance", {"from": start, "to": end}))
+        return trial_balance_from_json(data["rows"])
+
+    def income_statement(
+        self, start: date | None = None, end: date | None = None
+    ) -> IncomeStatement:
+        """期間内の損益計算書を取得"""
+        data = self._get_json(_url("/pl", {"from": start, "to": end}))
+        return income_statement_from_json(data["statement"])
+
+    def balance_sheet(self, as_of: date | None = None) -> BalanceSheet:
+        """指定日時点の貸借対照表を取得"""
+        data = self._get_json(_url("/bs", {"to": as_of}))
+        return balance_sheet_from_json(data["sheet"])
+
+    def add_many(
+        self, transactions: Iterable[Transaction], allow_duplicates: bool = True
+    ) -> int:
+        """
+        仕訳を追加し、追加した件数を返す
+
+        Raises:
+            ServerError: allow_duplicates が False で同じ内容の仕訳が既にある
+                場合は status 409
+        """
+        body = dumps(
+            {"transactions": list(transactions), "allow_duplicates": allow_duplicates}
+        )
+        response = self._request("POST", "/transactions", body)
+        return json.loads(response.read())["added"]
+
+    def _iter_transactions(
+        self, response: http.client.HTTPResponse
+    ) -> Iterator[TransactionRecord]:
+        """JSON Lines の応答を読みながら仕訳を返す"""
+        # 読み切る前に止めた場合は接続を使い回せないので閉じる
+        try:
+            for line in response:
+                yield record_from_json(json.loads(line))
+        finally:
+            if not response.isclosed():
+                self.close()
+
+    def _get_json(self, url: str) -> Any:
+        """GET の応答の JSON を読む"""
+        return json.loads(self._request("GET", url).read())
+
+    def _request(
+        self, method: str, url: str, body: bytes | None = None
+    ) -> http.client.HTTPResponse:
+        """
+        リクエストを送り、成功した応答を返す
+
+        Raises:
+            ServerError: サーバーがエラーを返した場合
+        """
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        self._conn.request(method, url, body, headers)
+        response = self._conn.getresponse()
+        if response.status >= 400:
+            raise ServerError(response.status, _error_message(response.read()))
+        return response
+
+
+def _url(path: str, params: dict) -> str:
+    """None を除いたクエリパラメータ付きの URL"""
+    query = urlencode(
+        {
+            key: value.isoformat() if isinstance(value, date) else value
+            for key, value in params.items()
+            if value is not None
+        }
+    )
+    return f"{path}?{query}" if query else path
+
+
+def _error_message(body: bytes) -> str:
+    """エラー応答の本文からメッセージを取り出す"""
+    try:
+        return json.loads(body)["error"]
+    except (ValueError, KeyError, TypeError):
+        return body.decode("utf-8", errors="replace")
@@ -0,0 +1,165 @@
+"""
+API の JSON 変換
+
+ユースケースの結果を JSON にし、JSON からドメインのオブジェクトに戻す。
+金額は誤差なく受け渡すため10進表記の文字列にする
+"""
+
+import dataclasses
+import json
+from datetime import date
+from decimal import Decimal
+from enum import Enum
+from typing import Any, List
+from uuid import UUID
+
+from bookkeeper.domain.entity.transaction import Transaction
+from bookkeeper.domain.entity.transaction_record import TransactionRecord
+from bookkeeper.domain.service.ledger_service import LedgerEntry
+from bookkeeper.domain.service.report_service import (
+    BalanceSheet,
+    IncomeStatement,
+    ReportSection,
+    TrialBalanceRow,
+)
+from bookkeeper.domain.vo.account import AccountType
+
+
+def dumps(value: Any) -> bytes:
+    """ユースケースの結果を JSON（UTF-8）にする"""
+    return json.dumps(value, ensure_ascii=False, default=_default).encode()
+
+
+def transaction_to_json(transaction: Transaction | TransactionRecord) -> dict:
+    """仕訳を JSON の値にする（件数が多いので default を介さずに変換する）"""
+    return {
+        "id": None if transaction.id is None else str(transaction.id),
+        "date": transaction.date.isoformat(),
+        "debit_account": transaction.debit_account,
+        "debit_amount": str(transaction.debit_amount),
+        "credit_account": transaction.credit_account,
+        "credit_amount": str(transaction.credit_amount),
+        "description": transaction.description,
+        "note": transaction.note,
+        "evidence_path": transaction.evidence_path,
+    }
+
+
+def ledger_to_json(entries: List[LedgerEntry]) -> List[dict]:
+    """元帳エントリを JSON の値にする（件数が多いので default を介さずに変換する）"""
+    return [
+        {
+            "date": entry.date.isoformat(),
+            "description": entry.description,
+            "debit_amount": _optional_str(entry.debit_amount),
+            "credit_amount": _optional_str(entry.credit_amount),
+            "balance": str(entry.balance),
+        }
+        for entry in entries
+    ]
+
+
+def _default(value: Any) -> Any:
+    """json が扱えない値の変換"""
+    if isinstance(value, Transaction):
+        return value.model_dump()
+    if dataclasses.is_dataclass(value):
+        return {
+            field.name: getattr(value, field.name)
+            for field in dataclasses.fields(value)
+        }
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"JSON に変換できません: {type(value).__name__}")
+
+
+def transaction_from_json(data: dict) -> Transaction:
+    """
+    受け取った仕訳を検証してTransactionにする
+
+    Raises:
+        pydantic.ValidationError: 不変条件に違反する場合
+    """
+    return Transaction.model_validate(data)
+
+
+def record_from_json(data: dict) -> TransactionRecord:
+    """サーバーが返した保存済み（検証済み）の仕訳を、読み取りモデルにする"""
+    return TransactionRecord(
+        id=data["id"],
+        date=date.fromisoformat(data["date"]),
+        debit_account=data["debit_account"],
+        debit_amount=Decimal(data["debit_amount"]),
+        credit_account=data["credit_account"],
+        credit_amount=Decimal(data["credit_amount"]),
+        description=data["description"],
+        note=data["note"],
+        evidence_path=data["evidence_path"],
+    )
+
+
+def ledger_from_json(entries: List[dict]) -> List[LedgerEntry]:
+    """元帳エントリのリストに戻す"""
+    return [
+        LedgerEntry(
+            date.fromisoformat(entry["date"]),
+            entry["description"],
+            None if (debit := entry["debit_amount"]) is None else Decimal(debit),
+            None if (credit := entry["credit_amount"]) is None else Decimal(credit),
+            Decimal(entry["balance"]),
+        )
+        for entry in entries
+    ]
+
+
+def trial_balance_from_json(rows: List[dict]) -> List[TrialBalanceRow]:
+    """試算表の行のリストに戻す"""
+    return [
+        TrialBalanceRow(
+            account_name=row["account_name"],
+            account_type=(
+                AccountType(row["account_type"]) if row["account_type"] else None
+            ),
+            debit_total=Decimal(row["debit_total"]),
+            credit_total=Decimal(row["credit_total"]),
+            balance=Decimal(row["balance"]),
+        )
+        for row in rows
+    ]
+
+
+def income_statement_from_json(data: dict) -> IncomeStatement:
+    """損益計算書に戻す"""
+    return IncomeStatement(
+        revenue=_section_from_json(data["revenue"]),
+        expense=_section_from_json(data["expense"]),
+        unclassified=data["unclassified"],
+    )
+
+
+def balance_sheet_from_json(data: dict) -> BalanceSheet:
+    """貸借対照表に戻す"""
+    return BalanceSheet(
+        asset=_section_from_json(data["asset"]),
+        liability=_section_from_json(data["liability"]),
+        equity=_section_from_json(data["equity"]),
+        net_income=Decimal(data["net_income"]),
+        unclassified=data["unclassified"],
+    )
+
+
+def _section_from_json(data: dict) -> ReportSection:
+    """損益計算書・貸借対照表の区分に戻す"""
+    return ReportSection(
+        account_type=AccountType(data["account_type"]),
+        items=[(name, Decimal(amount)) for name, amount in data["items"]],
+    )
+
+
+def _optional_str(value: Decimal | None) -> str | None:
+    """None でなければ文字列にする"""
+    return None if value is None else str(value)
@@ -0,0 +1,480 @@
+"""
+API サーバー
+
+リポジトリを一度だけ読み込んで常駐し、ユースケースを HTTP + JSON で提供する。
+スクリプトから繰り返し呼ぶ場合に、起動・import・CSV の解析を毎回行わずに済む。
+
+リポジトリの処理はイベントループのスレッドで順に行う
+（SQLite の接続はスレッド間で共有できないため）。
+書き込みは1つのタスクに集め、待っている追加はまとめて1回で書き込む
+"""
+
+import asyncio
+import json
+import logging
+import signal
+import socket
+from dataclasses import dataclass, field
+from datetime import date
+from http import HTTPStatus
+from itertools import chain
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from bookkeeper.application.usecase.add_transaction import DuplicateTransactionError
+from bookkeeper.common.di import (
+    init_add_transaction_usecase,
+    init_list_journal_usecase,
+    init_view_balance_sheet_usecase,
+    init_view_income_statement_usecase,
+    init_view_ledger_usecase,
+    init_view_trial_balance_usecase,
+)
+from bookkeeper.domain.entity.transaction import Transaction
+from bookkeeper.presentation.api.codec import (
+    dumps,
+    ledger_to_json,
+    transaction_from_json,
+    transaction_to_json,
+)
+
+logger = logging.getLogger(__name__)
+
+# 想定外のエラーの応答に使うメッセージ（内部の情報は返さず、ログに記録する）
+_INTERNAL_ERROR_MESSAGE = "サーバー内部でエラーが発生しました"
+
+# 受け付けるリクエスト本文の上限
+_MAX_BODY_BYTES = 64 * 1024 * 1024
+
+# 仕訳帳を返すときに1つのチャンクにまとめる件数
+_JOURNAL_CHUNK_ROWS = 1_000
+
+
+class RequestError(Exception):
+    """クライアントの誤りによるエラー（400 系で返す）"""
+
+    def __init__(self, message: str, status: HTTPStatus = HTTPStatus.BAD_REQUEST):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class Request:
+    """受け取ったリクエスト"""
+
+    method: str
+    path: str
+    query: Dict[str, str]
+    body: bytes
+    keep_alive: bool
+
+    def date_param(self, name: str) -> date | None:
+        """日付のクエリパラメータ（省略時は None）"""
+        value = self.query.get(name)
+        if not value:
+            return None
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            raise RequestError(f"{name} の日付が不正です: {value}")
+
+    def int_param(self, name: str, default: int | None = None) -> int | None:
+        """0 以上の整数のクエリパラメータ（省略時は default）"""
+        value = self.query.get(name)
+        if not value:
+            return default
+        if not value.isdigit():
+            raise RequestError(f"{name} は 0 以上の整数で指定してください: {value}")
+        return int(value)
+
+
+@dataclass
+class _PendingWrite:
+    """書き込みタスクが処理する追加"""
+
+    transactions: List[Transaction]
+    # False なら、同じ内容の仕訳が既にある場合は追加しない
+    allow_duplicates: bool = True
+    done: asyncio.Future = field(
+        default_factory=lambda: asyncio.get_running_loop().create_future()
+    )
+
+
+class BookkeeperServer:
+    """ユースケースを HTTP + JSON で提供するサーバー"""
+
+    def __init__(self):
+        # リポジトリ（とプロセス内キャッシュ）は起動時に一度だけ用意する
+        self.add_transaction = init_add_transaction_usecase()
+        self.list_journal = init_list_journal_usecase()
+        self.view_ledger = init_view_ledger_usecase()
+        self.view_trial_balance = init_view_trial_balance_usecase()
+        self.view_income_statement = init_view_income_statement_usecase()
+        self.view_balance_sheet = init_view_balance_sheet_usecase()
+        self._routes: Dict[
+            Tuple[str, str],
+            Callable[[Request, asyncio.StreamWriter], Awaitable[None]],
+        ] = {
+            ("GET", "/health"): self._health,
+            ("GET", "/journal"): self._journal,
+            ("GET", "/ledger"): self._ledger,
+            ("GET", "/trial-balance"): self._trial_balance,
+            ("GET", "/pl"): self._income_statement,
+            ("GET", "/bs"): self._balance_sheet,
+            ("POST", "/transactions"): self._add_transactions,
+        }
+        self._writes: asyncio.Queue[_PendingWrite] | None = None
+
+    async def serve(
+        self,
+        socket_path: Path | None = None,
+        host: str = "127.0.0.1",
+        port: int | None = None,
+    ) -> None:
+        """
+        SIGINT / SIGTERM を受けるまで待ち受ける
+
+        Args:
+            socket_path: UNIX ソケットのパス（port を指定しない場合）
+            host: TCP で待ち受けるアドレス
+            port: TCP で待ち受けるポート
+        """
+        self._writes = asyncio.Queue()
+        writer_task = asyncio.create_task(self._write_loop())
+        if port is not None:
+            server = await asyncio.start_server(self._handle, host, port)
+        else:
+            _remove_stale_socket(socket_path)
+            server = await asyncio.start_unix_server(self._handle, socket_path)
+
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+        try:
+            async with server:
+                await stop.wait()
+                server.close()
+                server.close_clients()
+                await server.wait_closed()
+            # 受け付け済みの追加は書き込んでから終了する
+            await self._writes.join()
+        finally:
+            writer_task.cancel()
+            if port is None:
+                socket_path.unlink(missing_ok=True)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """1つの接続のリクエストを順に処理する（keep-alive に対応）"""
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except RequestError as e:
+                    await _send_json(writer, e.status, {"error": str(e)}, False)
+                    break
+                if request is None:
+                    break
+                await self._dispatch(request, writer)
+                if not request.keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, request: Request, writer: asyncio.StreamWriter) -> None:
+        """ルートの処理を呼び、誤りはエラーの JSON で返す"""
+        handler = self._routes.get((request.method, request.path))
+        try:
+            if handler is None:
+                raise RequestError(
+                    f"{request.method} {request.path} はありません",
+                    HTTPStatus.NOT_FOUND,
+                )
+            await handler(request, writer)
+        except RequestError as e:
+            await _send_json(writer, e.status, {"error": str(e)}, request.keep_alive)
+        except ValueError as e:
+            # 不変条件の違反など（pydantic の ValidationError も ValueError の一種）
+            await _send_json(
+                writer, HTTPStatus.BAD_REQUEST, {"error": str(e)}, request.keep_alive
+            )
+        except ConnectionError:
+            raise
+        except (OSError, RuntimeError) as e:
+            # データファイルの読み書きの失敗など
+            await _send_json(
+                writer,
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                {"error": str(e)},
+                request.keep_alive,
+            )
+        except Exception:
+            logger.exception(
+                "%s %s の処理中にエラーが発生しました", request.method, request.path
+            )
+            await _send_json(
+                writer,
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                {"error": _INTERNAL_ERROR_MESSAGE},
+                request.keep_alive,
+            )
+
+    async def _health(self, request: Request, writer: asyncio.StreamWriter) -> None:
+        """稼働確認"""
+        await _send_json(writer, HTTPStatus.OK, {"status": "ok"}, request.keep_alive)
+
+    async def _journal(self, request: Request, writer: asyncio.StreamWriter) -> None:
+        """仕訳帳を JSON Lines で少しずつ返す（全件を本文に組み立てない）"""
+        transactions = self.list_journal.execute(
+            request.date_param("from"),
+            request.date_param("to"),
+            request.int_param("offset", 0),
+            request.int_param("limit"),
+        )
+        # 最初のチャンクを作ってから応答を始め、読み込みの誤りは 400 で返せるようにする
+        chunks = _iter_json_lines(transactions)
+        first = next(chunks, b"")
+        _write_head(
+            writer,
+            HTTPStatus.OK,
+            "application/x-ndjson",
+            request.keep_alive,
+            chunked=True,
+        )
+        try:
+            for chunk in chain([first], chunks):
+                if not chunk:
+                    continue  # 長さ 0 のチャンクは終端を表すので送らない
+                writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                # クライアントが読むのを待つ間に他の接続を処理できる
+                await writer.drain()
+        except ValueError:
+            # 応答の途中では状態を変えられないので、終端を送らずに切断する
+            writer.transport.abort()
+            raise ConnectionError("仕訳帳の読み込み中にエラーが発生しました")
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    async def _ledger(self, request: Request, writer: asyncio.StreamWriter) -> None:
+        """元帳を返す"""
+        account = request.query.get("account")
+        if not account:
+            raise RequestError("account を指定してください")
+        entries = self.view_ledger.execute(
+            account, request.date_param("from"), request.date_param("to")
+        )
+        await _send_json(
+            writer,
+            HTTPStatus.OK,
+            {"entries": ledger_to_json(entries)},
+            request.keep_alive,
+        )
+
+    async def _trial_balance(
+        self, request: Request, writer: asyncio.StreamWriter
+    ) -> None:
+        """試算表を返す"""
+        rows = self.view_trial_balance.execute(
+            request.date_param("from"), request.date_param("to")
+        )
+        await _send_json(writer, HTTPStatus.OK, {"rows": rows}, request.keep_alive)
+
+    async def _income_statement(
+        self, request: Request, writer: asyncio.StreamWriter
+    ) -> None:
+        """損益計算書を返す"""
+        statement = self.view_income_statement.execute(
+            request.date_param("from"), request.date_param("to")
+        )
+        await _send_json(
+            writer, HTTPStatus.OK, {"statement": statement}, request.keep_alive
+        )
+
+    async def _balance_sheet(
+        self, request: Request, writer: asyncio.StreamWriter
+    ) -> None:
+        """貸借対照表を返す"""
+        sheet = self.view_balance_sheet.execute(request.date_param("to"))
+        await _send_json(writer, HTTPStatus.OK, {"sheet": sheet}, request.keep_alive)
+
+    async def _add_transactions(
+        self, request: Request, writer: asyncio.StreamWriter
+    ) -> None:
+        """仕訳を検証し、書き込みタスクに渡して書き込みを待つ"""
+        payload = _load_json(request.body)
+        rows = payload.get("transactions") if isinstance(payload, dict) else None
+        if not isinstance(rows, list):
+            raise RequestError("transactions に仕訳の配列を指定してください")
+        allow_duplicates = payload.get("allow_duplicates", True)
+        if not isinstance(allow_duplicates, bool):
+            raise RequestError("allow_duplicates には true か false を指定してください")
+        transactions = [transaction_from_json(row) for row in rows]
+
+        pending = _PendingWrite(transactions, allow_duplicates)
+        await self._writes.put(pending)
+        try:
+            added = await pending.done
+        except DuplicateTransactionError as e:
+            raise RequestError(str(e), HTTPStatus.CONFLICT)
+        await _send_json(writer, HTTPStatus.OK, {"added": added}, request.keep_alive)
+
+    async def _write_loop(self) -> None:
+        """追加を1つずつ取り出して書き込む唯一のタスク"""
+        while True:
+            batch = [await self._writes.get()]
+            # 書き込み中に溜まった追加はまとめて1回で書き込む
+            while not self._writes.empty():
+                batch.append(self._writes.get_nowait())
+            try:
+                self._commit(batch)
+            finally:
+                for _ in batch:
+                    self._writes.task_done()
+
+    def _commit(self, batch: List[_PendingWrite]) -> None:
+        """まとめて書き込み、拒否された場合は追加ごとに書き込み直す"""
+        try:
+            # 重複を許さない追加があれば、まとめた全体で重複を確認する
+            # （拒否されたら追加ごとに書き込み直すので、許す追加は書き込まれる）
+            self.add_transaction.execute_many(
+                (
+                    transaction
+                    for pending in batch
+                    for transaction in pending.transactions
+                ),
+                allow_duplicates=all(pending.allow_duplicates for pending in batch),
+            )
+        except ValueError as e:
+            if len(batch) == 1:
+                batch[0].done.set_exception(e)
+                return
+            # どの追加が拒否されたかを特定するため、1つずつ書き込み直す
+            for pending in batch:
+                self._commit([pending])
+            return
+        except (OSError, RuntimeError) as e:
+            # 書き込みタスクは止めず、待っているリクエストにエラーを返す
+            for pending in batch:
+                pending.done.set_exception(e)
+            return
+        except Exception:
+            logger.exception("仕訳の書き込み中にエラーが発生しました")
+            for pending in batch:
+                pending.done.set_exception(RuntimeError(_INTERNAL_ERROR_MESSAGE))
+            return
+        for pending in batch:
+            pending.done.set_result(len(pending.transactions))
+
+
+def _iter_json_lines(transactions: Iterable[Transaction]) -> Iterator[bytes]:
+    """仕訳を _JOURNAL_CHUNK_ROWS 件ずつ JSON Lines のチャンクにする"""
+    lines = []
+    for transaction in transactions:
+        lines.append(dumps(transaction_to_json(transaction)))
+        if len(lines) >= _JOURNAL_CHUNK_ROWS:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Request | None:
+    """
+    HTTP/1.1 のリクエストを1つ読む（接続が閉じられていれば None）
+
+    Raises:
+        RequestError: リクエストを解釈できない場合
+    """
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+    try:
+        method, target, version = request_line.decode("latin-1").split()
+    except ValueError:
+        raise RequestError("リクエスト行を解釈できません")
+
+    headers = {}
+    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    length = headers.get("content-length", "0")
+    if not length.isdigit() or int(length) > _MAX_BODY_BYTES:
+        raise RequestError("Content-Length が不正です")
+    body = await reader.readexactly(int(length))
+
+    url = urlsplit(target)
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.1":
+        keep_alive = connection != "close"
+    else:
+        keep_alive = connection == "keep-alive"
+    return Request(
+        method=method.upper(),
+        path=url.path,
+        query={key: values[-1] for key, values in parse_qs(url.query).items()},
+        body=body,
+        keep_alive=keep_alive,
+    )
+
+
+def _load_json(body: bytes) -> Any:
+    """リクエスト本文の JSON を読む"""
+    try:
+        return json.loads(body)
+    except ValueError:
+        raise RequestError("本文を JSON として解釈できません")
+
+
+def _write_head(
+    writer: asyncio.StreamWriter,
+    status: HTTPStatus,
+    content_type: str,
+    keep_alive: bool,
+    content_length: int | None = None,
+    chunked: bool = False,
+) -> None:
+    """ステータス行とヘッダーを書き込む"""
+    headers = [
+        f"HTTP/1.1 {status.value} {status.phrase}",
+        f"Content-Type: {content_type}; charset=utf-8",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    if chunked:
+        headers.append("Transfer-Encoding: chunked")
+    else:
+        headers.append(f"Content-Length: {content_length}")
+    writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("latin-1"))
+
+
+async def _send_json(
+    writer: asyncio.StreamWriter, status: HTTPStatus, value: Any, keep_alive: bool
+) -> None:
+    """JSON の応答を返す"""
+    body = dumps(value)
+    _write_head(writer, status, "application/json", keep_alive, len(body))
+    writer.write(body)
+    await writer.drain()
+
+
+def _remove_stale_socket(socket_path: Path) -> None:
+    """
+    前回のサーバーが残した UNIX ソケットを削除する
+
+    Raises:
+        RuntimeError: 既にサーバーが動いている場合
+    """
+    if not socket_path.exists():
+        return
+    with socket.socket(socket.AF_UNIX) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            socket_path.unlink()
+            return
+    raise RuntimeError(f"既にサーバーが動いています: {socket_path}")
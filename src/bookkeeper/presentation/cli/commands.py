@@ -4,20 +4,26 @@ CLI コマンド
 ユーザーインターフェース
 """
 
+import os
+import sys
+from contextlib import contextmanager
 from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, Sequence
 
 import typer
-from pydantic import ValidationError
 
-from bookkeeper.common.di import (
-    init_add_transaction_usecase,
-    init_list_journal_usecase,
-    init_view_ledger_usecase,
-)
-from bookkeeper.domain.entity.transaction import Transaction
-from bookkeeper.presentation.cli.formatters import format_journal, format_ledger
+if TYPE_CHECKING:
+    import polars as pl
+
+    from bookkeeper.application.usecase.add_transaction import AddTransactionUseCase
+    from bookkeeper.domain.entity.transaction import Transaction
+    from bookkeeper.domain.vo.chart_of_accounts import ChartOfAccounts
+    from bookkeeper.presentation.api.client import BookkeeperClient
 
+# polars / pydantic を読み込む DI・エンティティ・フォーマッターは、
+# `--help` や引数の誤りで待たされないよう各コマンドの中で import する
 
 # Typerアプリケーションの作成
 app = typer.Typer(
@@ -27,13 +33,57 @@ app = typer.Typer(
 )
 
 
+@app.callback()
+def main(
+    ctx: typer.Context,
+    timings: bool = typer.Option(
+        False, "--timings", help="処理時間の内訳を標準エラー出力に表示"
+    ),
+    timings_json: Path | None = typer.Option(
+        None, "--timings-json", dir_okay=False, help="処理時間の内訳を JSON に保存"
+    ),
+    profile: Path | None = typer.Option(
+        None, "--profile", dir_okay=False, help="cProfile の結果を pstats 形式で保存"
+    ),
+):
+    """青色申告 会計ツール"""
+    from bookkeeper.infrastructure.config.settings import settings
+
+    show = timings or settings.TIMINGS
+    json_path = timings_json or _optional_path(settings.TIMINGS_JSON)
+    profile_path = profile or _optional_path(settings.PROFILE_OUTPUT)
+    if not (show or json_path or profile_path):
+        return
+
+    # 計測しない場合に DI・フォーマッターを読み込まない
+    from bookkeeper.presentation.cli.timings import start_timings
+
+    command = ctx.invoked_subcommand or "bookkeeper"
+    ctx.call_on_close(start_timings(command, show, json_path, profile_path))
+
+
+def _optional_path(value: str | None) -> Path | None:
+    """設定のパス（未設定なら None）"""
+    return Path(value) if value else None
+
+
 @app.command()
 def add():
     """仕訳を追加"""
+    from pydantic import ValidationError
+
+    from bookkeeper.common.di import init_add_transaction_usecase
+    from bookkeeper.domain.entity.transaction import Transaction
+    from bookkeeper.infrastructure.config.settings import settings
+
+    # 勘定科目表にない科目は候補を示して入力し直してもらう
+    chart = _load_chart_of_accounts() if settings.STRICT_ACCOUNTS else None
+
     print("=== 仕訳追加 ===")
     print()
 
-    use_case = init_add_transaction_usecase()
+    client = _connect_server()
+    use_case = None if client is not None else init_add_transaction_usecase()
 
     try:
         # 日付入力
@@ -44,12 +94,12 @@ def add():
             txn_date = datetime.strptime(date_str, "%Y-%m-%d").date()
 
         # 借方
-        debit_account = input("借方勘定科目: ").strip()
+        debit_account = _input_account("借方勘定科目: ", chart)
         debit_amount_str = input("借方金額: ").strip()
         debit_amount = Decimal(debit_amount_str)
 
         # 貸方
-        credit_account = input("貸方勘定科目: ").strip()
+        credit_account = _input_account("貸方勘定科目: ", chart)
         credit_amount_str = input("貸方金額 (空欄で借方と同額): ").strip()
         if not credit_amount_str:
             credit_amount = debit_amount
@@ -77,8 +127,14 @@ def add():
             evidence_path=evidence_path,
         )
 
-        # 保存
-        use_case.execute(transaction)
+        # 保存（同じ内容の仕訳が既にあれば、追加するかを確認する）
+        if not _save_transaction(client, use_case, transaction, False):
+            print()
+            answer = input("同じ内容の仕訳が既にあります。追加しますか? [y/N]: ")
+            if answer.strip().lower() not in ("y", "yes"):
+                print("仕訳を追加しませんでした")
+                return
+            _save_transaction(client, use_case, transaction, True)
 
         print()
         print("✓ 仕訳を追加しました")
@@ -91,17 +147,600 @@ def add():
         raise typer.Exit(code=0)
 
 
+def _save_transaction(
+    client: "BookkeeperClient | None",
+    use_case: "AddTransactionUseCase | None",
+    transaction: "Transaction",
+    allow_duplicates: bool,
+) -> bool:
+    """
+    仕訳を API サーバーまたはこのプロセスで保存する
+
+    Returns:
+        保存した場合は True。allow_duplicates が False で、
+        同じ内容の仕訳が既にあるため保存しなかった場合は False
+    """
+    from http import HTTPStatus
+
+    from bookkeeper.application.usecase.add_transaction import (
+        DuplicateTransactionError,
+    )
+
+    if client is None:
+        try:
+            use_case.execute(transaction, allow_duplicates)
+        except DuplicateTransactionError:
+            return False
+        return True
+
+    from bookkeeper.presentation.api.client import ServerError
+
+    with _exit_on_server_error():
+        try:
+            client.add_many([transaction], allow_duplicates)
+        except ServerError as e:
+            if e.status != HTTPStatus.CONFLICT:
+                raise
+            return False
+    return True
+
+
+def _input_account(prompt: str, chart: "ChartOfAccounts | None") -> str:
+    """勘定科目を入力してもらう（勘定科目表にない科目なら候補を示して聞き直す）"""
+    while True:
+        account = input(prompt).strip()
+        # 空欄はエンティティの検証でエラーにする
+        if chart is None or not account or account in chart:
+            return account
+        try:
+            chart.check(account)
+        except ValueError as e:
+            print(f"  {e}")
+
+
+@app.command("import")
+def import_(
+    file: Path = typer.Argument(
+        ..., exists=True, dir_okay=False, help="取込ファイル (CSV または JSONL)"
+    ),
+    allow_duplicates: bool = typer.Option(
+        False,
+        "--allow-duplicates",
+        help="同じ内容（日付・勘定科目・金額・摘要）の仕訳が既にある行も取り込む",
+    ),
+):
+    """仕訳を一括で取り込む（同じ内容の仕訳が既にある行は取り込まない）"""
+    from bookkeeper.common.di import init_import_transactions_usecase
+    from bookkeeper.infrastructure.config.settings import settings
+    from bookkeeper.presentation.cli.readers import iter_import_rows
+
+    if settings.STRICT_ACCOUNTS:
+        _load_chart_of_accounts()
+    use_case = init_import_transactions_usecase()
+    result = use_case.execute(iter_import_rows(file), allow_duplicates=allow_duplicates)
+
+    for error in result.errors:
+        print(f"エラー: {file.name}:{error.line}: {error.message}")
+
+    print(f"✓ {result.imported} 件の仕訳を取り込みました")
+    if result.errors:
+        print(f"✗ {len(result.errors)} 件の行を取り込めませんでした")
+        raise typer.Exit(code=1)
+
+
+# 期間指定オプション
+_START_OPTION = typer.Option(
+    None, "--from", formats=["%Y-%m-%d"], help="開始日 (YYYY-MM-DD)"
+)
+_END_OPTION = typer.Option(
+    None, "--to", formats=["%Y-%m-%d"], help="終了日 (YYYY-MM-DD)"
+)
+_FISCAL_YEAR_OPTION = typer.Option(
+    None,
+    "--fiscal-year",
+    help="会計年度（1月1日〜12月31日）。--from / --to とは併用不可",
+)
+
+# 出力形式オプション（text 以外は表に整形せずに書き出す）
+_OUTPUT_FORMATS = ("text", "csv", "jsonl", "parquet")
+_FORMAT_OPTION = typer.Option(
+    "text", "--format", help="出力形式 (text / csv / jsonl / parquet)"
+)
+
+
 @app.command()
-def journal():
+def journal(
+    start: datetime | None = _START_OPTION,
+    end: datetime | None = _END_OPTION,
+    fiscal_year: int | None = _FISCAL_YEAR_OPTION,
+    offset: int = typer.Option(0, "--offset", min=0, help="先頭から飛ばす件数"),
+    limit: int | None = typer.Option(None, "--limit", min=0, help="表示する最大件数"),
+    output_format: str = _FORMAT_OPTION,
+):
     """仕訳帳を表示"""
+    from bookkeeper.common.di import init_list_journal_usecase
+
+    _check_format(output_format)
+    start_date, end_date = _resolve_period(start, end, fiscal_year)
+    # API サーバーは表の表示だけを受け付ける（機械向け出力はこのプロセスで書き出す）
+    client = _connect_server() if output_format == "text" else None
+    if client is not None:
+        from bookkeeper.application.read_model.transaction_frames import (
+            records_to_frames,
+        )
+        from bookkeeper.presentation.cli.frame_formatters import (
+            iter_journal_frame_lines,
+        )
+
+        # サーバーの結果も同じ列単位の整形で表示する
+        with _exit_on_server_error():
+            transactions = client.journal(start_date, end_date, offset, limit)
+            _write_lines(iter_journal_frame_lines(records_to_frames(transactions)))
+        return
+
+    # 列単位で整形・書き出しするので、DataFrame のバッチで読む
     use_case = init_list_journal_usecase()
-    transactions = use_case.execute()
-    print(format_journal(transactions))
+    frames = use_case.execute_frames(start_date, end_date, offset, limit)
+    if output_format == "text":
+        from bookkeeper.presentation.cli.frame_formatters import (
+            iter_journal_frame_lines,
+        )
+
+        _write_lines(iter_journal_frame_lines(frames))
+        return
+
+    from bookkeeper.domain.entity.transaction_record import TransactionRecord
+
+    _write_frames(frames, output_format, TransactionRecord._fields)
 
 
 @app.command()
-def ledger(account_name: str = typer.Argument(..., help="勘定科目名")):
+def ledger(
+    account_name: str = typer.Argument(..., help="勘定科目名"),
+    start: datetime | None = _START_OPTION,
+    end: datetime | None = _END_OPTION,
+    fiscal_year: int | None = _FISCAL_YEAR_OPTION,
+    output_format: str = _FORMAT_OPTION,
+):
     """元帳を表示"""
+    from bookkeeper.common.di import init_view_ledger_usecase
+
+    _check_format(output_format)
+    start_date, end_date = _resolve_period(start, end, fiscal_year)
+    client = _connect_server() if output_format == "text" else None
+    if client is not None:
+        from bookkeeper.application.read_model.transaction_frames import (
+            ledger_to_frame,
+        )
+
+        with _exit_on_server_error():
+            entries = client.ledger(account_name, start_date, end_date)
+        frame = ledger_to_frame(entries)
+    else:
+        use_case = init_view_ledger_usecase()
+        frame = use_case.execute_frame(account_name, start_date, end_date)
+    if output_format == "text":
+        from bookkeeper.presentation.cli.frame_formatters import format_ledger_frame
+
+        _write_lines([format_ledger_frame(account_name, frame)])
+        return
+
+    _write_frames([frame], output_format, frame.columns)
+
+
+@app.command()
+def ledgers(
+    account_names: list[str] | None = typer.Argument(
+        None, help="勘定科目名（--all の場合は省略）"
+    ),
+    all_accounts: bool = typer.Option(
+        False, "--all", help="全ての勘定科目の元帳を出力"
+    ),
+    output_dir: Path = typer.Option(
+        Path("ledgers"),
+        "--output-dir",
+        "-o",
+        file_okay=False,
+        help="出力先のディレクトリ",
+    ),
+    start: datetime | None = _START_OPTION,
+    end: datetime | None = _END_OPTION,
+    fiscal_year: int | None = _FISCAL_YEAR_OPTION,
+    output_format: str = _FORMAT_OPTION,
+):
+    """複数の勘定科目の元帳を、勘定科目ごとのファイルにまとめて出力"""
+    from bookkeeper.common.di import init_view_ledger_usecase
+
+    _check_format(output_format)
+    if all_accounts == bool(account_names):
+        print("エラー: 勘定科目名か --all のどちらか一方を指定してください")
+        raise typer.Exit(code=1)
+    start_date, end_date = _resolve_period(start, end, fiscal_year)
+    if all_accounts:
+        account_names = _load_chart_of_accounts().names
+    suffix = "txt" if output_format == "text" else output_format
+    paths = _ledger_paths(output_dir, account_names, suffix)
+
     use_case = init_view_ledger_usecase()
-    entries = use_case.execute(account_name)
-    print(format_ledger(account_name, entries))
+    frames = use_case.execute_all(account_names, start_date, end_date)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    _write_ledger_files(paths, frames, output_format)
+    print(f"✓ {len(frames)} 件の元帳を {output_dir} に書き出しました")
+
+
+def _ledger_paths(
+    output_dir: Path, account_names: Sequence[str], suffix: str
+) -> dict[str, Path]:
+    """
+    勘定科目ごとの元帳の出力先
+
+    科目名にパスの区切りや先頭の "." があっても output_dir の外や隠しファイルに
+    書き出さないよう、ファイル名に使えない文字は %XX に置き換える。大文字・小文字を
+    区別しないファイルシステムで同じファイルになる科目名があれば終了する
+    """
+    paths: dict[str, Path] = {}
+    seen: dict[str, str] = {}
+    for account_name in account_names:
+        file_name = f"{_escape_file_name(account_name)}.{suffix}"
+        other = seen.setdefault(file_name.casefold(), account_name)
+        if other != account_name:
+            print(
+                f"エラー: 勘定科目 {other} と {account_name} の元帳のファイル名が"
+                f"重なります: {file_name}"
+            )
+            raise typer.Exit(code=1)
+        paths[account_name] = output_dir / file_name
+    return paths
+
+
+def _escape_file_name(name: str) -> str:
+    """科目名をファイル名に使える文字列にする（% 自身も置き換えるので元に戻せる）"""
+    escaped = "".join(
+        f"%{ord(c):02X}" if c in '%/\\:*?"<>|' or ord(c) < 0x20 else c for c in name
+    )
+    # "." や ".." を含め、先頭の "." は隠しファイル・親ディレクトリにならないようにする
+    if escaped.startswith("."):
+        escaped = "%2E" + escaped[1:]
+    return escaped
+
+
+def _write_ledger_files(
+    paths: dict[str, Path], frames: dict[str, "pl.DataFrame"], output_format: str
+) -> None:
+    """勘定科目ごとの元帳をそれぞれのファイルに書き出す"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from bookkeeper.common.profiling import is_enabled
+
+    def write(item: tuple[str, "pl.DataFrame"]) -> None:
+        account_name, frame = item
+        _write_ledger_file(paths[account_name], account_name, frame, output_format)
+
+    # 整形・書き出しの間 Polars は GIL を解放するので、スレッドで並行に書き出す。
+    # 計測の記録先は1つのスレッドから使うため、計測中は1つずつ書き出す
+    with ThreadPoolExecutor(max_workers=1 if is_enabled() else os.cpu_count()) as pool:
+        list(pool.map(write, frames.items()))
+
+
+def _write_ledger_file(
+    path: Path, account_name: str, frame: "pl.DataFrame", output_format: str
+) -> None:
+    """1つの勘定科目の元帳をファイルに書き出す"""
+    if output_format == "text":
+        from bookkeeper.presentation.cli.frame_formatters import format_ledger_frame
+
+        path.write_text(
+            format_ledger_frame(account_name, frame) + "\n", encoding="utf-8"
+        )
+        return
+
+    from bookkeeper.presentation.cli.writers import write_frames
+
+    with path.open("wb") as f:
+        write_frames([frame], output_format, f, frame.columns)
+
+
+@app.command()
+def dedupe(
+    start: datetime | None = _START_OPTION,
+    end: datetime | None = _END_OPTION,
+    fiscal_year: int | None = _FISCAL_YEAR_OPTION,
+    output_format: str = _FORMAT_OPTION,
+):
+    """同じ内容（日付・勘定科目・金額・摘要）の仕訳の組を一覧表示（削除はしない）"""
+    from bookkeeper.common.di import init_find_duplicates_usecase
+
+    _check_format(output_format)
+    start_date, end_date = _resolve_period(start, end, fiscal_year)
+
+    frame = init_find_duplicates_usecase().execute(start_date, end_date)
+    if output_format == "text":
+        from bookkeeper.presentation.cli.frame_formatters import (
+            format_duplicate_frame,
+        )
+
+        _write_lines([format_duplicate_frame(frame)])
+        return
+
+    _write_frames([frame], output_format, frame.columns)
+
+
+@app.command("trial-balance")
+def trial_balance(
+    start: datetime | None = _START_OPTION,
+    end: datetime | None = _END_OPTION,
+):
+    """試算表を表示"""
+    from bookkeeper.common.di import init_view_trial_balance_usecase
+    from bookkeeper.presentation.cli.formatters import format_trial_balance
+
+    client = _connect_server()
+    if client is not None:
+        with _exit_on_server_error():
+            rows = client.trial_balance(_to_date(start), _to_date(end))
+    else:
+        _load_chart_of_accounts()
+        use_case = init_view_trial_balance_usecase()
+        rows = use_case.execute(_to_date(start), _to_date(end))
+    print(format_trial_balance(rows, _period_label(start, end)))
+
+
+@app.command("pl")
+def income_statement(
+    start: datetime | None = _START_OPTION,
+    end: datetime | None = _END_OPTION,
+):
+    """損益計算書を表示"""
+    from bookkeeper.common.di import init_view_income_statement_usecase
+    from bookkeeper.presentation.cli.formatters import format_income_statement
+
+    client = _connect_server()
+    if client is not None:
+        with _exit_on_server_error():
+            statement = client.income_statement(_to_date(start), _to_date(end))
+    else:
+        _load_chart_of_accounts()
+        use_case = init_view_income_statement_usecase()
+        statement = use_case.execute(_to_date(start), _to_date(end))
+    print(format_income_statement(statement, _period_label(start, end)))
+
+
+@app.command("bs")
+def balance_sheet(end: datetime | None = _END_OPTION):
+    """貸借対照表を表示（--to の時点）"""
+    from bookkeeper.common.di import init_view_balance_sheet_usecase
+    from bookkeeper.presentation.cli.formatters import format_balance_sheet
+
+    client = _connect_server()
+    if client is not None:
+        with _exit_on_server_error():
+            sheet = client.balance_sheet(_to_date(end))
+    else:
+        _load_chart_of_accounts()
+        use_case = init_view_balance_sheet_usecase()
+        sheet = use_case.execute(_to_date(end))
+    print(format_balance_sheet(sheet, f" {end:%Y-%m-%d} 時点" if end else ""))
+
+
+def _connect_server() -> "BookkeeperClient | None":
+    """API サーバーが動いていれば、そのクライアントを返す（いなければ None）"""
+    from bookkeeper.infrastructure.config.settings import settings
+
+    from bookkeeper.common.profiling import is_enabled
+
+    # 計測中はこのプロセスで処理する（サーバーでの処理時間は測れないため）
+    if is_enabled():
+        return None
+    # サーバーがいない場合にクライアント（pydantic）を読み込まない
+    if not settings.USE_SERVER or not settings.SERVER_SOCKET.exists():
+        return None
+    from bookkeeper.presentation.api.client import BookkeeperClient
+
+    return BookkeeperClient.connect_if_running(settings.SERVER_SOCKET)
+
+
+def _load_chart_of_accounts() -> "ChartOfAccounts":
+    """勘定科目表を読み込む（設定ファイルの誤りは表示して終了する）"""
+    from bookkeeper.common.di import get_chart_of_accounts
+
+    try:
+        return get_chart_of_accounts()
+    except ValueError as e:
+        print(f"エラー: {e}")
+        raise typer.Exit(code=1)
+
+
+@contextmanager
+def _exit_on_server_error() -> Iterator[None]:
+    """API サーバーのエラーを表示して終了する"""
+    from http.client import HTTPException
+
+    from bookkeeper.presentation.api.client import ServerError
+
+    try:
+        yield
+    except (ServerError, HTTPException) as e:
+        print(f"エラー: {e}")
+        raise typer.Exit(code=1)
+
+
+def _check_format(output_format: str) -> None:
+    """出力形式オプションを検証する"""
+    if output_format not in _OUTPUT_FORMATS:
+        print(f"エラー: 未対応の出力形式です: {output_format}")
+        raise typer.Exit(code=1)
+
+
+def _write_lines(lines: Iterable[str]) -> None:
+    """行を生成されるそばから標準出力に書き出す"""
+    with _exit_on_broken_pipe():
+        for line in lines:
+            sys.stdout.write(line)
+            sys.stdout.write("\n")
+        sys.stdout.flush()
+
+
+def _write_frames(
+    frames: Iterable["pl.DataFrame"], output_format: str, columns: Sequence[str]
+) -> None:
+    """DataFrame のバッチを機械向けの形式で標準出力に書き出す"""
+    from bookkeeper.presentation.cli.writers import write_frames
+
+    with _exit_on_broken_pipe():
+        sys.stdout.flush()
+        write_frames(frames, output_format, sys.stdout.buffer, columns)
+
+
+@contextmanager
+def _exit_on_broken_pipe() -> Iterator[None]:
+    """出力先が閉じられたら終了する"""
+    try:
+        yield
+    except BrokenPipeError:
+        # `| head` などで出力先が閉じられたら、残りは読まずに終了する。
+        # 終了時のフラッシュで再びエラーにならないよう出力先を捨てる
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        raise typer.Exit(code=0)
+
+
+def _to_date(value: datetime | None) -> date | None:
+    """オプションの日時を日付に変換"""
+    return value.date() if value else None
+
+
+def _resolve_period(
+    start: datetime | None, end: datetime | None, fiscal_year: int | None
+) -> tuple[date | None, date | None]:
+    """期間指定オプションを開始日・終了日に変換（会計年度は暦年）"""
+    if fiscal_year is None:
+        return _to_date(start), _to_date(end)
+    if start is not None or end is not None:
+        print("エラー: --fiscal-year は --from / --to と併用できません")
+        raise typer.Exit(code=1)
+    try:
+        return date(fiscal_year, 1, 1), date(fiscal_year, 12, 31)
+    except ValueError:
+        print(f"エラー: 会計年度が不正です: {fiscal_year}")
+        raise typer.Exit(code=1)
+
+
+def _period_label(start: datetime | None, end: datetime | None) -> str:
+    """期間の表示"""
+    if start is None and end is None:
+        return ""
+    start_str = f"{start:%Y-%m-%d}" if start else ""
+    end_str = f"{end:%Y-%m-%d}" if end else ""
+    return f" {start_str} 〜 {end_str}"
+
+
+@app.command()
+def migrate():
+    """仕訳データを現在の保存形式に移行"""
+    from bookkeeper.common.di import init_migrate_storage_usecase
+
+    use_case = init_migrate_storage_usecase()
+    try:
+        use_case.execute()
+    except ValueError as e:
+        print(f"エラー: {e}")
+        raise typer.Exit(code=1)
+    print("✓ 仕訳データを移行しました")
+
+
+@app.command()
+def reindex(
+    check: bool = typer.Option(
+        False, "--check", help="作り直さず、全件の再計算と照合だけを行う"
+    ),
+):
+    """集計用の索引を作り直す"""
+    from bookkeeper.common.di import init_reindex_usecase
+
+    use_case = init_reindex_usecase()
+    problems = use_case.execute(check_only=check)
+    if not check:
+        print("✓ 索引を作り直しました")
+        return
+
+    for problem in problems:
+        print(f"不一致: {problem}")
+    if problems:
+        print(f"✗ 索引に {len(problems)} 件の不一致があります")
+        raise typer.Exit(code=1)
+    print("✓ 索引は全件の再計算と一致しています")
+
+
+@app.command()
+def convert(
+    source: str = typer.Argument(
+        ..., help="変換元の保存形式 (csv / ipc / sqlite / partitioned)"
+    ),
+    target: str = typer.Argument(
+        ..., help="変換先の保存形式 (csv / ipc / sqlite / partitioned)"
+    ),
+):
+    """仕訳データを別の保存形式に変換"""
+    from bookkeeper.common.di import STORAGE_BACKENDS, init_convert_storage_usecase
+
+    for backend in (source, target):
+        if backend not in STORAGE_BACKENDS:
+            print(f"エラー: 未対応の保存形式です: {backend}")
+            raise typer.Exit(code=1)
+
+    use_case = init_convert_storage_usecase(source, target)
+    try:
+        count = use_case.execute()
+    except ValueError as e:
+        print(f"エラー: {e}")
+        raise typer.Exit(code=1)
+    print(f"✓ {count} 件の仕訳を {source} から {target} に変換しました")
+
+
+@app.command("close-year")
+def close_year(
+    years: list[int] = typer.Argument(..., help="締める会計年度（複数指定可）"),
+):
+    """会計年度を締め、その年度の仕訳を列指向の形式に凍結（partitioned のみ）"""
+    from bookkeeper.common.di import init_close_fiscal_year_usecase
+
+    use_case = init_close_fiscal_year_usecase()
+    for year in sorted(years):
+        try:
+            count = use_case.execute(year)
+        except ValueError as e:
+            print(f"エラー: {e}")
+            raise typer.Exit(code=1)
+        print(f"✓ {year} 年度（{count} 件）を締めました")
+
+
+@app.command()
+def serve(
+    port: int | None = typer.Option(
+        None, "--port", help="TCP で待ち受けるポート（省略時は UNIX ソケット）"
+    ),
+    host: str = typer.Option("127.0.0.1", "--host", help="TCP で待ち受けるアドレス"),
+):
+    """
+    仕訳を読み込んだまま常駐し、HTTP + JSON で処理を受け付ける
+
+    リポジトリの処理はイベントループの上で同期的に1つずつ行うので、
+    大きな読み込み（全件の仕訳帳など）の間は他のクライアントへの応答も止まる
+    """
+    import asyncio
+    import logging
+
+    from bookkeeper.infrastructure.config.settings import settings
+    from bookkeeper.presentation.api.server import BookkeeperServer
+
+    # 追加・取込で勘定科目を確かめ、レポートで科目の種類を引く
+    _load_chart_of_accounts()
+    # 想定外のエラーは標準エラー出力に記録する
+    logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    server = BookkeeperServer()
+    address = f"http://{host}:{port}" if port is not None else settings.SERVER_SOCKET
+    print(f"✓ {address} で待ち受けています（Ctrl+C で終了）")
+    try:
+        asyncio.run(server.serve(settings.SERVER_SOCKET, host, port))
+    except (OSError, RuntimeError) as e:
+        print(f"エラー: {e}")
+        raise typer.Exit(code=1)
@@ -4,11 +4,18 @@ CLI フォーマッター
 出力を整形する
 """
 
-from typing import List
+from typing import Iterable, Iterator, List
 from decimal import Decimal
 
 from bookkeeper.domain.entity.transaction import Transaction
+from bookkeeper.domain.entity.transaction_record import TransactionRecord
 from bookkeeper.domain.service.ledger_service import LedgerEntry
+from bookkeeper.domain.service.report_service import (
+    BalanceSheet,
+    IncomeStatement,
+    ReportSection,
+    TrialBalanceRow,
+)
 
 
 def format_journal(transactions: List[Transaction]) -> str:
@@ -21,18 +28,31 @@ def format_journal(transactions: List[Transaction]) -> str:
     Returns:
         フォーマットされた文字列
     """
-    if not transactions:
-        return "仕訳がありません。"
+    return "\n".join(iter_journal_lines(transactions))
 
-    lines = []
-    lines.append("=" * 120)
-    lines.append(
-        f"{'日付':<12} {'借方科目':<15} {'借方金額':>12} {'貸方科目':<15} {'貸方金額':>12} {'摘要':<20}"
-    )
-    lines.append("=" * 120)
 
+def iter_journal_lines(
+    transactions: Iterable[Transaction | TransactionRecord],
+) -> Iterator[str]:
+    """
+    仕訳帳を表形式で1行ずつ返す
+
+    仕訳を順に読みながら行を生成するので、全体を文字列に組み立てない
+
+    Args:
+        transactions: 仕訳の列
+
+    Returns:
+        フォーマットされた行（改行なし）のイテレータ
+    """
+    count = 0
     for txn in transactions:
-        lines.append(
+        if count == 0:
+            yield "=" * 120
+            yield f"{'日付':<12} {'借方科目':<15} {'借方金額':>12} {'貸方科目':<15} {'貸方金額':>12} {'摘要':<20}"
+            yield "=" * 120
+        count += 1
+        yield (
             f"{txn.date.isoformat():<12} "
             f"{txn.debit_account:<15} "
             f"{_format_amount(txn.debit_amount):>12} "
@@ -41,10 +61,11 @@ def format_journal(transactions: List[Transaction]) -> str:
             f"{txn.description:<20}"
         )
 
-    lines.append("=" * 120)
-    lines.append(f"合計: {len(transactions)} 件")
-
-    return "\n".join(lines)
+    if count == 0:
+        yield "仕訳がありません。"
+        return
+    yield "=" * 120
+    yield f"合計: {count} 件"
 
 
 def format_ledger(account_name: str, entries: List[LedgerEntry]) -> str:
@@ -73,7 +94,7 @@ def format_ledger(account_name: str, entries: List[LedgerEntry]) -> str:
         credit_str = _format_amount(entry.credit_amount) if entry.credit_amount else ""
 
         lines.append(
-            f"{entry.date:<12} "
+            f"{entry.date.isoformat():<12} "
             f"{entry.description:<30} "
             f"{debit_str:>12} "
             f"{credit_str:>12} "
@@ -86,6 +107,121 @@ def format_ledger(account_name: str, entries: List[LedgerEntry]) -> str:
     return "\n".join(lines)
 
 
+def format_trial_balance(rows: List[TrialBalanceRow], period: str = "") -> str:
+    """
+    試算表を表形式でフォーマット
+
+    Args:
+        rows: 試算表の行のリスト
+        period: 対象期間の表示
+
+    Returns:
+        フォーマットされた文字列
+    """
+    if not rows:
+        return "仕訳がありません。"
+
+    lines = []
+    lines.append("=" * 80)
+    lines.append(f"【試算表】{period}")
+    lines.append("=" * 80)
+    lines.append(
+        f"{'勘定科目':<15} {'種類':<6} {'借方合計':>15} {'貸方合計':>15} {'残高':>15}"
+    )
+    lines.append("=" * 80)
+
+    for row in rows:
+        type_str = row.account_type.value if row.account_type else "不明"
+        lines.append(
+            f"{row.account_name:<15} "
+            f"{type_str:<6} "
+            f"{_format_amount(row.debit_total):>15} "
+            f"{_format_amount(row.credit_total):>15} "
+            f"{_format_amount(row.balance):>15}"
+        )
+
+    debit_total = sum(row.debit_total for row in rows)
+    credit_total = sum(row.credit_total for row in rows)
+    lines.append("=" * 80)
+    lines.append(
+        f"{'合計':<15} {'':<6} "
+        f"{_format_amount(debit_total):>15} {_format_amount(credit_total):>15}"
+    )
+
+    return "\n".join(lines)
+
+
+def format_income_statement(statement: IncomeStatement, period: str = "") -> str:
+    """
+    損益計算書をフォーマット
+
+    Args:
+        statement: 損益計算書
+        period: 対象期間の表示
+
+    Returns:
+        フォーマットされた文字列
+    """
+    lines = []
+    lines.append("=" * 60)
+    lines.append(f"【損益計算書】{period}")
+    lines.append("=" * 60)
+    lines.extend(_format_section(statement.revenue))
+    lines.extend(_format_section(statement.expense))
+    lines.append("=" * 60)
+    lines.append(f"{'当期純利益':<30} {_format_amount(statement.net_income):>20}")
+    lines.extend(_format_unclassified(statement.unclassified))
+
+    return "\n".join(lines)
+
+
+def format_balance_sheet(sheet: BalanceSheet, period: str = "") -> str:
+    """
+    貸借対照表をフォーマット
+
+    Args:
+        sheet: 貸借対照表
+        period: 基準日の表示
+
+    Returns:
+        フォーマットされた文字列
+    """
+    lines = []
+    lines.append("=" * 60)
+    lines.append(f"【貸借対照表】{period}")
+    lines.append("=" * 60)
+    lines.extend(_format_section(sheet.asset))
+    lines.extend(_format_section(sheet.liability))
+    lines.extend(_format_section(sheet.equity))
+    lines.append(f"  {'当期純利益':<28} {_format_amount(sheet.net_income):>20}")
+    lines.append("=" * 60)
+    lines.append(f"{'資産合計':<30} {_format_amount(sheet.asset.total):>20}")
+    lines.append(
+        f"{'負債・資本合計':<30} {_format_amount(sheet.liability_and_equity_total):>20}"
+    )
+    lines.extend(_format_unclassified(sheet.unclassified))
+
+    return "\n".join(lines)
+
+
+def _format_section(section: ReportSection) -> List[str]:
+    """区分（資産・費用など）の科目と合計をフォーマット"""
+    lines = [f"[{section.account_type.value}]"]
+    for account_name, amount in section.items:
+        lines.append(f"  {account_name:<28} {_format_amount(amount):>20}")
+    lines.append(
+        f"{section.account_type.value + '合計':<30} {_format_amount(section.total):>20}"
+    )
+    return lines
+
+
+def _format_unclassified(account_names: List[str]) -> List[str]:
+    """集計から除いた科目の注記"""
+    if not account_names:
+        return []
+    return [f"※ 勘定科目表にない科目は集計していません: {', '.join(account_names)}"]
+
+
 def _format_amount(amount: Decimal | None) -> str:
     """金額をフォーマット（3桁区切り）"""
     if amount is None:
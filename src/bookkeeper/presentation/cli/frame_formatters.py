@@ -0,0 +1,193 @@
+"""
+CLI フォーマッター（列単位）
+
+仕訳帳・元帳の DataFrame を、行ごとの f-string ではなく Polars の文字列演算で
+列ごとにまとめて整形する。出力は formatters の同名の表示と同じ
+"""
+
+from typing import Iterable, Iterator
+
+import polars as pl
+
+
+def iter_journal_frame_lines(frames: Iterable[pl.DataFrame]) -> Iterator[str]:
+    """
+    仕訳帳を表形式で、バッチごとにまとめて返す（iter_journal_lines と同じ表示）
+
+    Args:
+        frames: 仕訳のバッチ（列は TransactionRecord のフィールド順）
+
+    Returns:
+        フォーマットされた行（改行なし）のイテレータ。
+        仕訳の行はバッチごとに改行でつないだ1つの文字列にする
+    """
+    count = 0
+    for frame in frames:
+        if frame.is_empty():
+            continue
+        if count == 0:
+            yield "=" * 120
+            yield f"{'日付':<12} {'借方科目':<15} {'借方金額':>12} {'貸方科目':<15} {'貸方金額':>12} {'摘要':<20}"
+            yield "=" * 120
+        count += frame.height
+        debit, credit = _amount_texts(frame, "debit_amount", "credit_amount")
+        yield _join_lines(
+            frame,
+            [
+                _date_text("date").str.pad_end(12),
+                pl.col("debit_account").str.pad_end(15),
+                debit.str.pad_start(12),
+                pl.col("credit_account").str.pad_end(15),
+                credit.str.pad_start(12),
+                pl.col("description").str.pad_end(20),
+            ],
+        )
+
+    if count == 0:
+        yield "仕訳がありません。"
+        return
+    yield "=" * 120
+    yield f"合計: {count} 件"
+
+
+def format_ledger_frame(account_name: str, ledger: pl.DataFrame) -> str:
+    """
+    元帳を表形式でフォーマット（format_ledger と同じ表示）
+
+    Args:
+        account_name: 勘定科目名
+        ledger: 元帳（列は LedgerEntry のフィールド順）
+
+    Returns:
+        フォーマットされた文字列
+    """
+    if ledger.is_empty():
+        return f"「{account_name}」の取引がありません。"
+
+    lines = []
+    lines.append("=" * 100)
+    lines.append(f"【{account_name} 元帳】")
+    lines.append("=" * 100)
+    lines.append(f"{'日付':<12} {'摘要':<30} {'借方':>12} {'貸方':>12} {'残高':>12}")
+    lines.append("=" * 100)
+    debit, credit, balance = _amount_texts(
+        ledger, "debit_amount", "credit_amount", "balance"
+    )
+    lines.append(
+        _join_lines(
+            ledger,
+            [
+                _date_text("date").str.pad_end(12),
+                pl.col("description").str.pad_end(30),
+                _blank_zero("debit_amount", debit).str.pad_start(12),
+                _blank_zero("credit_amount", credit).str.pad_start(12),
+                balance.str.pad_start(12),
+            ],
+        )
+    )
+    lines.append("=" * 100)
+    closing = ledger.tail(1)
+    lines.append(
+        f"期末残高: {closing.select(_amount_texts(closing, 'balance')).item()}"
+    )
+
+    return "\n".join(lines)
+
+
+def format_duplicate_frame(duplicates: pl.DataFrame) -> str:
+    """
+    同じ内容の仕訳の組を表形式でフォーマット
+
+    Args:
+        duplicates: 組の番号（group）と仕訳の列の DataFrame
+
+    Returns:
+        フォーマットされた文字列
+    """
+    if duplicates.is_empty():
+        return "同じ内容の仕訳はありません。"
+
+    lines = []
+    lines.append("=" * 140)
+    lines.append(
+        f"{'組':>4} {'日付':<12} {'借方科目':<15} {'金額':>12} {'貸方科目':<15} "
+        f"{'摘要':<20} {'ID':<36}"
+    )
+    lines.append("=" * 140)
+    (amount,) = _amount_texts(duplicates, "debit_amount")
+    lines.append(
+        _join_lines(
+            duplicates,
+            [
+                pl.col("group").cast(pl.String).str.pad_start(4),
+                _date_text("date").str.pad_end(12),
+                pl.col("debit_account").str.pad_end(15),
+                amount.str.pad_start(12),
+                pl.col("credit_account").str.pad_end(15),
+                pl.col("description").str.pad_end(20),
+                pl.col("id").fill_null(""),
+            ],
+        )
+    )
+    lines.append("=" * 140)
+    groups = duplicates.get_column("group").n_unique()
+    lines.append(f"重複: {groups} 組（{duplicates.height} 件）")
+
+    return "\n".join(lines)
+
+
+def _join_lines(frame: pl.DataFrame, cells: list[pl.Expr]) -> str:
+    """各行のセルを空白で、行を改行でつないだ文字列"""
+    return frame.select(pl.concat_str(cells, separator=" ").str.join("\n")).item()
+
+
+def _date_text(column: str) -> pl.Expr:
+    """日付を YYYY-MM-DD の文字列にする"""
+    return pl.col(column).dt.to_string("%Y-%m-%d")
+
+
+def _amount_texts(frame: pl.DataFrame, *columns: str) -> list[pl.Expr]:
+    """
+    金額の列を3桁区切りの文字列にする式（null は空欄。_format_amount と同じ表記）
+
+    整数部を3桁ごとの組に分けて 1000 を足した数を文字列にし、先頭の "1" を除いて
+    つなぐ。組の数はフレーム内の最大の金額から決める（正規表現より速い）
+    """
+    scales = [_scale(frame.schema[column]) for column in columns]
+    # 小数部は切り捨てる（Int128 への変換は丸めるため、絶対値を floor してから変換）
+    integers = [
+        (pl.col(column).abs().floor() if scale else pl.col(column))
+        .cast(pl.Int128)
+        .abs()
+        for column, scale in zip(columns, scales)
+    ]
+    largest = frame.select(pl.max_horizontal(value.max() for value in integers)).item()
+    groups = max(1, -(-len(str(largest or 0)) // 3))
+
+    texts = []
+    for column, scale, integer in zip(columns, scales, integers):
+        digits = pl.concat_str(
+            [
+                (integer // 10 ** (3 * k) % 1000 + 1000).cast(pl.String).str.slice(1)
+                for k in reversed(range(groups))
+            ],
+            separator=",",
+        ).str.strip_chars_start("0,")
+        parts = [
+            pl.when(pl.col(column) < 0).then(pl.lit("-")).otherwise(pl.lit("")),
+            pl.when(integer == 0).then(pl.lit("0")).otherwise(digits),
+        ]
+        if scale:
+            parts.append(pl.col(column).cast(pl.String).str.slice(-(scale + 1)))
+        texts.append(pl.concat_str(parts).fill_null(""))
+    return texts
+
+
+def _scale(dtype: pl.DataType) -> int:
+    """金額の列の小数部の桁数"""
+    return dtype.scale if isinstance(dtype, pl.Decimal) else 0
+
+
+def _blank_zero(column: str, text: pl.Expr) -> pl.Expr:
+    """金額が 0 の行を空欄にする"""
+    return pl.when(pl.col(column) != 0).then(text).otherwise(pl.lit(""))
@@ -0,0 +1,63 @@
+"""
+CLI リーダー
+
+取込ファイルを読み込む
+"""
+
+import csv
+import json
+from pathlib import Path
+from typing import Iterator
+
+from bookkeeper.application.usecase.import_transactions import ImportRow
+
+
+def iter_import_rows(path: Path) -> Iterator[ImportRow]:
+    """
+    取込ファイルを1行ずつ読み込む
+
+    拡張子が .jsonl / .ndjson なら JSON Lines、それ以外はヘッダー付きCSVとして扱う
+
+    Args:
+        path: 取込ファイルのパス
+
+    Yields:
+        (行番号, 列名→値)。解析できない行は値が None
+    """
+    if path.suffix.lower() in (".jsonl", ".ndjson"):
+        yield from _iter_jsonl(path)
+    else:
+        yield from _iter_csv(path)
+
+
+def _iter_csv(path: Path) -> Iterator[ImportRow]:
+    # csv.DictReader と同じ結果を、列数がヘッダーと同じ行は zip だけで作る
+    # （DictReader は1行ごとの処理が Python で書かれていて遅い）
+    with path.open("r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        width = len(header)
+        for row in reader:
+            if not row:
+                continue
+            values = dict(zip(header, row))
+            if len(row) > width:
+                values[None] = row[width:]
+            elif len(row) < width:
+                values.update(dict.fromkeys(header[len(row) :]))
+            yield reader.line_num, values
+
+
+def _iter_jsonl(path: Path) -> Iterator[ImportRow]:
+    with path.open("r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                yield line_no, None
+                continue
+            yield line_no, row if isinstance(row, dict) else None
@@ -0,0 +1,128 @@
+"""
+CLI の処理時間の計測
+
+--timings / --timings-json / --profile が指定されたときに計測を始め、
+コマンドの終了時に区間ごとの集計を表示・保存する
+"""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List
+
+from bookkeeper.common import profiling
+from bookkeeper.common.profiling import Span
+
+# 呼び出しを区間として記録するフォーマッターの関数
+_FORMATTERS = (
+    "format_journal",
+    "iter_journal_lines",
+    "format_ledger",
+    "format_trial_balance",
+    "format_income_statement",
+    "format_balance_sheet",
+)
+_FRAME_FORMATTERS = ("iter_journal_frame_lines", "format_ledger_frame")
+
+# 呼び出しを区間として記録するドメインサービスの静的メソッド
+_LEDGER_SERVICE = ("generate_ledger",)
+_REPORT_SERVICE = ("summarize", "trial_balance", "income_statement", "balance_sheet")
+
+
+def start_timings(
+    command: str, show: bool, json_path: Path | None, profile_path: Path | None
+) -> Callable[[], None]:
+    """
+    計測を始める
+
+    ユースケース・リポジトリは DI で、ドメインサービス・フォーマッターはここで
+    計測対象にする
+
+    Args:
+        command: 実行するコマンド名（集計の根の区間名）
+        show: 集計を標準エラー出力に表示するか
+        json_path: 集計を書き出す JSON のパス
+        profile_path: cProfile の結果（pstats 形式）を書き出すパス
+
+    Returns:
+        コマンドの終了時に呼び、計測を終えて結果を出力する関数
+    """
+    from bookkeeper.domain.service.ledger_service import LedgerService
+    from bookkeeper.domain.service.report_service import ReportService
+    from bookkeeper.presentation.cli import formatters, frame_formatters
+
+    profiling.enable(command)
+    profiling.instrument_functions(LedgerService, _LEDGER_SERVICE)
+    profiling.instrument_functions(ReportService, _REPORT_SERVICE)
+    profiling.instrument_functions(formatters, _FORMATTERS)
+    profiling.instrument_functions(frame_formatters, _FRAME_FORMATTERS)
+
+    profiler = None
+    if profile_path is not None:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    def finish() -> None:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+        root = profiling.finish()
+        profiling.disable()
+        if show:
+            print(format_timings(root), file=sys.stderr)
+        if json_path is not None:
+            report = {
+                "command": command,
+                "argv": sys.argv[1:],
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+                "spans": root.to_dict(),
+            }
+            json_path.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+
+    return finish
+
+
+def format_timings(root: Span) -> str:
+    """
+    区間の集計を入れ子の表形式でフォーマット
+
+    Args:
+        root: 根の区間
+
+    Returns:
+        フォーマットされた文字列
+    """
+    lines = []
+    lines.append("=" * 122)
+    lines.append(
+        f"{'区間':<56} {'回数':>8} {'時間(ms)':>10} {'自身(ms)':>10} "
+        f"{'CPU(ms)':>10} {'行数':>10} {'バイト':>12}"
+    )
+    lines.append("=" * 122)
+    lines.extend(_format_span(root, 0))
+    lines.append("=" * 122)
+    return "\n".join(lines)
+
+
+def _format_span(span: Span, depth: int) -> List[str]:
+    """区間とその子孫を1行ずつ（子は字下げして経過時間の長い順）"""
+    lines = [
+        f"{'  ' * depth + span.name:<56} "
+        f"{span.calls:>8,} "
+        f"{span.wall * 1000:>10.1f} "
+        f"{span.self_wall * 1000:>10.1f} "
+        f"{span.cpu * 1000:>10.1f} "
+        f"{_format_count(span.rows):>10} "
+        f"{_format_count(span.bytes_read):>12}"
+    ]
+    for child in sorted(span.children.values(), key=lambda c: c.wall, reverse=True):
+        lines.extend(_format_span(child, depth + 1))
+    return lines
+
+
+def _format_count(count: int) -> str:
+    """件数・バイト数をカンマ区切りで（0 は空欄）"""
+    return f"{count:,}" if count else ""
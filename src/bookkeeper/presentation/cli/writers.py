@@ -0,0 +1,69 @@
+"""
+CLI の機械向け出力
+
+仕訳帳・元帳の DataFrame を、表に整形せずに CSV / JSON Lines / Parquet で
+書き出す（他のツールにパイプで渡す場合）
+"""
+
+import io
+from typing import BinaryIO, Iterable, Sequence
+
+import polars as pl
+
+# 表に整形しない出力形式
+MACHINE_FORMATS = ("csv", "jsonl", "parquet")
+
+
+def write_frames(
+    frames: Iterable[pl.DataFrame],
+    output_format: str,
+    output: BinaryIO,
+    columns: Sequence[str],
+) -> None:
+    """
+    DataFrame のバッチを続けて書き出す
+
+    CSV と JSON Lines はバッチごとに書き出す（ヘッダーは最初の1回だけ）。
+    Parquet はファイル末尾にメタデータを持つので、全てのバッチをまとめてから書き出す。
+    Polars にはメモリ上のバッファに書かせ、出力先へは Python から書き込む
+    （出力先が閉じられたときに BrokenPipeError になるように）
+
+    Args:
+        frames: 書き出す DataFrame のバッチ
+        output_format: 出力形式（MACHINE_FORMATS のいずれか）
+        output: 書き出し先（バイナリ）
+        columns: バッチが1つもない場合に書き出す列名
+    """
+    if output_format == "parquet":
+        batches = list(frames)
+        df = pl.concat(batches) if batches else _empty(columns)
+        buffer = io.BytesIO()
+        df.write_parquet(buffer)
+        output.write(buffer.getbuffer())
+        output.flush()
+        return
+
+    written = False
+    for frame in frames:
+        _write_text(frame, output_format, output, include_header=not written)
+        written = True
+    if not written:
+        _write_text(_empty(columns), output_format, output, include_header=True)
+    output.flush()
+
+
+def _write_text(
+    frame: pl.DataFrame, output_format: str, output: BinaryIO, include_header: bool
+) -> None:
+    """1つのバッチを CSV または JSON Lines で書き出す"""
+    buffer = io.BytesIO()
+    if output_format == "csv":
+        frame.write_csv(buffer, include_header=include_header)
+    else:
+        frame.write_ndjson(buffer)
+    output.write(buffer.getbuffer())
+
+
+def _empty(columns: Sequence[str]) -> pl.DataFrame:
+    """列名だけの空の DataFrame"""
+    return pl.DataFrame(schema={name: pl.String for name in columns})
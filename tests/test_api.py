@@ -0,0 +1,308 @@
+"""
+API サーバー・クライアントと JSON 変換のテスト
+
+サーバーは一時ディレクトリの CSV を使って UNIX ソケットで待ち受け、
+クライアントは別のスレッドから呼ぶ
+"""
+
+import asyncio
+import http.client
+import json
+import socket
+from dataclasses import astuple
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from bookkeeper.application.usecase.add_transaction import DuplicateTransactionError
+from bookkeeper.domain.entity.transaction import Transaction
+from bookkeeper.domain.entity.transaction_record import TransactionRecord
+from bookkeeper.domain.service.ledger_service import LedgerEntry
+from bookkeeper.infrastructure.config.settings import Settings
+from bookkeeper.presentation.api import server as server_module
+from bookkeeper.presentation.api.client import BookkeeperClient, ServerError
+from bookkeeper.presentation.api.codec import (
+    dumps,
+    ledger_from_json,
+    ledger_to_json,
+    record_from_json,
+    transaction_from_json,
+    transaction_to_json,
+)
+from bookkeeper.presentation.api.server import BookkeeperServer, _PendingWrite
+
+
+def _transaction(day: date, debit: str, credit: str, amount: str, text: str):
+    return Transaction(
+        date=day,
+        debit_account=debit,
+        debit_amount=Decimal(amount),
+        credit_account=credit,
+        credit_amount=Decimal(amount),
+        description=text,
+    )
+
+
+TRANSACTIONS = [
+    _transaction(date(2024, 1, 5), "普通預金", "元入金", "500000", "開業資金"),
+    _transaction(date(2024, 1, 10), "通信費", "普通預金", "8019", "インターネット"),
+    _transaction(date(2024, 2, 1), "現金", "普通預金", "10000", "引き出し"),
+    _transaction(date(2024, 3, 15), "消耗品費", "現金", "1200", "コピー用紙"),
+    _transaction(date(2024, 3, 31), "現金", "売上", "30000", "3月分"),
+]
+
+
+def _contents(transactions):
+    return [
+        (t.date, t.debit_account, t.credit_account, t.debit_amount, t.description)
+        for t in transactions
+    ]
+
+
+def test_transaction_json_round_trip():
+    transaction = TRANSACTIONS[1].model_copy(update={"note": "備考"})
+
+    data = json.loads(dumps(transaction_to_json(transaction)))
+
+    assert data["debit_amount"] == "8019"
+    assert transaction_from_json(data) == transaction
+    record = record_from_json(data)
+    assert isinstance(record, TransactionRecord)
+    assert _contents([record]) == _contents([transaction])
+
+
+def test_transaction_from_json_validates_invariants():
+    data = transaction_to_json(TRANSACTIONS[0])
+    data["credit_amount"] = "1"
+
+    with pytest.raises(ValueError, match="一致しません"):
+        transaction_from_json(data)
+
+
+def test_ledger_json_round_trip_keeps_exact_amounts():
+    entries = [
+        LedgerEntry(
+            date(2024, 1, 5), "開業資金", Decimal("0.10"), None, Decimal("0.10")
+        ),
+        LedgerEntry(
+            date(2024, 1, 6), "引き出し", None, Decimal("0.3"), Decimal("-0.20")
+        ),
+    ]
+
+    restored = ledger_from_json(json.loads(dumps(ledger_to_json(entries))))
+
+    assert [astuple(entry) for entry in restored] == [astuple(e) for e in entries]
+    assert str(restored[0].debit_amount) == "0.10"
+
+
+def test_dumps_rejects_unknown_values():
+    with pytest.raises(TypeError, match="JSON に変換できません"):
+        dumps({"value": object()})
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """一時ディレクトリの CSV を使うように設定を差し替える"""
+    monkeypatch.setattr(Settings, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(Settings, "TRANSACTIONS_CSV", tmp_path / "transactions.csv")
+    monkeypatch.setattr(Settings, "STORAGE_BACKEND", "csv")
+    monkeypatch.setattr(Settings, "STRICT_ACCOUNTS", False)
+    return tmp_path
+
+
+def _run_with_server(data_dir, scenario, server=None):
+    """サーバーを起動し、別のスレッドで scenario(client, server) を呼んで結果を返す"""
+    server = server or BookkeeperServer()
+    socket_path = data_dir / "bookkeeper.sock"
+
+    async def main():
+        serving = asyncio.create_task(server.serve(socket_path))
+        while not socket_path.exists():
+            if serving.done():
+                serving.result()
+            await asyncio.sleep(0.01)
+        client = BookkeeperClient(socket_path)
+        try:
+            return await asyncio.to_thread(scenario, client, server)
+        finally:
+            client.close()
+            serving.cancel()
+
+    return asyncio.run(main())
+
+
+def _raw_request(socket_path, method, path, body=b"", headers=None):
+    """クライアントを通さずにリクエストを送り、(ステータス, ヘッダー, 本文) を返す"""
+    conn = http.client.HTTPConnection("localhost")
+    conn.sock = socket.socket(socket.AF_UNIX)
+    conn.sock.connect(str(socket_path))
+    try:
+        conn.request(method, path, body, headers or {})
+        response = conn.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        conn.close()
+
+
+def test_add_and_read_through_server(data_dir):
+    def scenario(client, server):
+        added = client.add_many(TRANSACTIONS)
+        return (
+            added,
+            list(client.journal()),
+            list(client.journal(date(2024, 2, 1), offset=1, limit=1)),
+            client.ledger("現金", date(2024, 3, 1)),
+            client.trial_balance(),
+            client.income_statement(),
+            client.balance_sheet(date(2024, 3, 31)),
+            server,
+        )
+
+    added, journal, page, ledger, rows, statement, sheet, server = _run_with_server(
+        data_dir, scenario
+    )
+
+    assert added == len(TRANSACTIONS)
+    assert _contents(journal) == _contents(TRANSACTIONS)
+    assert all(record.id for record in journal)
+    assert _contents(page) == _contents(TRANSACTIONS[3:4])
+    assert ledger == server.view_ledger.execute("現金", date(2024, 3, 1))
+    assert rows == server.view_trial_balance.execute()
+    assert statement == server.view_income_statement.execute()
+    assert sheet == server.view_balance_sheet.execute(date(2024, 3, 31))
+
+
+def test_journal_is_sent_in_chunks(data_dir, monkeypatch):
+    monkeypatch.setattr(server_module, "_JOURNAL_CHUNK_ROWS", 2)
+
+    def scenario(client, server):
+        client.add_many(TRANSACTIONS)
+        return _raw_request(data_dir / "bookkeeper.sock", "GET", "/journal")
+
+    status, headers, body = _run_with_server(data_dir, scenario)
+
+    assert status == 200
+    assert headers["Transfer-Encoding"] == "chunked"
+    lines = body.decode().splitlines()
+    assert [json.loads(line)["description"] for line in lines] == [
+        t.description for t in TRANSACTIONS
+    ]
+
+
+def test_add_rejects_duplicates_only_when_not_allowed(data_dir):
+    new = _transaction(date(2024, 4, 1), "現金", "売上", "5000", "4月分")
+
+    def scenario(client, server):
+        client.add_many(TRANSACTIONS[:2])
+        with pytest.raises(ServerError) as rejected:
+            # 重複のある追加は、重複しない仕訳も含めて全体を拒否する
+            client.add_many([new, TRANSACTIONS[0]], allow_duplicates=False)
+        after_rejected = list(client.journal())
+        added = client.add_many([TRANSACTIONS[0]], allow_duplicates=True)
+        return rejected.value, after_rejected, added, list(client.journal())
+
+    rejected, after_rejected, added, journal = _run_with_server(data_dir, scenario)
+
+    assert rejected.status == 409
+    assert "開業資金" in str(rejected)
+    assert _contents(after_rejected) == _contents(TRANSACTIONS[:2])
+    assert added == 1
+    assert _contents(journal) == _contents([*TRANSACTIONS[:2], TRANSACTIONS[0]])
+
+
+def test_mixed_batch_writes_allowed_additions_and_rejects_duplicates(data_dir):
+    async def commit(server):
+        server.add_transaction.execute_many(TRANSACTIONS[:1])
+        rejected = _PendingWrite(TRANSACTIONS[:2], allow_duplicates=False)
+        allowed = _PendingWrite(TRANSACTIONS[:1], allow_duplicates=True)
+        new = _PendingWrite(TRANSACTIONS[2:3], allow_duplicates=False)
+        # 待っている追加を1回にまとめたときと同じ
+        server._commit([rejected, allowed, new])
+        return rejected.done.exception(), allowed.done.result(), new.done.result()
+
+    server = BookkeeperServer()
+    error, allowed, new = asyncio.run(commit(server))
+
+    assert isinstance(error, DuplicateTransactionError)
+    assert (allowed, new) == (1, 1)
+    assert _contents(server.list_journal.execute()) == _contents(
+        [TRANSACTIONS[0], TRANSACTIONS[0], TRANSACTIONS[2]]
+    )
+
+
+@pytest.mark.parametrize(
+    "method, path, body, status, message",
+    [
+        ("GET", "/unknown", b"", 404, "GET /unknown はありません"),
+        ("GET", "/journal?from=2024-13-01", b"", 400, "from の日付が不正です"),
+        ("GET", "/journal?limit=-1", b"", 400, "limit は 0 以上の整数"),
+        ("GET", "/ledger", b"", 400, "account を指定してください"),
+        ("POST", "/transactions", b"{", 400, "JSON として解釈できません"),
+        ("POST", "/transactions", b"{}", 400, "仕訳の配列を指定してください"),
+        (
+            "POST",
+            "/transactions",
+            b'{"transactions": [], "allow_duplicates": "no"}',
+            400,
+            "true か false",
+        ),
+        (
+            "POST",
+            "/transactions",
+            dumps({"transactions": [{"date": "2024-01-01"}]}),
+            400,
+            "debit_account",
+        ),
+    ],
+)
+def test_error_statuses(data_dir, method, path, body, status, message):
+    def scenario(client, server):
+        return _raw_request(data_dir / "bookkeeper.sock", method, path, body)
+
+    actual, headers, response = _run_with_server(data_dir, scenario)
+
+    assert actual == status
+    assert message in json.loads(response)["error"]
+
+
+def test_unexpected_error_is_logged_without_internal_details(data_dir, caplog):
+    server = BookkeeperServer()
+
+    def fail(*args):
+        raise KeyError("内部の情報")
+
+    server.view_trial_balance.execute = fail
+
+    def scenario(client, server):
+        with pytest.raises(ServerError) as failed:
+            client.trial_balance()
+        # エラーの後も同じ接続で処理を続けられる
+        return failed.value, client.health()
+
+    error, health = _run_with_server(data_dir, scenario, server)
+
+    assert error.status == 500
+    assert "内部の情報" not in str(error)
+    assert health == {"status": "ok"}
+    assert "GET /trial-balance" in caplog.text
+    assert "内部の情報" in caplog.text
+
+
+def test_storage_error_is_returned_as_server_error(data_dir):
+    server = BookkeeperServer()
+
+    def fail(transactions):
+        raise OSError("ディスクがいっぱいです")
+
+    server.add_transaction.repository.add_many = fail
+
+    def scenario(client, server):
+        with pytest.raises(ServerError) as failed:
+            client.add_many(TRANSACTIONS[:1])
+        return failed.value
+
+    error = _run_with_server(data_dir, scenario, server)
+
+    assert error.status == 500
+    assert "ディスクがいっぱいです" in str(error)
@@ -0,0 +1,88 @@
+"""
+勘定科目表（ChartOfAccounts）と勘定科目の設定ファイルのテスト
+"""
+
+import pytest
+
+from bookkeeper.domain.vo.account import AccountType
+from bookkeeper.domain.vo.chart_of_accounts import ChartOfAccounts
+from bookkeeper.infrastructure.config.account_config import load_chart_of_accounts
+
+
+@pytest.fixture
+def chart():
+    return ChartOfAccounts.default()
+
+
+def test_complete_returns_names_with_prefix_in_name_order(chart):
+    assert chart.complete("売") == ["売上", "売掛金"]
+    assert chart.complete("現金") == ["現金"]
+    assert chart.complete("存在しない") == []
+
+
+def test_suggest_prefers_prefix_then_similarity(chart):
+    # 前方一致する科目が先
+    assert chart.suggest("売")[:2] == ["売上", "売掛金"]
+    # 1文字違いは bigram の類似度で見つかる
+    assert chart.suggest("普通貯金")[0] == "普通預金"
+    assert chart.suggest("消耗費")[0] == "消耗品費"
+    assert len(chart.suggest("預金", limit=1)) == 1
+
+
+def test_suggest_returns_nothing_for_unrelated_text(chart):
+    assert chart.suggest("xyz") == []
+    assert chart.suggest("  ") == []
+
+
+def test_check_accepts_known_and_rejects_unknown_with_suggestions(chart):
+    chart.check("現金")
+
+    with pytest.raises(ValueError, match=r"普通貯金（候補: 普通預金"):
+        chart.check("普通貯金")
+    with pytest.raises(ValueError, match=r"^勘定科目表にない科目です: xyz$"):
+        chart.check("xyz")
+
+
+def test_extended_adds_accounts_and_keeps_existing_order(chart):
+    extended = chart.extended({"雑収入": AccountType.REVENUE})
+
+    assert extended.names == [*chart.names, "雑収入"]
+    assert extended.account_type("雑収入") == AccountType.REVENUE
+    assert "雑収入" not in chart
+    with pytest.raises(ValueError, match="種類は変更できません"):
+        chart.extended({"現金": AccountType.EXPENSE})
+
+
+def test_load_chart_of_accounts_without_file_is_default(tmp_path):
+    chart = load_chart_of_accounts(tmp_path / "accounts.toml")
+
+    assert chart.names == ChartOfAccounts.default().names
+
+
+def test_load_chart_of_accounts_adds_configured_accounts(tmp_path):
+    path = tmp_path / "accounts.toml"
+    path.write_text('[accounts]\n"雑収入" = "収益"\n"前払金" = "資産"\n', "utf-8")
+
+    chart = load_chart_of_accounts(path)
+
+    assert chart.account_type("雑収入") == AccountType.REVENUE
+    assert chart.account_type("前払金") == AccountType.ASSET
+    chart.check("雑収入")
+
+
+@pytest.mark.parametrize(
+    "content, message",
+    [
+        ("[accounts\n", "読めません"),
+        ('accounts = "雑収入"\n', r"\[accounts\]"),
+        ('[accounts]\n" " = "収益"\n', "勘定科目名が空です"),
+        ('[accounts]\n"雑収入" = "収入"\n', "種類が不正です"),
+        ('[accounts]\n"現金" = "費用"\n', "種類は変更できません"),
+    ],
+)
+def test_load_chart_of_accounts_rejects_invalid_file(tmp_path, content, message):
+    path = tmp_path / "accounts.toml"
+    path.write_text(content, "utf-8")
+
+    with pytest.raises(ValueError, match=message):
+        load_chart_of_accounts(path)
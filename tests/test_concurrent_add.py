@@ -0,0 +1,85 @@
+"""
+複数プロセスからの同時書き込みのテスト
+
+複数のプロセスから同じデータファイルに仕訳を追加し、行の欠落・重複がないことを
+確かめる（より多くのプロセスで試すのは benchmarks/stress_concurrent_add.py）
+"""
+
+import multiprocessing
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from bookkeeper.domain.entity.transaction import Transaction
+from bookkeeper.infrastructure.repository.csv_transaction_repository import (
+    CsvTransactionRepository,
+)
+from bookkeeper.infrastructure.repository.frame_cache import FrameCache
+from bookkeeper.infrastructure.repository.sqlite_transaction_repository import (
+    SqliteTransactionRepository,
+)
+
+WRITERS = 4
+WRITES_PER_WRITER = 10
+ROWS_PER_WRITE = 3
+
+BACKENDS = {
+    "csv": lambda d: CsvTransactionRepository(
+        d / "transactions.csv",
+        frame_cache=FrameCache(64 * 1024 * 1024),
+        use_parse_cache=True,
+        use_row_index=True,
+    ),
+    "sqlite": lambda d: SqliteTransactionRepository(d / "transactions.sqlite3"),
+}
+
+
+def _write(backend: str, data_dir: Path, writer_id: int) -> None:
+    """仕訳を ROWS_PER_WRITE 件ずつ WRITES_PER_WRITER 回追加する（子プロセスで実行）"""
+    repository = BACKENDS[backend](data_dir)
+    for write in range(WRITES_PER_WRITER):
+        repository.add_many(
+            Transaction(
+                date=date(2025, 1, 1 + row),
+                debit_account="消耗品費",
+                debit_amount=Decimal("100"),
+                credit_account="現金",
+                credit_amount=Decimal("100"),
+                description=f"書き込み {writer_id}-{write}-{row}",
+            )
+            for row in range(ROWS_PER_WRITE)
+        )
+        # 読み込みも書き込みと並行させる
+        repository.summarize_by_account()
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("backend", list(BACKENDS))
+def test_concurrent_writers_lose_and_duplicate_no_rows(backend, tmp_path):
+    repository = BACKENDS[backend](tmp_path)
+    # Polars のスレッドプールは fork と相性が悪いため spawn で起動する
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=_write, args=(backend, tmp_path, writer_id))
+        for writer_id in range(WRITERS)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert [process.exitcode for process in processes] == [0] * WRITERS
+    transactions = BACKENDS[backend](tmp_path).find_all()
+    expected = {
+        f"書き込み {writer_id}-{write}-{row}"
+        for writer_id in range(WRITERS)
+        for write in range(WRITES_PER_WRITER)
+        for row in range(ROWS_PER_WRITE)
+    }
+    assert len(transactions) == len(expected)
+    assert {transaction.description for transaction in transactions} == expected
+    assert len({transaction.id for transaction in transactions}) == len(expected)
+    # 書き込み前から開いていたインスタンスも、他プロセスの追加を読む
+    assert len(repository.find_all()) == len(expected)
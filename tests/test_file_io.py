@@ -0,0 +1,33 @@
+"""write_atomic のテスト"""
+
+import os
+import stat
+
+from bookkeeper.infrastructure.repository.file_io import write_atomic
+
+
+def _mode(path) -> int:
+    return stat.S_IMODE(path.stat().st_mode)
+
+
+def test_write_atomic_keeps_mode_of_replaced_file(tmp_path):
+    path = tmp_path / "transactions.csv"
+    path.write_bytes(b"old")
+    path.chmod(0o640)
+
+    write_atomic(path, lambda f: f.write(b"new"))
+
+    assert path.read_bytes() == b"new"
+    assert _mode(path) == 0o640
+
+
+def test_write_atomic_creates_file_with_umask_default(tmp_path):
+    path = tmp_path / "transactions.csv.balances.json"
+    umask = os.umask(0)
+    os.umask(umask)
+
+    write_atomic(path, lambda f: f.write(b"{}"))
+
+    # 一時ファイルの 0600 ではなく、open() で作った場合と同じ権限
+    assert _mode(path) == 0o666 & ~umask
+    assert not list(tmp_path.glob(".*.tmp"))
@@ -0,0 +1,130 @@
+"""
+一括取込（import）のテスト
+
+取込ファイルの読み込み、ImportTransactionsUseCase による検証・保存と、
+リポジトリが Transaction の列をまとめて DataFrame にする書き込みを確かめる
+"""
+
+import csv
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+
+from bookkeeper.application.usecase.import_transactions import (
+    ImportTransactionsUseCase,
+)
+from bookkeeper.infrastructure.repository.csv_transaction_repository import (
+    CsvTransactionRepository,
+)
+from bookkeeper.presentation.cli.readers import iter_import_rows
+
+HEADER = "date,debit_account,debit_amount,credit_account,credit_amount,description"
+
+
+def _dict_reader_rows(path):
+    """csv.DictReader で読んだ結果（iter_import_rows の CSV の期待値）"""
+    with path.open("r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        return [(reader.line_num, row) for row in reader]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        # 先頭の BOM、空行、列の不足・超過
+        "\ufeff" + HEADER + "\n2024-01-01,現金,100,売上,100,a\n\n"
+        "2024-01-02,現金,200\n2024-01-03,現金,300,売上,300,c,余り,もう1つ\n",
+        # 引用符の中の改行・カンマ（行番号は行の終わりの物理行）
+        HEADER + '\n2024-01-01,現金,100,売上,100,"改行を\n含む, 摘要"\n'
+        "2024-01-02,現金,200,売上,200,b\r\n",
+        # ヘッダーだけ・空のファイル
+        HEADER + "\n",
+        "",
+    ],
+)
+def test_csv_rows_match_dict_reader(tmp_path, content):
+    path = tmp_path / "import.csv"
+    path.write_text(content, "utf-8", newline="")
+
+    assert list(iter_import_rows(path)) == _dict_reader_rows(path)
+
+
+def test_jsonl_rows_report_unparsable_lines(tmp_path):
+    path = tmp_path / "import.jsonl"
+    path.write_text('{"description": "a"}\n\n{壊れた行\n[1, 2]\n', "utf-8")
+
+    assert list(iter_import_rows(path)) == [
+        (1, {"description": "a"}),
+        (3, None),
+        (4, None),
+    ]
+
+
+def _row(amount: str, description: str) -> dict:
+    return {
+        "date": "2024-04-01",
+        "debit_account": "現金",
+        "debit_amount": amount,
+        "credit_account": "売上",
+        "credit_amount": "",
+        "description": description,
+        "note": "",
+    }
+
+
+def test_import_stores_exact_amounts_and_new_ids(tmp_path):
+    repository = CsvTransactionRepository(tmp_path / "t.csv", amount_scale=2)
+    rows = [
+        (2, _row("1000.5", "端数")),
+        (3, _row("0.01", "最小単位")),
+        (4, {**_row("3", "備考つき"), "note": "メモ"}),
+        (5, _row("-1", "負の金額")),
+    ]
+
+    result = ImportTransactionsUseCase(repository).execute(rows)
+
+    assert result.imported == 3
+    assert [error.line for error in result.errors] == [5]
+    stored = CsvTransactionRepository(tmp_path / "t.csv", amount_scale=2).find_all()
+    assert [(t.debit_amount, t.credit_amount, t.note) for t in stored] == [
+        (Decimal("1000.5"), Decimal("1000.5"), ""),
+        (Decimal("0.01"), Decimal("0.01"), ""),
+        (Decimal("3"), Decimal("3"), "メモ"),
+    ]
+    ids = [t.id for t in stored]
+    assert len(set(ids)) == len(ids)
+    assert all(isinstance(txn_id, UUID) and txn_id.version == 4 for txn_id in ids)
+
+
+def test_import_isolates_unstorable_rows_without_saving_one_by_one(tmp_path):
+    repository = CsvTransactionRepository(tmp_path / "t.csv")
+    writes = []
+    add, add_many = repository.add, repository.add_many
+
+    def counting_add(transaction):
+        writes.append(1)
+        return add(transaction)
+
+    def counting_add_many(transactions):
+        writes.append(1)
+        return add_many(transactions)
+
+    repository.add, repository.add_many = counting_add, counting_add_many
+    rows = [
+        (line, _row("1.5" if line in (10, 50) else str(line), f"行 {line}"))
+        for line in range(2, 66)
+    ]
+
+    result = ImportTransactionsUseCase(repository).execute(rows)
+
+    assert result.imported == 62
+    assert [(error.line, error.message) for error in result.errors] == [
+        (10, "金額 1.5 は小数点以下 0 桁で表現できません"),
+        (50, "金額 1.5 は小数点以下 0 桁で表現できません"),
+    ]
+    assert [t.description for t in repository.find_all()] == [
+        f"行 {line}" for line in range(2, 66) if line not in (10, 50)
+    ]
+    # 1件ずつ保存し直すと 65 回書き込む
+    assert len(writes) < 30
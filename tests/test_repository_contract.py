@@ -0,0 +1,463 @@
+"""
+TransactionRepository の契約テスト
+
+同じ操作を全ての保存形式の実装に対して行い、結果が一致することを確かめる。
+期待値は追加した仕訳からドメインサービスで求めたもの
+（年度別ファイルは年度順に返すので、仕訳は日付順に追加する）
+"""
+
+import threading
+from dataclasses import astuple
+from datetime import date
+from decimal import Decimal
+
+import polars as pl
+import pytest
+
+from bookkeeper.domain.entity.transaction import Transaction
+from bookkeeper.domain.entity.transaction_record import TransactionRecord
+from bookkeeper.domain.service.ledger_service import LedgerService
+from bookkeeper.domain.service.report_service import ReportService
+from bookkeeper.application.read_model.transaction_frames import (
+    RecordFrameReader,
+    as_frame_reader,
+)
+from bookkeeper.application.usecase.view_ledger import ViewLedgerUseCase
+from bookkeeper.infrastructure.repository.balance_index import BalanceIndex
+from bookkeeper.infrastructure.repository.csv_transaction_repository import (
+    CsvTransactionRepository,
+)
+from bookkeeper.infrastructure.repository.fingerprint_index import FingerprintIndex
+from bookkeeper.infrastructure.repository.frame_cache import FrameCache
+from bookkeeper.infrastructure.repository.ipc_transaction_repository import (
+    IpcTransactionRepository,
+)
+from bookkeeper.infrastructure.repository.partitioned_transaction_repository import (
+    PartitionedTransactionRepository,
+)
+from bookkeeper.infrastructure.repository.sqlite_transaction_repository import (
+    SqliteTransactionRepository,
+)
+
+BACKENDS = {
+    "csv": lambda d: CsvTransactionRepository(d / "transactions.csv"),
+    # 解析結果キャッシュ・行位置索引・プロセス内キャッシュを全て使う CSV
+    "csv-cached": lambda d: CsvTransactionRepository(
+        d / "transactions.csv",
+        frame_cache=FrameCache(64 * 1024 * 1024),
+        use_parse_cache=True,
+        use_row_index=True,
+    ),
+    "ipc": lambda d: IpcTransactionRepository(d / "transactions.arrow"),
+    "sqlite": lambda d: SqliteTransactionRepository(d / "transactions.sqlite3"),
+    "partitioned": lambda d: PartitionedTransactionRepository(
+        d / "transactions", use_parse_cache=True, use_row_index=True
+    ),
+}
+
+
+def _transaction(day: date, debit: str, credit: str, amount: int, text: str):
+    return Transaction(
+        date=day,
+        debit_account=debit,
+        debit_amount=Decimal(amount),
+        credit_account=credit,
+        credit_amount=Decimal(amount),
+        description=text,
+    )
+
+
+TRANSACTIONS = [
+    _transaction(date(2023, 1, 5), "普通預金", "元入金", 500_000, "開業資金"),
+    _transaction(date(2023, 6, 30), "消耗品費", "現金", 1_200, "コピー用紙"),
+    _transaction(date(2023, 12, 31), "現金", "売上", 30_000, "12月分"),
+    _transaction(date(2024, 1, 10), "通信費", "普通預金", 8_019, "インターネット"),
+    _transaction(date(2024, 1, 10), "通信費", "普通預金", 8_019, "インターネット"),
+    _transaction(date(2024, 2, 1), "現金", "普通預金", 10_000, "引き出し"),
+    _transaction(date(2024, 3, 15), "消耗品費", "現金", 1_200, "コピー用紙"),
+]
+
+
+@pytest.fixture(params=list(BACKENDS))
+def backend(request):
+    return request.param
+
+
+@pytest.fixture
+def repository(backend, tmp_path):
+    return BACKENDS[backend](tmp_path)
+
+
+@pytest.fixture
+def filled(repository):
+    repository.add(TRANSACTIONS[0])
+    assert repository.add_many(TRANSACTIONS[1:]) == len(TRANSACTIONS) - 1
+    return repository
+
+
+def _contents(transactions):
+    return [transaction.content_key for transaction in transactions]
+
+
+def test_empty_repository(repository):
+    assert repository.find_all() == []
+    assert repository.find_by_account("現金") == []
+    assert list(repository.iter_all()) == []
+    assert repository.find_ledger("現金") == []
+    assert repository.summarize_by_account() == []
+
+
+def test_find_all_returns_added_transactions_in_order(filled):
+    stored = filled.find_all()
+
+    assert _contents(stored) == _contents(TRANSACTIONS)
+    # id は追加時に採番される
+    assert all(transaction.id is not None for transaction in stored)
+    assert len({transaction.id for transaction in stored}) == len(TRANSACTIONS)
+
+
+def test_added_transactions_are_visible_to_new_instance(backend, filled, tmp_path):
+    reopened = BACKENDS[backend](tmp_path)
+
+    assert _contents(reopened.find_all()) == _contents(TRANSACTIONS)
+
+
+@pytest.mark.parametrize(
+    "start, end",
+    [
+        (date(2024, 1, 1), None),
+        (None, date(2023, 12, 31)),
+        (date(2023, 6, 30), date(2024, 1, 10)),
+    ],
+)
+def test_find_all_filters_period(filled, start, end):
+    expected = [
+        transaction
+        for transaction in TRANSACTIONS
+        if (start is None or transaction.date >= start)
+        and (end is None or transaction.date <= end)
+    ]
+
+    assert _contents(filled.find_all(start, end)) == _contents(expected)
+
+
+def test_find_by_account(filled):
+    expected = [
+        transaction
+        for transaction in TRANSACTIONS
+        if "現金" in (transaction.debit_account, transaction.credit_account)
+        and transaction.date >= date(2024, 1, 1)
+    ]
+
+    stored = filled.find_by_account("現金", start=date(2024, 1, 1))
+
+    assert _contents(stored) == _contents(expected)
+
+
+def test_iter_all_offset_limit(filled):
+    records = list(filled.iter_all(offset=2, limit=3))
+
+    assert all(isinstance(record, TransactionRecord) for record in records)
+    assert [record.description for record in records] == [
+        transaction.description for transaction in TRANSACTIONS[2:5]
+    ]
+
+
+def test_iter_frames_matches_iter_all(filled):
+    frames = list(as_frame_reader(filled).iter_frames(start=date(2024, 1, 1)))
+    rows = [row for frame in frames for row in frame.iter_rows()]
+
+    assert rows == [tuple(record) for record in filled.iter_all(date(2024, 1, 1))]
+
+
+@pytest.mark.parametrize("start", [None, date(2024, 1, 1), date(2024, 2, 15)])
+def test_find_ledger_carries_opening_balance(filled, start):
+    expected = LedgerService.generate_ledger(TRANSACTIONS, "普通預金", start)
+
+    assert filled.find_ledger("普通預金", start) == expected
+
+
+def test_find_ledger_frame_matches_find_ledger(filled):
+    start = date(2024, 1, 1)
+    entries = filled.find_ledger("現金", start)
+
+    reader = as_frame_reader(filled)
+    frame = reader.find_ledger_frame("現金", start)
+    frames = reader.find_ledger_frames(["現金", "未使用の科目"], start)
+
+    assert frame.rows() == [astuple(entry) for entry in entries]
+    assert frames["現金"].equals(frame)
+    assert frames["未使用の科目"].is_empty()
+
+
+def test_view_ledger_execute_all_matches_each_ledger(filled):
+    use_case = ViewLedgerUseCase(filled, as_frame_reader(filled))
+    accounts = ["現金", "普通預金", "通信費", "未使用の科目"]
+    start, end = date(2023, 6, 30), date(2024, 1, 31)
+
+    ledgers = use_case.execute_all(accounts, start, end)
+
+    assert list(ledgers) == accounts
+    for account in accounts:
+        expected = use_case.execute(account, start, end)
+        assert ledgers[account].rows() == [astuple(entry) for entry in expected]
+
+
+def test_summarize_by_account(filled):
+    start, end = date(2023, 6, 1), date(2024, 1, 31)
+
+    expected = ReportService.summarize(TRANSACTIONS, start, end)
+
+    assert filled.summarize_by_account(start, end) == expected
+
+
+def test_add_many_rejects_amount_below_scale(repository):
+    bad = _transaction(date(2024, 4, 1), "現金", "売上", 1, "端数")
+    bad = bad.model_copy(
+        update={"debit_amount": Decimal("0.5"), "credit_amount": Decimal("0.5")}
+    )
+
+    with pytest.raises(ValueError):
+        repository.add_many([TRANSACTIONS[0], bad])
+    # 1件も保存しない
+    assert repository.find_all() == []
+
+
+def test_find_duplicates(filled):
+    new = _transaction(date(2024, 4, 1), "現金", "売上", 5_000, "4月分")
+
+    duplicated = filled.find_duplicates([new, TRANSACTIONS[1], new])
+
+    assert duplicated == [False, True, True]
+
+
+def test_find_duplicates_leaves_unstorable_amount_to_add(filled):
+    fraction = _transaction(date(2024, 4, 1), "現金", "売上", 1, "端数").model_copy(
+        update={"debit_amount": Decimal("0.5"), "credit_amount": Decimal("0.5")}
+    )
+
+    duplicated = filled.find_duplicates([TRANSACTIONS[1], fraction, TRANSACTIONS[1]])
+
+    assert duplicated == [True, False, True]
+
+
+def test_import_reports_unstorable_amount_per_row(repository):
+    from bookkeeper.application.usecase.import_transactions import (
+        ImportTransactionsUseCase,
+    )
+
+    repository.add(TRANSACTIONS[0])
+    row = {
+        "date": "2024-04-01",
+        "debit_account": "現金",
+        "credit_account": "売上",
+        "description": "4月分",
+    }
+    rows = [
+        (2, {**row, "debit_amount": "5000"}),
+        (3, {**row, "debit_amount": "1000.5", "description": "端数"}),
+        (4, {**row, "debit_amount": "5000"}),
+        (5, {**row, "debit_amount": "6000", "description": "5月分"}),
+    ]
+
+    result = ImportTransactionsUseCase(repository).execute(rows)
+
+    assert result.imported == 2
+    assert sorted((error.line, error.message) for error in result.errors) == [
+        (3, "金額 1000.5 は小数点以下 0 桁で表現できません"),
+        (4, "同じ内容の仕訳が既にあります"),
+    ]
+    stored = [transaction.description for transaction in repository.find_all()]
+    assert stored == ["開業資金", "4月分", "5月分"]
+
+
+def test_find_duplicate_frame(filled):
+    reader = as_frame_reader(filled)
+    frame = reader.find_duplicate_frame()
+
+    assert frame.get_column("group").to_list() == [1, 1]
+    assert frame.get_column("description").to_list() == ["インターネット"] * 2
+    assert reader.find_duplicate_frame(end=date(2023, 12, 31)).is_empty()
+
+
+def test_frame_reader_matches_record_conversion(filled):
+    # DataFrame をそのまま返す実装と、リポジトリの結果を変換するアダプターが同じ行を返す
+    native, converted = as_frame_reader(filled), RecordFrameReader(filled)
+    start = date(2023, 6, 30)
+
+    def journal(reader):
+        frames = reader.iter_frames(start, offset=1)
+        return [row for frame in frames for row in frame.rows()]
+
+    assert journal(native) == journal(converted)
+    assert (
+        native.find_ledger_frames(["現金", "普通預金"], start)["普通預金"].rows()
+        == converted.find_ledger_frame("普通預金", start).rows()
+    )
+    duplicates = native.find_duplicate_frame()
+    assert duplicates.rows() == converted.find_duplicate_frame().rows()
+
+
+def test_indexes_match_full_recomputation(filled):
+    filled.rebuild_indexes()
+    filled.add(_transaction(date(2024, 4, 1), "現金", "売上", 5_000, "4月分"))
+
+    assert filled.verify_indexes() == []
+
+
+def _append_while_reading(backend, repository, tmp_path, read):
+    """
+    repository が全件を読んだ直後に、別のインスタンスから1件追記しながら read を呼ぶ
+
+    追記は読み込み用のロックが解放されるまで待つことがあるので、別のスレッドで行う
+    """
+    writer = BACKENDS[backend](tmp_path)
+    read_df = repository._read_df
+    appended = []
+
+    def append():
+        writer.add(_transaction(date(2024, 4, 1), "現金", "売上", 5_000, "4月分"))
+
+    def read_then_append():
+        df = read_df()
+        thread = threading.Thread(target=append)
+        thread.start()
+        # ロックの中で読んでいれば、追記はここでは終わらない
+        thread.join(timeout=0.5)
+        appended.append(thread)
+        return df
+
+    repository._read_df = read_then_append
+    try:
+        read()
+    finally:
+        del repository._read_df
+        for thread in appended:
+            thread.join()
+
+
+def test_balance_index_rebuild_is_not_stamped_with_later_append(
+    backend, filled, tmp_path
+):
+    if not hasattr(filled, "balance_index"):
+        pytest.skip("月次残高索引を使わない保存形式")
+
+    _append_while_reading(
+        backend,
+        filled,
+        tmp_path,
+        lambda: filled.find_ledger_frame("現金", date(2024, 2, 15)),
+    )
+
+    # 追記した行を含まない索引が最新として記録されず、追記した行も反映されている
+    assert filled.balance_index.load() == BalanceIndex.compute(filled._read_df())
+
+
+def test_fingerprint_index_rebuild_is_not_stamped_with_later_append(
+    backend, filled, tmp_path
+):
+    if not hasattr(filled, "fingerprint_index"):
+        pytest.skip("内容の指紋索引を使わない保存形式")
+
+    _append_while_reading(
+        backend, filled, tmp_path, lambda: filled.find_duplicates(TRANSACTIONS[:1])
+    )
+
+    # 追記した行を含まない索引が最新として記録されず、追記した行も反映されている
+    stored = filled.fingerprint_index.load()
+    assert stored is not None
+    expected = FingerprintIndex.compute(filled._read_df()).sort()
+    assert pl.concat(stored).sort().equals(expected)
+    assert filled.find_duplicates(
+        [_transaction(date(2024, 4, 1), "現金", "売上", 5_000, "4月分")]
+    ) == [True]
+
+
+def test_empty_balance_index_is_not_rebuilt(repository, monkeypatch):
+    if not hasattr(repository, "balance_index"):
+        pytest.skip("月次残高索引を使わない保存形式")
+    assert repository.find_ledger_frame("現金", date(2024, 1, 1)).is_empty()
+
+    def rebuild(df):
+        raise AssertionError("最新の空の索引を作り直した")
+
+    monkeypatch.setattr(repository.balance_index, "rebuild", rebuild)
+    assert repository.find_ledger_frame("現金", date(2024, 1, 1)).is_empty()
+
+
+def test_close_fiscal_year(backend, filled):
+    if backend != "partitioned":
+        with pytest.raises(ValueError):
+            filled.close_fiscal_year(2023)
+        return
+
+    assert filled.close_fiscal_year(2023) == 3
+    assert _contents(filled.find_all()) == _contents(TRANSACTIONS)
+    with pytest.raises(ValueError):
+        filled.add(_transaction(date(2023, 7, 1), "現金", "売上", 1, "締めた年度"))
+    with pytest.raises(ValueError):
+        filled.close_fiscal_year(2023)
+
+
+def test_migrate_keeps_closed_fiscal_year(tmp_path):
+    repository = BACKENDS["partitioned"](tmp_path)
+    repository.add_many(TRANSACTIONS)
+    repository.close_fiscal_year(2023)
+    frozen = tmp_path / "transactions" / "2023.parquet"
+    content = frozen.read_bytes()
+
+    repository.migrate()
+
+    assert frozen.read_bytes() == content
+    assert _contents(repository.find_all()) == _contents(TRANSACTIONS)
+    # 締めた年度の仕訳が変わる・なくなる書き直しは、どの年度にも行わない
+    with pytest.raises(ValueError, match="締めた年度"):
+        repository._write_all(repository._read_df().slice(1))
+    assert frozen.read_bytes() == content
+    assert _contents(repository.find_all()) == _contents(TRANSACTIONS)
+
+
+def test_partitioned_returns_years_in_order_and_rows_in_added_order(tmp_path):
+    repository = BACKENDS["partitioned"](tmp_path)
+    later = _transaction(date(2024, 3, 1), "現金", "売上", 1_000, "3月分")
+    earlier = _transaction(date(2023, 5, 1), "現金", "売上", 2_000, "5月分")
+    same_year = _transaction(date(2024, 1, 1), "現金", "売上", 3_000, "1月分")
+
+    repository.rebuild_indexes()
+    repository.add_many([later, earlier, same_year])
+
+    # 年度順・年度内は追加順（日付順ではない）
+    expected = _contents([earlier, later, same_year])
+    assert _contents(repository.find_all()) == expected
+    assert [r.description for r in repository.iter_all()] == ["5月分", "3月分", "1月分"]
+    assert repository.verify_indexes() == []
+    # 索引は全体で持ち、年度のファイルごとには作らない
+    assert not [
+        path.name
+        for path in (tmp_path / "transactions").glob("*.csv.*")
+        if "balances" in path.name or "fingerprints" in path.name
+    ]
+
+
+def test_partitioned_add_many_keeps_earlier_years_on_write_error(tmp_path, monkeypatch):
+    repository = BACKENDS["partitioned"](tmp_path)
+    repository.add_many(TRANSACTIONS[:1])
+    append = CsvTransactionRepository._append
+
+    def fail_in_2024(self, df):
+        if self.csv_path.stem == "2024":
+            raise OSError("書き込めません")
+        append(self, df)
+
+    monkeypatch.setattr(CsvTransactionRepository, "_append", fail_in_2024)
+    with pytest.raises(OSError):
+        repository.add_many(TRANSACTIONS[1:])
+    monkeypatch.undo()
+
+    # 年度をまたいではアトミックでないので、失敗した年度より前の年度の行は残る
+    assert _contents(repository.find_all()) == _contents(TRANSACTIONS[:3])
+    assert repository.find_duplicates(TRANSACTIONS[1:4]) == [True, True, False]
+    assert repository.find_ledger("現金", date(2024, 1, 1)) == []
+    assert repository.find_ledger("現金", date(2023, 12, 1))[-1].balance == Decimal(
+        30_000 - 1_200
+    )